@@ -0,0 +1,38 @@
+"""Re-run a benchmark against `solus_api` as it was at another git revision.
+
+The package at `ref` is extracted into a temporary directory next to a link
+to this `benchmarks` directory, and the benchmark module runs there in a
+subprocess. "Before" numbers therefore come from the old code itself, e.g.
+`--baseline 04b796f` for the eager models that predate lazy sub-models.
+"""
+import io
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def run_at(ref: str, module: str, argv: list[str]) -> Any:
+    """The JSON line `benchmarks.<module>` prints when run against `ref`"""
+    archive = subprocess.run(
+        ["git", "archive", ref, "solus_api"], cwd=ROOT, check=True, capture_output=True
+    ).stdout
+    with tempfile.TemporaryDirectory() as tmp:
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            tar.extractall(tmp)
+        os.symlink(ROOT / "benchmarks", Path(tmp) / "benchmarks")
+        out = subprocess.run(
+            [sys.executable, "-m", f"benchmarks.{module}", *argv],
+            cwd=tmp,
+            env={**os.environ, "PYTHONPATH": tmp},
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+    return json.loads(out.splitlines()[-1])
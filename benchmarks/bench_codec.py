@@ -0,0 +1,67 @@
+"""Decode + build cost of a `/servers` page per codec.
+
+    python -m benchmarks.bench_codec [--count N]
+
+Each installed codec decodes the page into dicts and builds `Server` models;
+`msgspec-structs` decodes straight into `ServerStruct` when msgspec is present.
+"""
+
+import argparse
+import json
+import time
+from typing import Callable
+
+from solus_api.codec import JSONCodec, get_codec
+from solus_api.models.server import Server
+
+from .payloads import make_server, page
+
+
+def bench(fn: Callable[[], object], count: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best / count * 1e6
+
+
+def decode_and_build(codec: JSONCodec, raw: bytes) -> Callable[[], object]:
+    def run() -> list[Server]:
+        return [Server(d) for d in codec.loads(raw)["data"]]
+
+    return run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    body = json.dumps(page([make_server(i) for i in range(args.count)], 1, 1, 1))
+    raw = body.encode()
+
+    cases: dict[str, Callable[[], object]] = {}
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            continue
+        cases[name] = decode_and_build(codec, raw)
+    try:
+        from solus_api.structs import ServerStruct, page_decoder
+
+        decoder = page_decoder(ServerStruct)
+        cases["msgspec-structs"] = lambda: decoder.decode(raw).data
+    except ImportError:
+        pass
+
+    results = {
+        name: round(bench(fn, args.count, args.repeat), 3) for name, fn in cases.items()
+    }
+    print(json.dumps({"benchmark": "decode_servers", "us_per_server": results}))
+
+
+if __name__ == "__main__":
+    main()
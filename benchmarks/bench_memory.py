@@ -0,0 +1,64 @@
+"""Bytes retained per `Server` for a realistic payload, end to end.
+
+    python -m benchmarks.bench_memory [--count N] [--baseline REF]
+
+Each figure is what stays allocated after decoding a listing body and
+building models from it a page at a time, like a listing, with the decoded
+payload itself dropped. It thus includes whatever part of the payload the
+models still pin:
+
+- `payload`: the decoded JSON alone, for reference;
+- `construct`: `Server` objects as built;
+- `touch`: after reading the fields our status pollers use;
+- `hydrated`: after every nested section has been built.
+
+With `--baseline`, the same figures are measured on the models at that git
+revision (see `benchmarks.baseline`), e.g. `04b796f` for the eager models,
+and `change` gives the difference to them in percent.
+"""
+import argparse
+import json
+from typing import Any, Callable
+
+from .bench_models import construct, full, listing, retained, touch
+from .payloads import make_server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--baseline", help="git revision to compare against")
+    args = parser.parse_args()
+
+    body = json.dumps([make_server(i) for i in range(args.count)]).encode()
+    builds: dict[str, Callable[[list[dict]], Any]] = {
+        "payload": lambda payloads: payloads,
+        "construct": lambda payloads: listing(construct, payloads),
+        "touch": lambda payloads: listing(touch, payloads),
+        "hydrated": lambda payloads: listing(full, payloads),
+    }
+    results: dict[str, Any] = {
+        "benchmark": "server_memory",
+        "count": args.count,
+        "bytes_per_server": {
+            name: round(retained(build, body, args.count))
+            for name, build in builds.items()
+        },
+    }
+    if args.baseline:
+        from .baseline import run_at
+
+        base = run_at(args.baseline, "bench_memory", ["--count", str(args.count)])
+        results["baseline"] = {
+            "ref": args.baseline,
+            "bytes_per_server": base["bytes_per_server"],
+        }
+        results["change"] = {
+            name: f"{(value / base['bytes_per_server'][name] - 1) * 100:+.1f}%"
+            for name, value in results["bytes_per_server"].items()
+        }
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Per-server model construction cost, in time and in memory kept.
+
+    python -m benchmarks.bench_models [--count N] [--baseline REF]
+
+`construct` only builds `Server` objects, `touch` additionally reads the
+fields our status pollers use (`id`, `status`, `ips`, `is_processing`) and
+`full` forces every nested section. Servers are built a page at a time,
+as listings do, so that models of one page can share sections. Next to the
+time per server, each scenario reports the bytes per server still allocated
+once the decoded payload is dropped, which includes what the models keep of
+it, shared sections included.
+
+With `--baseline`, the same scenarios run on the models at that git revision
+(see `benchmarks.baseline`); `04b796f` has the eager models that built every
+section up front. `speedup` and `memory_change` compare against it.
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from solus_api.models.server import Server
+
+from .payloads import make_server
+
+try:
+    from solus_api.models._lazy import shared_sections
+except ImportError:  # revisions before per-page section sharing
+    from contextlib import nullcontext as shared_sections  # type: ignore[assignment]
+
+PER_PAGE = 100
+
+NESTED = (
+    "plan",
+    "settings",
+    "ips",
+    "user",
+    "backup_settings",
+    "compute_resource",
+    "os_image",
+    "application_login_link",
+    "iso_image",
+    "ip_addresses",
+    "location",
+    "project",
+    "usage",
+)
+
+
+def construct(data: dict) -> Server:
+    return Server(data)
+
+
+def touch(data: dict) -> Server:
+    server = Server(data)
+    server.id, server.status, server.ips[0].ip, server.is_processing
+    return server
+
+
+def full(data: dict) -> Server:
+    server = Server(data)
+    for name in NESTED:
+        getattr(server, name)
+    return server
+
+
+def listing(fn: Callable[[dict], Server], payloads: list[dict]) -> list[Server]:
+    """`fn` applied to every payload, one page of `PER_PAGE` at a time"""
+    servers: list[Server] = []
+    for start in range(0, len(payloads), PER_PAGE):
+        with shared_sections():
+            servers.extend(fn(data) for data in payloads[start : start + PER_PAGE])
+    return servers
+
+
+def retained(build: Callable[[list[dict]], Any], body: bytes, count: int) -> float:
+    """Bytes per item still allocated after `build` ran on the decoded `body`"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    keep = build(json.loads(body))
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del keep
+    return (after - before) / count
+
+
+def bench(fn: Callable[[dict], Server], payloads: list[dict], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for page in range(0, len(payloads), PER_PAGE):
+            with shared_sections():
+                for data in payloads[page : page + PER_PAGE]:
+                    fn(data)
+        best = min(best, time.perf_counter() - start)
+    return best / len(payloads) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", help="git revision to compare against")
+    args = parser.parse_args()
+
+    body = json.dumps([make_server(i) for i in range(args.count)]).encode()
+    scenarios = (("construct", construct), ("touch", touch), ("full", full))
+    timings, sizes = {}, {}
+    for name, fn in scenarios:
+        # Fresh payloads per scenario, as a listing would decode them.
+        timings[name] = round(bench(fn, json.loads(body), args.repeat), 3)
+        sizes[name] = round(
+            retained(lambda payloads: listing(fn, payloads), body, args.count)
+        )
+    results: dict[str, Any] = {
+        "benchmark": "server_construction",
+        "count": args.count,
+        "us_per_server": timings,
+        "bytes_per_server": sizes,
+    }
+    if args.baseline:
+        from .baseline import run_at
+
+        base = run_at(
+            args.baseline,
+            "bench_models",
+            ["--count", str(args.count), "--repeat", str(args.repeat)],
+        )
+        results["baseline"] = {
+            "ref": args.baseline,
+            "us_per_server": base["us_per_server"],
+            "bytes_per_server": base["bytes_per_server"],
+        }
+        results["speedup"] = {
+            name: round(base["us_per_server"][name] / timings[name], 1)
+            for name in timings
+        }
+        results["memory_change"] = {
+            name: f"{(sizes[name] / base['bytes_per_server'][name] - 1) * 100:+.1f}%"
+            for name in sizes
+        }
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""Local aiohttp stand-in for the SolusVM `/api/v1` endpoints.
+
+    python -m benchmarks.mock_server --servers 5000 --port 8080
+
+Payloads come from `benchmarks.payloads` and scale with the fleet sizes
+given. List endpoints honour `page`/`per_page` and return the usual
+`links`/`meta` envelope. Encoded pages are cached, so the server spends its
+time on I/O rather than on building JSON. `MockPanel.handle` serves the same
+routes to a `MemoryTransport`, without sockets.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+from typing import Any, Callable, Mapping, Optional
+
+from aiohttp import web
+
+from solus_api.transport import Request, Response
+
+from .payloads import (
+    GeneralDict,
+    make_compute_resource,
+    make_plan,
+    make_server,
+    make_user,
+    page,
+)
+
+DEFAULT_PER_PAGE = 15
+NOT_FOUND = (404, b'{"message":"Not found"}')
+
+
+class MockPanel:
+    """Fleet data plus the aiohttp application serving it"""
+
+    def __init__(
+        self,
+        servers: int = 1000,
+        plans: int = 20,
+        compute_resources: int = 10,
+        users: int = 100,
+        projects: int = 100,
+        latency: float = 0.0,
+    ) -> None:
+        self.sizes = {
+            "servers": servers,
+            "plans": plans,
+            "compute_resources": compute_resources,
+            "users": users,
+            "projects": projects,
+        }
+        self.latency = latency
+        self.requests = 0
+        self._factories: dict[str, Callable[[int], GeneralDict]] = {
+            "servers": make_server,
+            "plans": make_plan,
+            "compute_resources": make_compute_resource,
+            "users": make_user,
+            "projects": lambda i: {
+                "id": i,
+                "name": f"project-{i}",
+                "owner": make_user(i),
+            },
+        }
+        self._pages: dict[tuple[str, int, int], bytes] = {}
+        self._items: dict[tuple[str, int], bytes] = {}
+
+    def app(self) -> web.Application:
+        async def handler(request: web.Request) -> web.Response:
+            status, body = await self.dispatch(
+                request.method,
+                request.match_info["tail"],
+                request.query,
+                await request.read(),
+            )
+            return self._web_response(status, body)
+
+        app = web.Application()
+        app.router.add_route("*", "/api/v1/{tail:.*}", handler)
+        return app
+
+    async def handle(self, request: Request) -> Response:
+        """`MemoryTransport` handler answering the same routes as `app()`"""
+        tail = request.path.split("/api/v1/", 1)[-1]
+        status, body = await self.dispatch(
+            request.method, tail, request.params or {}, request.body
+        )
+        headers = {"Content-Type": "application/json"} if body else {}
+        return Response(status, headers=headers, body=body or b"")
+
+    @staticmethod
+    def _web_response(status: int, body: Optional[bytes]) -> web.Response:
+        if body is None:
+            return web.Response(status=status)
+        return web.Response(body=body, status=status, content_type="application/json")
+
+    async def dispatch(
+        self,
+        method: str,
+        tail: str,
+        query: Mapping[str, Any],
+        body: Optional[bytes],
+    ) -> tuple[int, Optional[bytes]]:
+        """Route one request; returns the status and JSON body (None for no body)"""
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        parts = tail.strip("/").split("/")
+        collection = parts[0]
+        if parts == ["auth"]:
+            return 204, None
+        if collection not in self.sizes:
+            return NOT_FOUND
+        if method == "GET" and len(parts) == 1:
+            page_no = int(query.get("page", 1))
+            per_page = int(query.get("per_page", DEFAULT_PER_PAGE))
+            return 200, self.page_body(collection, page_no, per_page)
+        if method == "POST" and (
+            parts == ["servers"]
+            or (collection == "compute_resources" and parts[2:] == ["servers"])
+        ):
+            return 201, self._create_server()
+
+        item_id = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
+        if not 1 <= item_id <= self.sizes[collection]:
+            return NOT_FOUND
+        if method == "GET" and len(parts) == 2:
+            return 200, self.item_body(collection, item_id)
+        if method == "GET" and parts[2:] == ["usage"]:
+            return 200, self._usage(item_id)
+        if collection == "servers" and (
+            (method == "DELETE" and len(parts) == 2)
+            or (method == "POST" and len(parts) == 3)
+        ):
+            return 200, json.dumps({"data": {"id": item_id}}).encode()
+        return NOT_FOUND
+
+    def page_body(self, collection: str, page_no: int, per_page: int) -> bytes:
+        key = (collection, page_no, per_page)
+        body = self._pages.get(key)
+        if body is None:
+            total = self.sizes[collection]
+            last_page = max(1, math.ceil(total / per_page))
+            start = (page_no - 1) * per_page + 1
+            stop = min(start + per_page, total + 1)
+            factory = self._factories[collection]
+            data = [factory(i) for i in range(start, stop)]
+            body = self._pages[key] = json.dumps(
+                page(data, page_no, last_page, total)
+            ).encode()
+        return body
+
+    def item_body(self, collection: str, item_id: int) -> bytes:
+        key = (collection, item_id)
+        body = self._items.get(key)
+        if body is None:
+            data = self._factories[collection](item_id)
+            body = self._items[key] = json.dumps({"data": data}).encode()
+        return body
+
+    def _usage(self, item_id: int) -> bytes:
+        return json.dumps(
+            {
+                "data": {
+                    "cpu": {"used": item_id % 100, "total": 100},
+                    "ram": {"used": 64 * 1024**3, "total": 256 * 1024**3},
+                    "disk": {"used": 500, "total": 2000},
+                    "vms": {"used": 40, "total": 100},
+                }
+            }
+        ).encode()
+
+    def _create_server(self) -> bytes:
+        self.sizes["servers"] += 1
+        server = make_server(self.sizes["servers"])
+        server.update(is_processing=True, progress=0, status="processing")
+        self._pages.clear()
+        return json.dumps({"data": server}).encode()
+
+
+async def start(
+    panel: MockPanel, host: str = "127.0.0.1", port: int = 0
+) -> tuple[web.AppRunner, str]:
+    """Serve `panel` in the running loop; returns the runner and the base URL"""
+    runner = web.AppRunner(panel.app(), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    server: Optional[asyncio.base_events.Server] = site._server  # type: ignore[assignment]
+    bound_port = server.sockets[0].getsockname()[1] if server else port
+    return runner, f"http://{host}:{bound_port}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--servers", type=int, default=1000)
+    parser.add_argument("--plans", type=int, default=20)
+    parser.add_argument("--compute-resources", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+
+    panel = MockPanel(
+        servers=args.servers,
+        plans=args.plans,
+        compute_resources=args.compute_resources,
+        latency=args.latency,
+    )
+    web.run_app(panel.app(), host=args.host, port=args.port, access_log=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+"""Realistic SolusVM API payloads for benchmarks.
+
+Shapes follow the `/api/v1` responses the models in `solus_api.models` read.
+"""
+from typing import Any
+
+GeneralDict = dict[str, Any]
+
+
+def make_user(user_id: int) -> GeneralDict:
+    return {
+        "id": user_id,
+        "email": f"user{user_id}@example.com",
+        "billing_user_id": user_id,
+        "billing_token": "",
+        "email_verified_at": "2023-01-01T00:00:00.000000Z",
+        "created_at": "2023-01-01T00:00:00.000000Z",
+        "roles[]": [
+            {"id": 2, "name": "Client", "is_default": True, "permissions": []}
+        ],
+        "limit_group": {
+            "id": 1,
+            "name": "Default",
+            "vms": 10,
+            "running_vms": 10,
+            "additional_ips": 2,
+            "additional_ipv6": 2,
+            "iso_images": 1,
+            "iso_images_size": 10,
+            "users_count": 100,
+        },
+        "limit_usage": {
+            "servers": 3,
+            "running_servers": 2,
+            "additional_ips": 0,
+            "iso_images": 0,
+            "iso_images_size": 0,
+        },
+        "status": "active",
+        "has_verified_email": True,
+        "language": {
+            "id": 1,
+            "name": "English",
+            "locale": "en_US",
+            "country": "US",
+            "icon": {"id": 1, "name": "en", "url": "/icons/en.svg", "type": "flags"},
+            "is_default": True,
+            "is_visible": True,
+            "users_count": 100,
+        },
+        "allowed_ips": [],
+        "is_two_factor_auth_enabled": False,
+        "two_factor_auth_recovery_code_count": 0,
+    }
+
+
+def make_ip_block(block_id: int) -> GeneralDict:
+    return {
+        "id": block_id,
+        "name": f"block-{block_id}",
+        "gateway": f"10.{block_id}.0.1",
+        "netmask": "255.255.255.0",
+        "ns_1": "1.1.1.1",
+        "ns_2": "8.8.8.8",
+        "from": f"10.{block_id}.0.10",
+        "to": f"10.{block_id}.0.250",
+        "type": "IPv4",
+        "list_type": "range",
+        "range": 0,
+        "subnet": 24,
+        "reserved_ips_count": 3,
+        "total_ips_count": "240",
+        "reverse_dns": {"zone": "example.com", "enabled": True},
+    }
+
+
+def make_ip(server_id: int, n: int = 0) -> GeneralDict:
+    address = f"10.{server_id % 250}.{(server_id // 250) % 250}.{10 + n}"
+    return {
+        "id": server_id * 10 + n,
+        "ip": address,
+        "is_primary": n == 0,
+        "is_reverse_dns_enabled": True,
+        "reverse_dns": {
+            "id": server_id * 10 + n,
+            "ip_id": server_id * 10 + n,
+            "ip": address,
+            "domain": f"vm{server_id}.example.com",
+            "is_primary": True,
+        },
+        "user": {"id": 1, "email": "admin@example.com"},
+        "server": {"id": server_id, "name": f"vm{server_id}"},
+        "ip_block": make_ip_block(server_id % 250),
+        "comment": "",
+        "issued_for": "server",
+    }
+
+
+def make_plan(plan_id: int, n_os: int = 12, n_locations: int = 3) -> GeneralDict:
+    return {
+        "id": plan_id,
+        "name": f"plan-{plan_id}",
+        "params": {
+            "vcpu": 1 + plan_id % 16,
+            "ram": (1 + plan_id % 32) * 1024**3,
+            "disk": 20 * (1 + plan_id % 10),
+        },
+        "virtualization_type": "kvm",
+        "storage_type": "fb",
+        "image_format": "qcow2",
+        "is_default": plan_id == 1,
+        "is_snapshot_available": True,
+        "is_snapshots_enabled": True,
+        "is_backup_available": True,
+        "backup_settings": {
+            "is_incremental_backup_enabled": False,
+            "incremental_backups_limit": 3,
+        },
+        "is_additional_ips_available": True,
+        "is_visible": True,
+        "is_thin_provisioned": True,
+        "is_custom": False,
+        "position": plan_id,
+        "reset_limit_policy": "never",
+        "network_traffic_limit_type": "separate",
+        "limits": {
+            name: {"unit": "MiB", "limit": 1000, "is_enabled": False}
+            for name in (
+                "disk_bandwidth",
+                "disk_iops",
+                "network_incoming_bandwidth",
+                "network_outgoing_bandwidth",
+                "network_incoming_traffic",
+                "network_outgoing_traffic",
+                "network_total_traffic",
+                "network_reduce_bandwidth",
+                "backups_number",
+            )
+        },
+        "available_os_image_versions": [
+            {"id": i, "name": f"OS {i}", "version": f"{i}.0", "position": i}
+            for i in range(1, n_os + 1)
+        ],
+        "available_locations": [
+            {"id": i, "name": f"Location {i}"} for i in range(1, n_locations + 1)
+        ],
+        "available_applications": [{"id": 1, "name": "WordPress"}],
+        "tokens_per_hour": 1,
+        "tokens_per_month": 500,
+        "ip_tokens_per_month": 0,
+        "ip_tokens_per_hour": 0,
+        "iso_image_tokens_per_hour": 0,
+        "iso_image_tokens_per_month": 0,
+        "backup_price": 0,
+    }
+
+
+def make_compute_resource(resource_id: int) -> GeneralDict:
+    return {
+        "id": resource_id,
+        "name": f"node-{resource_id}",
+        "host": f"node-{resource_id}.example.com",
+        "agent_port": 8443,
+        "version": "2.0.0",
+        "status": "active",
+        "locations": [{"id": 1 + resource_id % 3, "name": "Location"}],
+        "ip_blocks": [make_ip_block(resource_id % 250)],
+        "storages": [
+            {
+                "id": resource_id,
+                "name": "local",
+                "type": {"name": "fb"},
+                "mount": "/var/lib/libvirt/images",
+                "path": "/var/lib/libvirt/images",
+                "is_available_for_balancing": True,
+                "free_space": 1000 - (resource_id * 37) % 900,
+            }
+        ],
+        "capabilities": {"kvm": True, "vz": False, "is_management_node": False},
+        "is_locked": False,
+        "vms_count": (resource_id * 7) % 60,
+        "settings": {
+            "cache_path": "/var/cache",
+            "iso_path": "/var/iso",
+            "backup_tmp_path": "/var/tmp",
+            "vnc_proxy_port": 8000,
+            "limits": {
+                "vm": {"unlimited": False, "limit": 100, "total": 100},
+                "hdd": {"unlimited": False, "limit": 2000, "total": 2000},
+                "ram": {"unlimited": False, "limit": 256 * 1024**3, "total": 0},
+                "vcpu": {"unlimited": False, "limit": 128, "total": 0},
+            },
+            "balance_strategy": "round-robin",
+            "network": {"bridges": [], "type": "routed"},
+            "arch": "x86_64",
+            "virtualization_types": ["kvm"],
+            "concurrent_backups": {"create": 1, "restore": 1},
+        },
+        "metrics": {"network": {"enabled": True}},
+    }
+
+
+def make_server(server_id: int) -> GeneralDict:
+    return {
+        "id": server_id,
+        "name": f"vm{server_id}.example.com",
+        "description": "",
+        "uuid": f"00000000-0000-0000-0000-{server_id:012d}",
+        "os_type": "linux",
+        "specifications": {"vcpu": 2, "ram": 2 * 1024**3, "disk": 40},
+        "plan": make_plan(1 + server_id % 20),
+        "settings": {
+            "disk_cache_mode": "none",
+            "disk_driver": "virtio",
+            "guest_agent_available": True,
+            "guest_tools_installed": True,
+            "mac_address": "52:54:00:00:00:01",
+            "user": "root",
+            "vnc_enabled": True,
+            "vnc_password": "secret",
+            "os_image": {"name": "Ubuntu", "icon": "", "type": "ubuntu"},
+            "application_login_link": [],
+        },
+        "status": "started" if server_id % 5 else "stopped",
+        "real_status": "started" if server_id % 5 else "stopped",
+        "virtualization_type": "kvm",
+        "ips": [make_ip(server_id)],
+        "fqdns": [f"vm{server_id}.example.com"],
+        "boot_mode": "disk",
+        "is_suspended": False,
+        "is_processing": False,
+        "progress": 0,
+        "user": make_user(1 + server_id % 100),
+        "backup_settings": {
+            "enabled": False,
+            "schedule": {"type": "daily", "time": {"hour": 0, "minutes": 0}},
+            "limit": {"limit": 7, "is_enabled": False, "unit": "units"},
+        },
+        "next_scheduled_backup_at": "",
+        "ssh_keys": [],
+        "created_at": "2023-05-04T10:11:12.000000Z",
+        "has_incremental_backups": False,
+        "vnc_url": "",
+        "compute_resource": {
+            "id": 1 + server_id % 10,
+            "name": f"node-{1 + server_id % 10}",
+            "host": f"node-{1 + server_id % 10}.example.com",
+            "capabilities": {"kvm": True, "vz": False},
+        },
+        "os_image": {"name": "Ubuntu", "icon": "", "type": "ubuntu"},
+        "iso_image": {},
+        "ip_addresses": {"ipv4": [make_ip(server_id)], "ipv6": []},
+        "location": {"id": 1 + server_id % 3, "name": "Location"},
+        "project": {
+            "id": 1 + server_id % 100,
+            "name": "Default Project",
+            "owner": make_user(1 + server_id % 100),
+            "members": 1,
+            "servers": 3,
+        },
+        "usage": {
+            "cpu": server_id % 100,
+            "network": {"incoming": {"value": 1024}, "outgoing": {"value": 2048}},
+            "disk": {"read": {"value": 10}, "write": {"value": 20}},
+        },
+    }
+
+
+def page(data: list[GeneralDict], page_no: int, last_page: int, total: int) -> GeneralDict:
+    """Wrap `data` in the paginated envelope returned by list endpoints"""
+    return {
+        "data": data,
+        "links": {
+            "first": "?page=1",
+            "last": f"?page={last_page}",
+            "prev": f"?page={page_no - 1}" if page_no > 1 else None,
+            "next": f"?page={page_no + 1}" if page_no < last_page else None,
+        },
+        "meta": {
+            "current_page": page_no,
+            "last_page": last_page,
+            "per_page": len(data),
+            "total": total,
+        },
+    }
@@ -0,0 +1,271 @@
+"""Benchmark `SolusVMAPI` against the local mock panel.
+
+    python -m benchmarks.run --servers 5000 --concurrency 32 --output run.json
+    python -m benchmarks.run --compare run.json
+    python -m benchmarks.run --transport memory
+
+Every scenario reports calls/sec and p50/p99 latency under the configured
+concurrency, and the peak traced memory of a separate, smaller pass.
+`--transport` picks the client backend: aiohttp or httpx over a local socket,
+or `memory` to dispatch straight to the panel and measure the client alone. The
+`parse` section gives the decode + model construction cost per `Server` and
+`SolusPlan`. With `--compare`, scenarios whose throughput dropped or whose
+p99 grew by more than `--tolerance` are listed and the exit status is 1.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Optional
+
+import aiohttp
+
+from solus_api import HttpxTransport, MemoryTransport, SolusVMAPI, __version__
+from solus_api.models.plan import SolusPlan
+from solus_api.models.server import Server
+
+from .mock_server import MockPanel, start
+
+Call = Callable[[SolusVMAPI, int], Awaitable[Any]]
+
+MEMORY_URL = "http://panel.invalid"
+
+
+def scenarios(panel: MockPanel, per_page: int) -> dict[str, tuple[Call, bool]]:
+    """name -> (call, is_sweep). Sweeps walk a whole listing per call."""
+    n_servers = panel.sizes["servers"]
+    n_plans = panel.sizes["plans"]
+    n_resources = panel.sizes["compute_resources"]
+
+    async def list_servers(api: SolusVMAPI, i: int) -> Any:
+        return await api.list_servers(per_page=per_page)
+
+    async def stream_servers(api: SolusVMAPI, i: int) -> Any:
+        # Count rather than collect, so peak memory reflects streaming.
+        count = 0
+        async for _ in api.stream_servers(per_page=per_page):
+            count += 1
+        return count
+
+    return {
+        "retrieve_server": (
+            lambda api, i: api.retrieve_server(1 + i % n_servers),
+            False,
+        ),
+        "get_plan": (lambda api, i: api.get_plan(1 + i % n_plans), False),
+        "get_plans": (lambda api, i: api.get_plans(), False),
+        "retrieve_compute_resource": (
+            lambda api, i: api.retrieve_compute_resource(1 + i % n_resources),
+            False,
+        ),
+        "list_all_compute_resources": (
+            lambda api, i: api.list_all_compute_resources(),
+            False,
+        ),
+        "start_server": (lambda api, i: api.start_server(1 + i % n_servers), False),
+        "list_servers": (list_servers, True),
+        "stream_servers": (stream_servers, True),
+    }
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def drive(
+    api: SolusVMAPI, call: Call, calls: int, concurrency: int
+) -> list[float]:
+    latencies: list[float] = []
+    counter = iter(range(calls))
+
+    async def worker() -> None:
+        for i in counter:
+            started = time.perf_counter()
+            await call(api, i)
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+def make_client(transport: str, panel: MockPanel, base_url: str) -> SolusVMAPI:
+    if transport == "memory":
+        return SolusVMAPI("bench", MEMORY_URL, transport=MemoryTransport(panel.handle))
+    if transport == "httpx":
+        return SolusVMAPI("bench", base_url, transport=HttpxTransport())
+    return SolusVMAPI("bench", base_url)
+
+
+async def run_scenario(
+    api: SolusVMAPI, call: Call, calls: int, concurrency: int
+) -> dict[str, Any]:
+    async with api:
+        await call(api, 0)  # warm up the pool and the panel's page cache
+        started = time.perf_counter()
+        latencies = await drive(api, call, calls, concurrency)
+        elapsed = time.perf_counter() - started
+
+        memory_calls = max(1, calls // 10)
+        tracemalloc.start()
+        await drive(api, call, memory_calls, concurrency)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        "calls": calls,
+        "concurrency": concurrency,
+        "calls_per_sec": round(calls / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+        "peak_bytes": peak,
+    }
+
+
+def parse_cost(panel: MockPanel, per_page: int, repeat: int = 5) -> dict[str, float]:
+    results = {}
+    for collection, model in (("servers", Server), ("plans", SolusPlan)):
+        body = panel.page_body(collection, 1, per_page)
+        count = len(json.loads(body)["data"])
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            [model(d) for d in json.loads(body)["data"]]
+            best = min(best, time.perf_counter() - started)
+        results[f"us_per_{model.__name__}"] = round(best / max(count, 1) * 1e6, 3)
+    return results
+
+
+def serve_in_thread(panel: MockPanel) -> tuple[str, Callable[[], None]]:
+    """Run the mock panel on its own loop so it does not compete with the client loop"""
+    loop = asyncio.new_event_loop()
+    ready: "asyncio.Future[tuple[Any, str]]" = loop.create_future()
+
+    def target() -> None:
+        asyncio.set_event_loop(loop)
+
+        async def boot() -> None:
+            ready.set_result(await start(panel))
+
+        loop.run_until_complete(boot())
+        loop.run_forever()
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    while not ready.done():
+        time.sleep(0.01)
+    runner, base_url = ready.result()
+
+    def stop() -> None:
+        asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+
+    return base_url, stop
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], tolerance: float
+) -> list[str]:
+    regressions = []
+    for name, result in current["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before:
+            continue
+        if result["calls_per_sec"] < before["calls_per_sec"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: calls/sec {before['calls_per_sec']} -> {result['calls_per_sec']}"
+            )
+        if result["p99_ms"] > before["p99_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p99 {before['p99_ms']}ms -> {result['p99_ms']}ms"
+            )
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--servers", type=int, default=2000)
+    parser.add_argument("--plans", type=int, default=20)
+    parser.add_argument("--compute-resources", type=int, default=10)
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument(
+        "--sweeps", type=int, default=5, help="calls for sweep scenarios"
+    )
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="panel latency, seconds"
+    )
+    parser.add_argument(
+        "--transport", choices=("aiohttp", "httpx", "memory"), default="aiohttp"
+    )
+    parser.add_argument("--only", nargs="*", help="scenario names to run")
+    parser.add_argument("--output", help="write the JSON results here")
+    parser.add_argument("--compare", help="baseline JSON to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    panel = MockPanel(
+        servers=args.servers,
+        plans=args.plans,
+        compute_resources=args.compute_resources,
+        latency=args.latency,
+    )
+    if args.transport == "memory":
+        base_url, stop = MEMORY_URL, lambda: None
+    else:
+        base_url, stop = serve_in_thread(panel)
+    results: dict[str, Any] = {
+        "meta": {
+            "python": platform.python_version(),
+            "aiohttp": aiohttp.__version__,
+            "solus_api": __version__,
+            "timestamp": time.time(),
+            "params": vars(args),
+        },
+        "scenarios": {},
+        "parse": parse_cost(panel, args.per_page),
+    }
+    try:
+        for name, (call, sweep) in scenarios(panel, args.per_page).items():
+            if args.only and name not in args.only:
+                continue
+            calls = args.sweeps if sweep else args.calls
+            concurrency = min(args.concurrency, calls)
+            results["scenarios"][name] = asyncio.run(
+                run_scenario(
+                    make_client(args.transport, panel, base_url),
+                    call,
+                    calls,
+                    concurrency,
+                )
+            )
+    finally:
+        stop()
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    print(output)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,4 +14,9 @@ setuptools.setup(
     url="",
     packages=setuptools.find_packages(),
     install_requires=required_packages,
+    extras_require={
+        "orjson": ["orjson"],
+        "msgspec": ["msgspec"],
+        "http2": ["httpx[http2]"],
+    },
 )
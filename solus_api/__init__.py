@@ -1,3 +1,21 @@
 from ._metadata import __version__
+from .bulk import *
+from .cache import *
+from .catalog import *
 from .client import *
+from .cluster import *
+from .codec import *
+from .config import *
+from .disk_cache import *
+from .export import *
+from .instrumentation import *
+from .ip_index import *
+from .mirror import *
 from .payloads import *
+from .placement import *
+from .projection import *
+from .ratelimit import *
+from .retry import *
+from .sync import *
+from .transport import *
+from .usage import *
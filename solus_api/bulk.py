@@ -0,0 +1,70 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Optional
+
+from .exceptions import NotFound
+
+__all__ = ["BulkResult", "run_bulk"]
+
+DEFAULT_BULK_CONCURRENCY = 20
+
+
+@dataclass
+class BulkResult:
+    """Outcome of one action in a bulk operation.
+
+    `status` is `"ok"`, `"not_found"` or `"error"`; `result` holds the API
+    response on success and `error` the exception otherwise.
+    """
+
+    server_id: int
+    status: str
+    result: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+
+async def _run_one(
+    action: Callable[[int], Awaitable[Any]], server_id: int
+) -> BulkResult:
+    try:
+        result = await action(server_id)
+    except NotFound as e:
+        return BulkResult(server_id, "not_found", error=e)
+    except Exception as e:
+        return BulkResult(server_id, "error", error=e)
+    return BulkResult(server_id, "ok", result=result)
+
+
+async def run_bulk(
+    action: Callable[[int], Awaitable[Any]],
+    server_ids: Iterable[int],
+    concurrency: int = DEFAULT_BULK_CONCURRENCY,
+) -> AsyncIterator[BulkResult]:
+    """Run `action` for every id, at most `concurrency` at a time.
+
+    Results are yielded in completion order. Ids are pulled from `server_ids`
+    only as slots free up, so it may be a lazy iterable of any size. Failures
+    are reported per id and never stop the rest of the batch.
+    """
+    ids = iter(server_ids)
+    pending: set[asyncio.Task[BulkResult]] = set()
+    try:
+        while True:
+            for server_id in ids:
+                pending.add(asyncio.ensure_future(_run_one(action, server_id)))
+                if len(pending) >= max(concurrency, 1):
+                    break
+            if not pending:
+                return
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,137 @@
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+from .types import GeneralDict
+
+__all__ = ["ResponseCache", "DEFAULT_TTLS"]
+
+# Seconds a decoded response stays fresh, per logical endpoint.
+DEFAULT_TTLS: dict[str, float] = {
+    "list_plans": 300.0,
+    "get_plan": 300.0,
+    "list_compute_resources": 60.0,
+    "retrieve_compute_resource": 60.0,
+}
+
+# A write under the key collection makes cached reads under these paths stale
+# (creating or deleting a server changes its compute resource's usage).
+_RELATED_PATHS: dict[str, tuple[str, ...]] = {
+    "servers": ("/servers", "/compute_resources"),
+    "compute_resources": ("/compute_resources", "/servers"),
+}
+
+
+class CacheEntry:
+    __slots__ = ("path", "value", "expires_at", "etag", "last_modified")
+
+    def __init__(
+        self,
+        path: str,
+        value: GeneralDict,
+        expires_at: float,
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> None:
+        self.path = path
+        self.value = value
+        self.expires_at = expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating a stale entry"""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Bounded LRU cache of decoded GET responses.
+
+    Only endpoints with a TTL in `ttls` are cached. Stale entries are kept
+    until evicted so that they can be revalidated with `If-None-Match` /
+    `If-Modified-Since`; a `304` answer refreshes them without a new decode.
+
+    Clients key their entries by panel URL and token, so one cache can be
+    shared between clients of different panels. Invalidation goes by path
+    across all of them.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[dict[str, float]] = None,
+        maxsize: int = 256,
+        revalidate: bool = True,
+    ) -> None:
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.maxsize = maxsize
+        self.revalidate = revalidate
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, endpoint: str) -> Optional[float]:
+        return self.ttls.get(endpoint)
+
+    @staticmethod
+    def key(
+        path: str, params: Optional[GeneralDict] = None, scope: Hashable = None
+    ) -> Hashable:
+        """Key of a GET response; `scope` keeps panels and tokens apart"""
+        return (scope, path, tuple(sorted((params or {}).items())))
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        if not entry.fresh and not (
+            self.revalidate and (entry.etag or entry.last_modified)
+        ):
+            del self._entries[key]
+            return None
+        return entry
+
+    def put(
+        self,
+        key: Hashable,
+        path: str,
+        ttl: float,
+        value: GeneralDict,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        self._entries[key] = CacheEntry(
+            path, value, time.monotonic() + ttl, etag, last_modified
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def refresh(self, entry: CacheEntry, ttl: float) -> None:
+        entry.expires_at = time.monotonic() + ttl
+
+    def invalidate(self, prefix: Optional[str] = None) -> int:
+        """Drop every entry, or those whose path starts with `prefix`"""
+        if prefix is None:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+        stale = [k for k, e in self._entries.items() if e.path.startswith(prefix)]
+        for k in stale:
+            del self._entries[k]
+        return len(stale)
+
+    def invalidate_for_write(self, path: str) -> None:
+        collection = path.strip("/").split("/", 1)[0]
+        for prefix in _RELATED_PATHS.get(collection, ("/" + collection,)):
+            self.invalidate(prefix)
@@ -0,0 +1,150 @@
+import bisect
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+from .models.plan import SolusPlan
+from .types import GeneralDict
+
+if TYPE_CHECKING:
+    from .client import SolusVMAPI
+
+__all__ = ["PlanCatalog"]
+
+RANGE_FIELDS = ("vcpu", "ram", "disk")
+
+
+def _ids(entries: Iterable[GeneralDict]) -> Iterator[int]:
+    for entry in entries:
+        try:
+            yield int(entry["id"])
+        except (KeyError, TypeError, ValueError):
+            continue
+
+
+class PlanCatalog:
+    """Read-only indexes over a set of plans for repeated lookups.
+
+    Plans are indexed by id, by the OS image versions, locations and
+    applications they offer, and sorted by `params.vcpu`/`ram`/`disk` for
+    range queries. Results keep the order the plans were given in. Build a
+    new catalog when the plans change.
+    """
+
+    def __init__(self, plans: Iterable[SolusPlan]) -> None:
+        self.plans = list(plans)
+        self._order = {id(plan): i for i, plan in enumerate(self.plans)}
+        self._by_id = {plan.id: plan for plan in self.plans}
+        self._by_os: dict[int, list[SolusPlan]] = {}
+        self._by_location: dict[int, list[SolusPlan]] = {}
+        self._by_application: dict[int, list[SolusPlan]] = {}
+        # field -> (sorted values, plans in the same order)
+        self._sorted: dict[str, tuple[list[float], list[SolusPlan]]] = {}
+
+        for plan in self.plans:
+            for os_id in _ids(plan.available_os_image_versions):
+                self._by_os.setdefault(os_id, []).append(plan)
+            for location_id in _ids(plan.available_locations):
+                self._by_location.setdefault(location_id, []).append(plan)
+            for application_id in _ids(plan.available_applications):
+                self._by_application.setdefault(application_id, []).append(plan)
+
+        for field in RANGE_FIELDS:
+            pairs = sorted(
+                (
+                    (getattr(plan.params, field), self._order[id(plan)], plan)
+                    for plan in self.plans
+                    if isinstance(getattr(plan.params, field), (int, float))
+                ),
+                key=lambda pair: pair[:2],
+            )
+            self._sorted[field] = ([p[0] for p in pairs], [p[2] for p in pairs])
+
+    @classmethod
+    async def fetch(cls, client: "SolusVMAPI") -> "PlanCatalog":
+        return cls(await client.get_plans())
+
+    def __len__(self) -> int:
+        return len(self.plans)
+
+    def __iter__(self) -> Iterator[SolusPlan]:
+        return iter(self.plans)
+
+    def __contains__(self, plan_id: object) -> bool:
+        return plan_id in self._by_id
+
+    def __getitem__(self, plan_id: int) -> SolusPlan:
+        return self._by_id[plan_id]
+
+    def get(self, plan_id: int) -> Optional[SolusPlan]:
+        return self._by_id.get(plan_id)
+
+    def with_os(self, os_image_version_id: int) -> list[SolusPlan]:
+        return list(self._by_os.get(os_image_version_id, ()))
+
+    def in_location(self, location_id: int) -> list[SolusPlan]:
+        return list(self._by_location.get(location_id, ()))
+
+    def with_application(self, application_id: int) -> list[SolusPlan]:
+        return list(self._by_application.get(application_id, ()))
+
+    def in_range(
+        self,
+        field: str,
+        minimum: Optional[float] = None,
+        maximum: Optional[float] = None,
+    ) -> list[SolusPlan]:
+        """Plans with `minimum <= params.<field> <= maximum`, smallest first"""
+        values, plans = self._sorted[field]
+        lo = 0 if minimum is None else bisect.bisect_left(values, minimum)
+        hi = len(values) if maximum is None else bisect.bisect_right(values, maximum)
+        return plans[lo:hi]
+
+    def find(
+        self,
+        os_image_version_id: Optional[int] = None,
+        location_id: Optional[int] = None,
+        application_id: Optional[int] = None,
+        min_vcpu: Optional[float] = None,
+        min_ram: Optional[float] = None,
+        min_disk: Optional[float] = None,
+        max_vcpu: Optional[float] = None,
+        max_ram: Optional[float] = None,
+        max_disk: Optional[float] = None,
+        visible_only: bool = False,
+    ) -> list[SolusPlan]:
+        """Plans matching every given criterion.
+
+        Each criterion is answered from its index and the candidate sets are
+        intersected smallest first, so no plan's lists are scanned.
+        """
+        candidates: list[list[SolusPlan]] = []
+        for index, key in (
+            (self._by_os, os_image_version_id),
+            (self._by_location, location_id),
+            (self._by_application, application_id),
+        ):
+            if key is not None:
+                candidates.append(index.get(key, []))
+        for field, low, high in (
+            ("vcpu", min_vcpu, max_vcpu),
+            ("ram", min_ram, max_ram),
+            ("disk", min_disk, max_disk),
+        ):
+            if low is not None or high is not None:
+                candidates.append(self.in_range(field, low, high))
+
+        if not candidates:
+            result = self.plans
+        else:
+            candidates.sort(key=len)
+            ids = {id(plan) for plan in candidates[0]}
+            for other in candidates[1:]:
+                if not ids:
+                    break
+                ids &= {id(plan) for plan in other}
+            result = sorted(
+                (plan for plan in candidates[0] if id(plan) in ids),
+                key=lambda plan: self._order[id(plan)],
+            )
+        if visible_only:
+            return [plan for plan in result if plan.is_visible]
+        return list(result)
@@ -1,23 +1,130 @@
-import json
-from typing import Optional
+import asyncio
+import copy
+import time
+from collections import Counter, deque
+from contextlib import AsyncExitStack, nullcontext
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+)
 import aiohttp
 
+from .bulk import DEFAULT_BULK_CONCURRENCY, BulkResult, run_bulk
+from .cache import ResponseCache
+from .codec import JSONCodec, get_codec
+from .config import PoolConfig
+from .instrumentation import Instrumentation
+from .projection import (
+    Shaped,
+    shape,
+    shaped_all,
+    shaped_get,
+    shaped_iter,
+    shaped_list,
+    shaped_stream,
+)
+from .ratelimit import RateLimiter
+from .retry import RetryEvent, RetryPolicy
+from .transport import AiohttpTransport, Response, Transport
+from .models._lazy import SectionPool, shared_sections
 from .models.resouce import ComputeResource
 
 # from .utils import dump_json
-from .exceptions import NotFound, SolusAPIError
+from .exceptions import NotFound, RateLimited, ServerError, SolusAPIError
 from solus_api.models.plan import SolusPlan
 from .models.server import Server
+from .streaming import DataArrayParser
 from .types import GeneralDict, PlanIDT
+from .waiter import ServerPoller, is_ready, status_in
+
+if TYPE_CHECKING:
+    from .structs import ComputeResourceStruct, PlanStruct, ServerStruct
+
+T = TypeVar("T")
+
+DEFAULT_PER_PAGE = 100
+DEFAULT_PREFETCH = 2
+STREAM_CHUNK_SIZE = 64 * 1024
 
 
 class SolusVMAPI:
-    def __init__(self, api_key: str, host_url: str, enable_ssl: bool = False) -> None:
+    """Async client for the SolusVM 2 REST API.
+
+    The HTTP session is created on first use, so the client can be built
+    outside a running event loop. Use it as `async with SolusVMAPI(...)` or
+    call `close()` when done.
+
+    Requests go through `transport`, an `AiohttpTransport` built from `pool`
+    unless another backend (`HttpxTransport`, `MemoryTransport`) is given.
+    The client closes its transport on `close()`.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        host_url: str,
+        enable_ssl: bool = False,
+        cache: Optional[ResponseCache] = None,
+        single_flight: bool = False,
+        pool: Optional[PoolConfig] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        codec: Optional[JSONCodec] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        transport: Optional[Transport] = None,
+    ) -> None:
         self.access_token = api_key
         self._base_url = host_url + "/api/v1"
-        self._session = aiohttp.ClientSession(
-            connector=aiohttp.TCPConnector(ssl=enable_ssl)
-        )
+        self._enable_ssl = enable_ssl
+        self._codec = codec or get_codec()
+        self._instrumentation = instrumentation
+        self._pool = pool or PoolConfig()
+        self._retry = retry or RetryPolicy()
+        # Retries performed so far, per logical endpoint.
+        self.retry_counts: Counter[str] = Counter()
+        self._rate_limiter = rate_limiter
+        self._poller: Optional[ServerPoller] = None
+        self._cache = cache
+        self._single_flight = single_flight
+        self._in_flight: dict[Hashable, asyncio.Future[GeneralDict]] = {}
+        self._transport = transport
+
+    async def __aenter__(self) -> "SolusVMAPI":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    def _slot(self, method: str, endpoint: str) -> AsyncContextManager[None]:
+        if self._rate_limiter is None:
+            return nullcontext()
+        return self._rate_limiter.slot(method, endpoint)
+
+    def _get_transport(self) -> Transport:
+        if self._transport is None:
+            trace_configs = []
+            if self._instrumentation is not None:
+                trace_configs.append(self._instrumentation.trace_config())
+            self._transport = AiohttpTransport(
+                self._pool, ssl=self._enable_ssl, trace_configs=trace_configs
+            )
+        return self._transport
 
     def get_headers(self, headers: Optional[GeneralDict] = None) -> GeneralDict:
         if not headers:
@@ -28,8 +135,15 @@ class SolusVMAPI:
         return headers
 
     async def close(self) -> None:
-        if not self._session.closed:
-            await self._session.close()
+        if self._poller is not None:
+            await self._poller.close()
+        if self._transport is not None:
+            await self._transport.close()
+
+    def invalidate_cache(self, prefix: Optional[str] = None) -> None:
+        """Drop cached responses, all of them or those under the `prefix` path"""
+        if self._cache is not None:
+            self._cache.invalidate(prefix)
 
     async def _request(
         self,
@@ -37,55 +151,505 @@ class SolusVMAPI:
         path: str,
         data: GeneralDict | str = {},
         headers: Optional[GeneralDict] = None,
-    ) -> aiohttp.ClientResponse:
+        params: Optional[GeneralDict] = None,
+        endpoint: Optional[str] = None,
+    ) -> Response:
         url = self._base_url + path
+        endpoint = endpoint or path
 
-        data = json.dumps(data)
+        body = None
+        if data or method not in ("GET", "HEAD"):
+            body = self._codec.dumps(data)
 
-        async with self._session.request(
-            method=method, url=url, headers=self.get_headers(headers), data=data
-        ) as resp:
-            await resp.read()
+        attempt = 1
+        while True:
+            try:
+                resp = await self._send(
+                    method, url, endpoint, path, attempt, headers, body, params
+                )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if not self._retry.should_retry_error(method, e):
+                    raise
+                if not await self._wait_retry(endpoint, method, path, attempt, error=e):
+                    raise
+            else:
+                if not self._retry.should_retry_status(method, resp.status):
+                    break
+                if not await self._wait_retry(
+                    endpoint, method, path, attempt, resp=resp
+                ):
+                    break
+            attempt += 1
 
         await self._raise_exception(resp)
 
-        if resp.status not in range(200, 299):
+        # 304 only comes back for conditional requests sent by the cache.
+        if resp.status not in range(200, 299) and resp.status != 304:
             raise SolusAPIError(f"API Response: {await resp.text()}")
 
+        if method != "GET" and self._cache is not None:
+            self._cache.invalidate_for_write(path)
+
         return resp
 
-    async def _raise_exception(self, resp: aiohttp.ClientResponse) -> None:
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        path: str,
+        attempt: int,
+        headers: Optional[GeneralDict],
+        body: Optional[bytes],
+        params: Optional[GeneralDict],
+    ) -> Response:
+        """One HTTP attempt with the body read, instrumented when enabled"""
+        metrics = None
+        if self._instrumentation is not None:
+            metrics = self._instrumentation.start(
+                endpoint, method, path, attempt, len(body or b"")
+            )
+        started = time.perf_counter()
+        try:
+            async with self._slot(method, endpoint):
+                resp = await self._get_transport().request(
+                    method,
+                    url,
+                    headers=self.get_headers(headers),
+                    body=body,
+                    params=params,
+                    trace_ctx=metrics,
+                )
+            if metrics is not None:
+                metrics.body = resp.body_time
+                metrics.status = resp.status
+                metrics.response_bytes = len(await resp.read())
+            return resp
+        except BaseException as e:
+            if metrics is not None and metrics.error is None:
+                metrics.error = type(e).__name__
+            raise
+        finally:
+            if metrics is not None and self._instrumentation is not None:
+                metrics.total = time.perf_counter() - started
+                self._instrumentation.finish(metrics)
+
+    async def _wait_retry(
+        self,
+        endpoint: str,
+        method: str,
+        path: str,
+        attempt: int,
+        resp: Optional[Response] = None,
+        error: Optional[BaseException] = None,
+    ) -> bool:
+        """Sleep before the next attempt. Returns False once attempts are used up."""
+        if attempt >= self._retry.max_attempts:
+            return False
+        delay = None
+        if resp is not None:
+            delay = self._retry.retry_after(resp.headers)
+        if delay is None:
+            delay = self._retry.backoff(attempt)
+
+        self.retry_counts[endpoint] += 1
+        if self._retry.on_retry is not None:
+            self._retry.on_retry(
+                RetryEvent(
+                    endpoint=endpoint,
+                    method=method,
+                    path=path,
+                    attempt=attempt,
+                    delay=delay,
+                    status=resp.status if resp is not None else None,
+                    error=error,
+                )
+            )
+        await asyncio.sleep(delay)
+        return True
+
+    async def _raise_exception(self, resp: Response) -> None:
         if resp.status in range(200, 299):
             return
+        message = f"Status: {resp.status} | Reason: {resp.reason} | Response: {await resp.text()}"
         if resp.status == 404:
-            raise NotFound(
-                f"Status: {resp.status} | Reason: {resp.reason} | Response: {await resp.text()}"
+            raise NotFound(message)
+        if resp.status == 429:
+            raise RateLimited(message)
+        if resp.status >= 500:
+            raise ServerError(message)
+
+    async def _parse_resp_data(
+        self, resp: Response, endpoint: Optional[str] = None
+    ) -> GeneralDict:
+        body = await resp.read()
+        if not body:
+            return {}
+        if self._instrumentation is None:
+            return self._codec.loads(body)
+        started = time.perf_counter()
+        rjs = self._codec.loads(body)
+        self._instrumentation.timing(
+            endpoint or resp.path, "decode", time.perf_counter() - started
+        )
+        return rjs
+
+    def _shape(
+        self,
+        build: Callable[[GeneralDict], T],
+        raw: bool,
+        fields: Optional[Sequence[str]],
+    ) -> Callable[[GeneralDict], Shaped[T]]:
+        """`shape`, with copies if the cache or single-flight share payloads"""
+        return shape(build, raw, fields, self._cache is not None or self._single_flight)
+
+    def _build(
+        self,
+        endpoint: str,
+        build: Callable[[GeneralDict], T],
+        data: GeneralDict,
+        sections: Optional[SectionPool] = None,
+    ) -> T:
+        """Construct a model, timing it when instrumentation is enabled.
+
+        Models built with the same `sections` pool, one per listing page,
+        share their common raw sections.
+        """
+        if sections is not None:
+            with shared_sections(sections):
+                return self._build(endpoint, build, data)
+        if self._instrumentation is None:
+            return build(data)
+        started = time.perf_counter()
+        obj = build(data)
+        self._instrumentation.timing(endpoint, "build", time.perf_counter() - started)
+        return obj
+
+    async def _get_json(
+        self, path: str, endpoint: str, params: Optional[GeneralDict] = None
+    ) -> GeneralDict:
+        """GET `path` and decode it.
+
+        With `single_flight` enabled, concurrent calls for the same path, query
+        and token share one request and the same decoded dict, which callers
+        must therefore treat as read-only.
+        """
+        if not self._single_flight:
+            return await self._fetch_json(path, endpoint, params)
+
+        key = ("GET", path, self.access_token, ResponseCache.key(path, params))
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_json(path, endpoint, params))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t: self._forget_in_flight(key, t))
+        # One caller being cancelled must not cancel the request for the others.
+        return await asyncio.shield(task)
+
+    def _forget_in_flight(
+        self, key: Hashable, task: "asyncio.Future[GeneralDict]"
+    ) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()  # retrieved by the waiters; silence the loop warning
+
+    async def _fetch_json(
+        self, path: str, endpoint: str, params: Optional[GeneralDict] = None
+    ) -> GeneralDict:
+        """GET `path` and decode it, going through the response cache if enabled"""
+        ttl = self._cache.ttl_for(endpoint) if self._cache is not None else None
+        if self._cache is None or ttl is None:
+            resp = await self._request(
+                "GET", path=path, params=params, endpoint=endpoint
             )
+            return await self._parse_resp_data(resp, endpoint)
 
-    async def _parse_resp_data(self, resp: aiohttp.ClientResponse) -> GeneralDict:
-        return await resp.json()
+        key = self._cache.key(path, params, (self._base_url, self.access_token))
+        entry = self._cache.get(key)
+        if entry is not None and entry.fresh:
+            return entry.value
+
+        headers = None
+        if entry is not None:
+            headers = {**self.get_headers(), **entry.validators()}
+        resp = await self._request(
+            "GET", path=path, headers=headers, params=params, endpoint=endpoint
+        )
+        if resp.status == 304 and entry is not None:
+            self._cache.refresh(entry, ttl)
+            return entry.value
+
+        rjs = await self._parse_resp_data(resp, endpoint)
+        self._cache.put(
+            key,
+            path,
+            ttl,
+            rjs,
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+        )
+        return rjs
+
+    async def _fetch_page(
+        self, path: str, endpoint: str, page: int, per_page: int
+    ) -> GeneralDict:
+        return await self._get_json(
+            path, endpoint, params={"page": page, "per_page": per_page}
+        )
+
+    async def _iter_pages(
+        self,
+        path: str,
+        endpoint: str,
+        per_page: int,
+        prefetch: int,
+        fetch_page: Optional[Callable[[int], Awaitable[GeneralDict]]] = None,
+    ) -> AsyncIterator[list[Any]]:
+        """Yield the `data` list of every page of a paginated listing.
+
+        The first page tells us `meta.last_page`; after that up to `prefetch`
+        pages are kept in flight while the caller consumes the current one.
+        Responses without `meta` are followed sequentially through `links.next`.
+        `fetch_page` replaces the default dict-decoding page fetch.
+        """
+        fetch = fetch_page or (
+            lambda page: self._fetch_page(path, endpoint, page, per_page)
+        )
+        rjs = await fetch(1)
+        yield rjs["data"]
+
+        last_page: Optional[int] = (rjs.get("meta") or {}).get("last_page")
+        if last_page is None:
+            page = 1
+            while (rjs.get("links") or {}).get("next") and rjs["data"]:
+                page += 1
+                rjs = await fetch(page)
+                yield rjs["data"]
+            return
+
+        pending: deque[asyncio.Task[GeneralDict]] = deque()
+        next_page = 2
+        try:
+            while pending or next_page <= last_page:
+                while next_page <= last_page and len(pending) < max(prefetch, 1):
+                    pending.append(asyncio.ensure_future(fetch(next_page)))
+                    next_page += 1
+                rjs = await pending.popleft()
+                yield rjs["data"]
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _iter_items(
+        self,
+        path: str,
+        endpoint: str,
+        build: Callable[[GeneralDict], T],
+        per_page: int,
+        prefetch: int,
+    ) -> AsyncIterator[T]:
+        async for page in self._iter_pages(path, endpoint, per_page, prefetch):
+            sections: SectionPool = {}
+            for item in page:
+                yield self._build(endpoint, build, item, sections)
+
+    async def _stream_page(
+        self, path: str, endpoint: str, params: GeneralDict, parser: DataArrayParser
+    ) -> AsyncIterator[GeneralDict]:
+        """Yield `data` items of one GET response while its body is still arriving"""
+        url = self._base_url + path
+        metrics = None
+        if self._instrumentation is not None:
+            metrics = self._instrumentation.start(endpoint, "GET", path, 1, 0)
+        async with AsyncExitStack() as stack:
+            # The rate-limit slot covers the request up to the response headers
+            # only: consumers may be slow or call the API for every item.
+            async with self._slot("GET", endpoint):
+                resp = await stack.enter_async_context(
+                    self._get_transport().stream(
+                        "GET",
+                        url,
+                        headers=self.get_headers(),
+                        params=params,
+                        trace_ctx=metrics,
+                        chunk_size=STREAM_CHUNK_SIZE,
+                    )
+                )
+            if metrics is not None and self._instrumentation is not None:
+                metrics.status = resp.status
+                self._instrumentation.finish(metrics)
+            if resp.status not in range(200, 299):
+                await resp.read()
+                await self._raise_exception(resp)
+                raise SolusAPIError(f"API Response: {await resp.text()}")
+
+            async for chunk in resp.iter_chunks(STREAM_CHUNK_SIZE):
+                for item in parser.feed(chunk):
+                    yield item
+            for item in parser.close():
+                yield item
+
+    async def _stream_items(
+        self,
+        path: str,
+        endpoint: str,
+        build: Callable[[GeneralDict], T],
+        per_page: int,
+    ) -> AsyncIterator[T]:
+        page = 1
+        while True:
+            parser = DataArrayParser()
+            params = {"page": page, "per_page": per_page}
+            sections: SectionPool = {}
+            async for item in self._stream_page(path, endpoint, params, parser):
+                yield self._build(endpoint, build, item, sections)
+
+            last_page: Optional[int] = (parser.extras.get("meta") or {}).get(
+                "last_page"
+            )
+            if last_page is not None:
+                if page >= last_page:
+                    return
+            elif not (parser.extras.get("links") or {}).get("next"):
+                return
+            page += 1
+
+    def _iter_structs(
+        self,
+        path: str,
+        endpoint: str,
+        struct: Type[T],
+        per_page: int,
+        prefetch: int,
+    ) -> AsyncIterator[T]:
+        """Like `_iter_items`, but decodes pages straight into msgspec structs"""
+        from .structs import page_decoder
+
+        decoder = page_decoder(struct)
+
+        async def fetch_page(page: int) -> GeneralDict:
+            resp = await self._request(
+                "GET",
+                path=path,
+                params={"page": page, "per_page": per_page},
+                endpoint=endpoint,
+            )
+            decoded = decoder.decode(await resp.read())
+            return {
+                "data": decoded.data,
+                "meta": {"last_page": decoded.meta.last_page} if decoded.meta else {},
+                "links": {"next": decoded.links.next} if decoded.links else {},
+            }
+
+        async def items() -> AsyncIterator[T]:
+            async for page in self._iter_pages(
+                path, endpoint, per_page, prefetch, fetch_page
+            ):
+                for item in page:
+                    yield item
+
+        return items()
 
     async def verify_token(self) -> bool:
         path = "/auth"
-        resp = await self._request("GET", path)
+        resp = await self._request("GET", path, endpoint="verify_token")
         return resp.status == 204
 
-    async def get_plans(self) -> list[SolusPlan]:
-        path = "/plans"
-        resp = await self._request("GET", path)
-        rjs = await self._parse_resp_data(resp)
-        plans: list[SolusPlan] = []
-        for d in rjs["data"]:
-            plans.append(SolusPlan(d))
+    async def iter_pages(
+        self,
+        path: str,
+        endpoint: Optional[str] = None,
+        per_page: int = DEFAULT_PER_PAGE,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncIterator[list[GeneralDict]]:
+        """Iterate over the raw `data` list of every page of the listing at `path`.
+
+        `endpoint` names the call for caching, rate limits and instrumentation
+        (`"list_servers"`, ...), and defaults to the path. Pages are copies when
+        the cache or single-flight may share them, so they are the caller's.
+        """
+        shared = self._cache is not None or self._single_flight
+        async for page in self._iter_pages(path, endpoint or path, per_page, prefetch):
+            yield copy.deepcopy(page) if shared else page
 
-        return plans
+    @shaped_all(SolusPlan)
+    async def get_plans(
+        self, *, raw: bool = False, fields: Optional[Sequence[str]] = None
+    ) -> list[Any]:
+        return await self.list_plans(raw=raw, fields=fields)
 
-    async def get_plan(self, plan_id: PlanIDT) -> SolusPlan:
+    @shaped_iter(SolusPlan)
+    def iter_plans(
+        self,
+        per_page: int = DEFAULT_PER_PAGE,
+        prefetch: int = DEFAULT_PREFETCH,
+        *,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Shaped[SolusPlan]]:
+        """Iterate over every plan, following pagination.
+
+        `raw=True` yields the payload dicts and `fields=[...]` namedtuples of
+        just those fields (see `projector`), without building any `SolusPlan`.
+        The same options exist on the other listing and retrieve methods.
+        """
+        return self._iter_items(
+            "/plans",
+            "list_plans",
+            self._shape(SolusPlan, raw, fields),
+            per_page,
+            prefetch,
+        )
+
+    @shaped_stream(SolusPlan)
+    def stream_plans(
+        self,
+        per_page: int = DEFAULT_PER_PAGE,
+        *,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Shaped[SolusPlan]]:
+        """Like `iter_plans`, but builds each plan as soon as its bytes arrive"""
+        return self._stream_items(
+            "/plans", "stream_plans", shape(SolusPlan, raw, fields), per_page
+        )
+
+    def iter_plan_structs(
+        self, per_page: int = DEFAULT_PER_PAGE, prefetch: int = DEFAULT_PREFETCH
+    ) -> "AsyncIterator[PlanStruct]":
+        """Iterate over every plan as a typed `PlanStruct` (requires msgspec)"""
+        from .structs import PlanStruct
+
+        return self._iter_structs(
+            "/plans", "list_plans", PlanStruct, per_page, prefetch
+        )
+
+    @shaped_list(SolusPlan)
+    async def list_plans(
+        self,
+        per_page: int = DEFAULT_PER_PAGE,
+        prefetch: int = DEFAULT_PREFETCH,
+        *,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> list[Any]:
+        return [
+            p async for p in self.iter_plans(per_page, prefetch, raw=raw, fields=fields)
+        ]
+
+    @shaped_get(SolusPlan)
+    async def get_plan(
+        self,
+        plan_id: PlanIDT,
+        *,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Shaped[SolusPlan]:
         path = f"/plans/{plan_id}"
-        resp = await self._request("GET", path)
-        rjs = await self._parse_resp_data(resp)
+        rjs = await self._get_json(path, "get_plan")
 
-        return SolusPlan(rjs["data"])
+        return self._build("get_plan", self._shape(SolusPlan, raw, fields), rjs["data"])
 
     async def create_server(
         self,
@@ -105,19 +669,95 @@ class SolusVMAPI:
         if location_id:
             payload.update({"location": location_id})
 
-        resp = await self._request("POST", path=path, data=payload)
-        rjs = await self._parse_resp_data(resp)
+        resp = await self._request(
+            "POST", path=path, data=payload, endpoint="create_server"
+        )
+        rjs = await self._parse_resp_data(resp, "create_server")
+
+        return self._build("create_server", Server, rjs["data"])
+
+    @shaped_iter(Server)
+    def iter_servers(
+        self,
+        per_page: int = DEFAULT_PER_PAGE,
+        prefetch: int = DEFAULT_PREFETCH,
+        *,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Shaped[Server]]:
+        """Iterate over every server, following pagination"""
+        return self._iter_items(
+            "/servers",
+            "list_servers",
+            self._shape(Server, raw, fields),
+            per_page,
+            prefetch,
+        )
+
+    @shaped_stream(Server)
+    def stream_servers(
+        self,
+        per_page: int = DEFAULT_PER_PAGE,
+        *,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Shaped[Server]]:
+        """Like `iter_servers`, but builds each server as soon as its bytes arrive.
+
+        Only one server's worth of JSON is buffered at a time, so memory stays
+        flat however large `per_page` is.
+        """
+        return self._stream_items(
+            "/servers", "stream_servers", shape(Server, raw, fields), per_page
+        )
+
+    def iter_server_structs(
+        self, per_page: int = DEFAULT_PER_PAGE, prefetch: int = DEFAULT_PREFETCH
+    ) -> "AsyncIterator[ServerStruct]":
+        """Iterate over every server as a typed `ServerStruct` (requires msgspec)"""
+        from .structs import ServerStruct
 
-        return Server(rjs["data"])
+        return self._iter_structs(
+            "/servers", "list_servers", ServerStruct, per_page, prefetch
+        )
+
+    @shaped_list(Server)
+    async def list_servers(
+        self,
+        per_page: int = DEFAULT_PER_PAGE,
+        prefetch: int = DEFAULT_PREFETCH,
+        *,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> list[Any]:
+        return [
+            s
+            async for s in self.iter_servers(per_page, prefetch, raw=raw, fields=fields)
+        ]
 
-    async def retrieve_server(self, server_id: int) -> Server:
+    @shaped_get(Server)
+    async def retrieve_server(
+        self,
+        server_id: int,
+        *,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Shaped[Server]:
 
         path = f"/servers/{server_id}"
-        resp = await self._request("GET", path=path)
+        rjs = await self._get_json(path, "retrieve_server")
 
-        rjs = await self._parse_resp_data(resp)
+        return self._build(
+            "retrieve_server", self._shape(Server, raw, fields), rjs["data"]
+        )
+
+    async def retrieve_server_struct(self, server_id: int) -> "ServerStruct":
+        """Like `retrieve_server`, decoded straight into a `ServerStruct` (requires msgspec)"""
+        from .structs import ServerStruct, item_decoder
 
-        return Server(rjs["data"])
+        path = f"/servers/{server_id}"
+        resp = await self._request("GET", path=path, endpoint="retrieve_server")
+        return item_decoder(ServerStruct).decode(await resp.read()).data
 
     async def reinstall_server(
         self,
@@ -131,78 +771,231 @@ class SolusVMAPI:
             "os": os_id,
             "application_data": application_data,
         }
-        resp = await self._request("POST", path=path, data=payload)
-        rjs = await self._parse_resp_data(resp)
-        return Server(rjs["data"])
+        resp = await self._request(
+            "POST", path=path, data=payload, endpoint="reinstall_server"
+        )
+        rjs = await self._parse_resp_data(resp, "reinstall_server")
+        return self._build("reinstall_server", Server, rjs["data"])
 
     async def restart_server(self, server_id: int, force: bool = True) -> GeneralDict:
         """Restart a server"""
         path = f"/servers/{server_id}/restart"
         payload = {"force": force}
-        resp = await self._request("POST", path=path, data=payload)
-        return await self._parse_resp_data(resp)
+        resp = await self._request(
+            "POST", path=path, data=payload, endpoint="restart_server"
+        )
+        return await self._parse_resp_data(resp, "restart_server")
 
     async def stop_server(self, server_id: int, force: bool = True) -> GeneralDict:
         """Stops a server"""
         path = f"/servers/{server_id}/stop"
         payload = {"force": force}
-        resp = await self._request("POST", path=path, data=payload)
-        return await self._parse_resp_data(resp)
+        resp = await self._request(
+            "POST", path=path, data=payload, endpoint="stop_server"
+        )
+        return await self._parse_resp_data(resp, "stop_server")
 
     async def start_server(self, server_id: int, force: bool = True) -> GeneralDict:
         """Start a server"""
         path = f"/servers/{server_id}/start"
         payload = {"force": force}
-        resp = await self._request("POST", path=path, data=payload)
-        return await self._parse_resp_data(resp)
+        resp = await self._request(
+            "POST", path=path, data=payload, endpoint="start_server"
+        )
+        return await self._parse_resp_data(resp, "start_server")
 
     async def suspend_server(self, server_id: int) -> GeneralDict:
         """Suspend a server"""
         path = f"/servers/{server_id}/suspend"
-        resp = await self._request("POST", path=path)
-        return await self._parse_resp_data(resp)
+        resp = await self._request("POST", path=path, endpoint="suspend_server")
+        return await self._parse_resp_data(resp, "suspend_server")
 
     async def resume_server(self, server_id: int) -> GeneralDict:
         """Resume a stopped/suspended server"""
         path = f"/servers/{server_id}/resume"
-        resp = await self._request("POST", path=path)
-        return await self._parse_resp_data(resp)
+        resp = await self._request("POST", path=path, endpoint="resume_server")
+        return await self._parse_resp_data(resp, "resume_server")
 
     async def delete_server(self, server_id: int) -> GeneralDict:
         path = f"/servers/{server_id}"
-        resp = await self._request("DELETE", path=path)
-        return await self._parse_resp_data(resp)
+        resp = await self._request("DELETE", path=path, endpoint="delete_server")
+        return await self._parse_resp_data(resp, "delete_server")
 
     async def reset_root_password(self, server_id: int) -> bool:
         path = f"/servers/{server_id}/reset_password"
         payload = {"send_password_to_current_user": True}
 
-        resp = await self._request("POST", path=path, data=payload)
+        resp = await self._request(
+            "POST", path=path, data=payload, endpoint="reset_root_password"
+        )
 
         return resp.status == 200
 
+    @property
+    def poller(self) -> ServerPoller:
+        """The shared poller behind `wait_until_ready` and `wait_for_status`"""
+        if self._poller is None:
+            self._poller = ServerPoller(self)
+        return self._poller
+
+    async def wait_until_ready(
+        self, server_id: int, timeout: Optional[float] = None
+    ) -> Server:
+        """Wait until a created/reinstalled server has finished processing"""
+        return await self.poller.wait(server_id, is_ready, timeout)
+
+    async def wait_for_status(
+        self,
+        server_id: int,
+        status: str | Iterable[str],
+        timeout: Optional[float] = None,
+    ) -> Server:
+        """Wait until the server settles in `status` (or one of several)"""
+        statuses = {status} if isinstance(status, str) else set(status)
+        return await self.poller.wait(server_id, status_in(statuses), timeout)
+
+    # Bulk actions
+    def bulk_start_servers(
+        self,
+        server_ids: Iterable[int],
+        force: bool = True,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> AsyncIterator[BulkResult]:
+        """Start many servers, yielding one result per server as it completes"""
+        return run_bulk(
+            lambda sid: self.start_server(sid, force=force), server_ids, concurrency
+        )
+
+    def bulk_stop_servers(
+        self,
+        server_ids: Iterable[int],
+        force: bool = True,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> AsyncIterator[BulkResult]:
+        """Stop many servers, yielding one result per server as it completes"""
+        return run_bulk(
+            lambda sid: self.stop_server(sid, force=force), server_ids, concurrency
+        )
+
+    def bulk_restart_servers(
+        self,
+        server_ids: Iterable[int],
+        force: bool = True,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> AsyncIterator[BulkResult]:
+        """Restart many servers, yielding one result per server as it completes"""
+        return run_bulk(
+            lambda sid: self.restart_server(sid, force=force), server_ids, concurrency
+        )
+
+    def bulk_suspend_servers(
+        self, server_ids: Iterable[int], concurrency: int = DEFAULT_BULK_CONCURRENCY
+    ) -> AsyncIterator[BulkResult]:
+        """Suspend many servers, yielding one result per server as it completes"""
+        return run_bulk(self.suspend_server, server_ids, concurrency)
+
+    def bulk_resume_servers(
+        self, server_ids: Iterable[int], concurrency: int = DEFAULT_BULK_CONCURRENCY
+    ) -> AsyncIterator[BulkResult]:
+        """Resume many servers, yielding one result per server as it completes"""
+        return run_bulk(self.resume_server, server_ids, concurrency)
+
+    def bulk_delete_servers(
+        self, server_ids: Iterable[int], concurrency: int = DEFAULT_BULK_CONCURRENCY
+    ) -> AsyncIterator[BulkResult]:
+        """Delete many servers, yielding one result per server as it completes"""
+        return run_bulk(self.delete_server, server_ids, concurrency)
+
     # Compute resources
-    async def list_all_compute_resources(self) -> list[ComputeResource]:
-        path = "/compute_resources"
-        resp = await self._request("GET", path=path)
-        rjs = await self._parse_resp_data(resp)
+    @shaped_all(ComputeResource)
+    async def list_all_compute_resources(
+        self, *, raw: bool = False, fields: Optional[Sequence[str]] = None
+    ) -> list[Any]:
+        return await self.list_compute_resources(raw=raw, fields=fields)
+
+    @shaped_iter(ComputeResource)
+    def iter_compute_resources(
+        self,
+        per_page: int = DEFAULT_PER_PAGE,
+        prefetch: int = DEFAULT_PREFETCH,
+        *,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Shaped[ComputeResource]]:
+        """Iterate over every compute resource, following pagination"""
+        return self._iter_items(
+            "/compute_resources",
+            "list_compute_resources",
+            self._shape(ComputeResource, raw, fields),
+            per_page,
+            prefetch,
+        )
 
-        ress: list[ComputeResource] = []
-        for res in rjs["data"]:
-            ress.append(ComputeResource(res))
+    @shaped_stream(ComputeResource)
+    def stream_compute_resources(
+        self,
+        per_page: int = DEFAULT_PER_PAGE,
+        *,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Shaped[ComputeResource]]:
+        """Like `iter_compute_resources`, but decodes the body incrementally"""
+        return self._stream_items(
+            "/compute_resources",
+            "stream_compute_resources",
+            shape(ComputeResource, raw, fields),
+            per_page,
+        )
 
-        return ress
+    def iter_compute_resource_structs(
+        self, per_page: int = DEFAULT_PER_PAGE, prefetch: int = DEFAULT_PREFETCH
+    ) -> "AsyncIterator[ComputeResourceStruct]":
+        """Iterate over every compute resource as a typed struct (requires msgspec)"""
+        from .structs import ComputeResourceStruct
 
-    async def retrieve_compute_resource(self, resource_id: int) -> ComputeResource:
+        return self._iter_structs(
+            "/compute_resources",
+            "list_compute_resources",
+            ComputeResourceStruct,
+            per_page,
+            prefetch,
+        )
+
+    @shaped_list(ComputeResource)
+    async def list_compute_resources(
+        self,
+        per_page: int = DEFAULT_PER_PAGE,
+        prefetch: int = DEFAULT_PREFETCH,
+        *,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> list[Any]:
+        return [
+            r
+            async for r in self.iter_compute_resources(
+                per_page, prefetch, raw=raw, fields=fields
+            )
+        ]
+
+    @shaped_get(ComputeResource)
+    async def retrieve_compute_resource(
+        self,
+        resource_id: int,
+        *,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Shaped[ComputeResource]:
         path = f"/compute_resources/{resource_id}"
-        resp = await self._request("GET", path=path)
-        rjs = await self._parse_resp_data(resp)
-        return ComputeResource(rjs["data"])
+        rjs = await self._get_json(path, "retrieve_compute_resource")
+        return self._build(
+            "retrieve_compute_resource",
+            self._shape(ComputeResource, raw, fields),
+            rjs["data"],
+        )
 
     async def retrieve_compute_resouces_usage(self, resource_id: int) -> GeneralDict:
         path = f"/compute_resources/{resource_id}/usage"
-        resp = await self._request("GET", path=path)
-        rjs = await self._parse_resp_data(resp)
+        rjs = await self._get_json(path, "retrieve_compute_resouces_usage")
         return rjs
 
     async def create_server_under_compute_resource(
@@ -219,6 +1012,7 @@ class SolusVMAPI:
         resp = await self._request(
             "POST",
             path=path,
+            endpoint="create_server_under_compute_resource",
             data={
                 "name": name,
                 "password": password,
@@ -228,17 +1022,39 @@ class SolusVMAPI:
                 "project_id": project_id,
             },
         )
-        rjs = await self._parse_resp_data(resp)
-        return Server(rjs["data"])
+        rjs = await self._parse_resp_data(resp, "create_server_under_compute_resource")
+        return self._build("create_server_under_compute_resource", Server, rjs["data"])
 
     async def list_all_users(self) -> GeneralDict:
+        """Raw first page of `/users`. Use `iter_users` to walk every page."""
         path = "/users"
-        resp = await self._request("GET", path=path)
-        rjs = await self._parse_resp_data(resp)
+        rjs = await self._get_json(path, "list_all_users")
         return rjs
 
+    def iter_users(
+        self, per_page: int = DEFAULT_PER_PAGE, prefetch: int = DEFAULT_PREFETCH
+    ) -> AsyncIterator[GeneralDict]:
+        """Iterate over every user, following pagination"""
+        return self._iter_items("/users", "list_users", dict, per_page, prefetch)
+
+    async def list_users(
+        self, per_page: int = DEFAULT_PER_PAGE, prefetch: int = DEFAULT_PREFETCH
+    ) -> list[GeneralDict]:
+        return [u async for u in self.iter_users(per_page, prefetch)]
+
     async def list_all_projects(self) -> GeneralDict:
+        """Raw first page of `/projects`. Use `iter_projects` to walk every page."""
         path = "/projects"
-        resp = await self._request("GET", path=path)
-        rjs = await self._parse_resp_data(resp)
+        rjs = await self._get_json(path, "list_all_projects")
         return rjs
+
+    def iter_projects(
+        self, per_page: int = DEFAULT_PER_PAGE, prefetch: int = DEFAULT_PREFETCH
+    ) -> AsyncIterator[GeneralDict]:
+        """Iterate over every project, following pagination"""
+        return self._iter_items("/projects", "list_projects", dict, per_page, prefetch)
+
+    async def list_projects(
+        self, per_page: int = DEFAULT_PER_PAGE, prefetch: int = DEFAULT_PREFETCH
+    ) -> list[GeneralDict]:
+        return [p async for p in self.iter_projects(per_page, prefetch)]
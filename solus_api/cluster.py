@@ -0,0 +1,409 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    Mapping,
+    Optional,
+    TypeVar,
+)
+
+import aiohttp
+
+from .client import SolusVMAPI
+from .exceptions import NotFound, ServerError, SolusAPIError
+from .models.plan import SolusPlan
+from .models.resouce import ComputeResource
+from .models.server import Server
+from .types import GeneralDict
+
+__all__ = ["ClusterResult", "ClusterUnavailable", "MultiClusterClient", "Tagged"]
+
+T = TypeVar("T")
+
+# Failures that say something about the host rather than about the request.
+HOST_FAILURES = (aiohttp.ClientError, asyncio.TimeoutError, ServerError)
+
+
+class ClusterUnavailable(SolusAPIError):
+    """When the cluster a call must go to is marked unhealthy"""
+
+
+@dataclass
+class Tagged(Generic[T]):
+    """A value returned by one cluster"""
+
+    cluster: str
+    value: T
+
+
+@dataclass
+class ClusterResult(Generic[T]):
+    """Merged outcome of a fan-out call.
+
+    `items` holds what every responding cluster returned, tagged by origin.
+    Clusters that failed are in `errors`; those skipped because they are
+    marked unhealthy are listed in `skipped`.
+    """
+
+    items: list[Tagged[T]] = field(default_factory=list)
+    errors: dict[str, BaseException] = field(default_factory=dict)
+    skipped: list[str] = field(default_factory=list)
+
+    @property
+    def complete(self) -> bool:
+        return not self.errors and not self.skipped
+
+    def values(self) -> list[T]:
+        return [tagged.value for tagged in self.items]
+
+
+class _Health:
+    """Circuit breaker for one cluster"""
+
+    __slots__ = ("failures", "opened_at", "probing")
+
+    def __init__(self) -> None:
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+
+
+class MultiClusterClient:
+    """One client over several SolusVM panels.
+
+    Listings fan out to every cluster concurrently and come back merged and
+    tagged with the cluster name. Per-server calls are routed through an
+    id -> cluster map filled by listings and lookups; unknown ids are resolved
+    by asking every cluster at once. Server ids are only unique within a
+    panel, so an id found on more than one cluster needs an explicit
+    `cluster=`, and a mutating call whose cached route has gone stale raises
+    `NotFound` rather than following the id to another cluster.
+
+    After `failure_threshold` consecutive host failures (connection errors,
+    timeouts, 5xx) a cluster is skipped for `cooldown` seconds; then a single
+    call is let through to probe it.
+    """
+
+    def __init__(
+        self,
+        clusters: Mapping[str, SolusVMAPI],
+        failure_threshold: int = 3,
+        cooldown: float = 30.0,
+    ) -> None:
+        if not clusters:
+            raise ValueError("at least one cluster is required")
+        self.clusters = dict(clusters)
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._health = {name: _Health() for name in self.clusters}
+        self._routes: dict[int, str] = {}
+        self._ambiguous: dict[int, set[str]] = {}
+
+    @classmethod
+    def from_hosts(
+        cls,
+        hosts: Mapping[str, tuple[str, str]],
+        failure_threshold: int = 3,
+        cooldown: float = 30.0,
+        **client_kwargs: Any,
+    ) -> "MultiClusterClient":
+        """Build from `{name: (host_url, api_key)}`.
+
+        `client_kwargs` are passed to every `SolusVMAPI`. A shared `cache`
+        keeps each cluster's entries apart; a shared `rate_limiter` applies
+        one budget to all clusters together.
+        """
+        return cls(
+            {
+                name: SolusVMAPI(api_key, host_url, **client_kwargs)
+                for name, (host_url, api_key) in hosts.items()
+            },
+            failure_threshold,
+            cooldown,
+        )
+
+    async def __aenter__(self) -> "MultiClusterClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await asyncio.gather(*(api.close() for api in self.clusters.values()))
+
+    # Health
+    def is_healthy(self, name: str) -> bool:
+        return self._health[name].opened_at is None
+
+    def health(self) -> dict[str, bool]:
+        return {name: self.is_healthy(name) for name in self.clusters}
+
+    def _admit(self, name: str) -> bool:
+        health = self._health[name]
+        if health.opened_at is None:
+            return True
+        if health.probing or time.monotonic() - health.opened_at < self.cooldown:
+            return False
+        health.probing = True
+        return True
+
+    def _record(self, name: str, error: Optional[BaseException]) -> None:
+        health = self._health[name]
+        health.probing = False
+        if isinstance(error, asyncio.CancelledError):
+            return
+        if error is None or not isinstance(error, HOST_FAILURES):
+            health.failures = 0
+            health.opened_at = None
+            return
+        health.failures += 1
+        if health.failures >= self.failure_threshold or health.opened_at is not None:
+            health.opened_at = time.monotonic()
+
+    async def _tracked(self, name: str, fn: Callable[[SolusVMAPI], Awaitable[T]]) -> T:
+        try:
+            result = await fn(self.clusters[name])
+        except BaseException as e:
+            self._record(name, e)
+            raise
+        self._record(name, None)
+        return result
+
+    async def call(self, name: str, fn: Callable[[SolusVMAPI], Awaitable[T]]) -> T:
+        """Run `fn` against one cluster, tracking its health"""
+        if not self._admit(name):
+            raise ClusterUnavailable(f"cluster {name!r} is marked unhealthy")
+        return await self._tracked(name, fn)
+
+    # Fan-out
+    async def fan_out(
+        self,
+        fn: Callable[[SolusVMAPI], Awaitable[T]],
+        clusters: Optional[Iterable[str]] = None,
+    ) -> ClusterResult[T]:
+        """Run `fn` against every healthy cluster concurrently"""
+        result: ClusterResult[T] = ClusterResult()
+        names = []
+        for name in clusters if clusters is not None else self.clusters:
+            if self._admit(name):
+                names.append(name)
+            else:
+                result.skipped.append(name)
+
+        outcomes = await asyncio.gather(
+            *(self._tracked(name, fn) for name in names), return_exceptions=True
+        )
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, BaseException):
+                if isinstance(outcome, asyncio.CancelledError):
+                    raise outcome
+                result.errors[name] = outcome
+            else:
+                result.items.append(Tagged(name, outcome))
+        return result
+
+    async def _fan_out_list(
+        self, fn: Callable[[SolusVMAPI], Awaitable[list[T]]]
+    ) -> ClusterResult[T]:
+        per_cluster = await self.fan_out(fn)
+        return ClusterResult(
+            [
+                Tagged(tagged.cluster, value)
+                for tagged in per_cluster.items
+                for value in tagged.value
+            ],
+            per_cluster.errors,
+            per_cluster.skipped,
+        )
+
+    async def list_servers(self, per_page: int = 100) -> ClusterResult[Server]:
+        result = await self._fan_out_list(lambda api: api.list_servers(per_page))
+        for tagged in result.items:
+            self._remember(tagged.value.id, tagged.cluster)
+        return result
+
+    async def find_servers(
+        self, predicate: Callable[[Server], bool], per_page: int = 100
+    ) -> ClusterResult[Server]:
+        """Servers on every cluster for which `predicate` holds"""
+        result = await self.list_servers(per_page)
+        result.items = [t for t in result.items if predicate(t.value)]
+        return result
+
+    async def list_plans(self, per_page: int = 100) -> ClusterResult[SolusPlan]:
+        return await self._fan_out_list(lambda api: api.list_plans(per_page))
+
+    async def list_compute_resources(
+        self, per_page: int = 100
+    ) -> ClusterResult[ComputeResource]:
+        return await self._fan_out_list(
+            lambda api: api.list_compute_resources(per_page)
+        )
+
+    async def list_users(self, per_page: int = 100) -> ClusterResult[GeneralDict]:
+        return await self._fan_out_list(lambda api: api.list_users(per_page))
+
+    async def list_projects(self, per_page: int = 100) -> ClusterResult[GeneralDict]:
+        return await self._fan_out_list(lambda api: api.list_projects(per_page))
+
+    # Routing
+    def _remember(self, server_id: int, name: str) -> None:
+        if server_id in self._ambiguous:
+            self._ambiguous[server_id].add(name)
+            return
+        known = self._routes.get(server_id)
+        if known is None or known == name:
+            self._routes[server_id] = name
+            return
+        del self._routes[server_id]
+        self._ambiguous[server_id] = {known, name}
+
+    def forget(self, server_id: Optional[int] = None) -> None:
+        """Drop the cached route of one server id, or all of them"""
+        if server_id is None:
+            self._routes.clear()
+            self._ambiguous.clear()
+        else:
+            self._routes.pop(server_id, None)
+            self._ambiguous.pop(server_id, None)
+
+    def cluster_of(self, server_id: int) -> Optional[str]:
+        """The cached cluster of a server id, if known and unambiguous"""
+        return self._routes.get(server_id)
+
+    async def _locate(self, server_id: int) -> tuple[str, Server]:
+        """Ask every cluster for the id at once and cache where it lives"""
+        found = await self.fan_out(lambda api: api.retrieve_server(server_id))
+        for tagged in found.items:
+            self._remember(server_id, tagged.cluster)
+        if len(found.items) > 1:
+            clusters = ", ".join(sorted(t.cluster for t in found.items))
+            raise SolusAPIError(
+                f"server {server_id} exists on clusters {clusters}; pass cluster="
+            )
+        if found.items:
+            return found.items[0].cluster, found.items[0].value
+        errors = [e for e in found.errors.values() if not isinstance(e, NotFound)]
+        if errors:
+            raise errors[0]
+        if found.skipped:
+            raise ClusterUnavailable(
+                f"server {server_id} not found; skipped unhealthy clusters "
+                + ", ".join(found.skipped)
+            )
+        raise NotFound(f"server {server_id} not found on any cluster")
+
+    async def _resolve(self, server_id: int, cluster: Optional[str]) -> str:
+        if cluster is not None:
+            return cluster
+        if server_id in self._ambiguous:
+            clusters = ", ".join(sorted(self._ambiguous[server_id]))
+            raise SolusAPIError(
+                f"server {server_id} exists on clusters {clusters}; pass cluster="
+            )
+        name = self._routes.get(server_id)
+        if name is None:
+            name, _ = await self._locate(server_id)
+        return name
+
+    async def on_server(
+        self,
+        server_id: int,
+        fn: Callable[[SolusVMAPI], Awaitable[T]],
+        cluster: Optional[str] = None,
+        reroute: bool = False,
+    ) -> T:
+        """Run `fn` on the cluster owning `server_id`.
+
+        A cached route that turns out stale (404) is dropped. With `reroute`
+        the id is then looked up again and `fn` retried once; only pass it for
+        reads, since the same id on another cluster is a different server.
+        """
+        name = await self._resolve(server_id, cluster)
+        try:
+            return await self.call(name, fn)
+        except NotFound:
+            if cluster is not None or self._routes.get(server_id) != name:
+                raise
+            del self._routes[server_id]
+            if not reroute:
+                raise
+            name, _ = await self._locate(server_id)
+            return await self.call(name, fn)
+
+    async def retrieve_server(
+        self, server_id: int, cluster: Optional[str] = None
+    ) -> Tagged[Server]:
+        """The server, tagged with the cluster it came from"""
+        if cluster is None and server_id not in self._routes:
+            # The lookup fetches the server anyway; no second request needed.
+            if server_id not in self._ambiguous:
+                name, server = await self._locate(server_id)
+                return Tagged(name, server)
+        server = await self.on_server(
+            server_id, lambda api: api.retrieve_server(server_id), cluster, reroute=True
+        )
+        return Tagged(cluster or self._routes[server_id], server)
+
+    async def start_server(
+        self, server_id: int, force: bool = True, cluster: Optional[str] = None
+    ) -> GeneralDict:
+        return await self.on_server(
+            server_id, lambda api: api.start_server(server_id, force), cluster
+        )
+
+    async def stop_server(
+        self, server_id: int, force: bool = True, cluster: Optional[str] = None
+    ) -> GeneralDict:
+        return await self.on_server(
+            server_id, lambda api: api.stop_server(server_id, force), cluster
+        )
+
+    async def restart_server(
+        self, server_id: int, force: bool = True, cluster: Optional[str] = None
+    ) -> GeneralDict:
+        return await self.on_server(
+            server_id, lambda api: api.restart_server(server_id, force), cluster
+        )
+
+    async def suspend_server(
+        self, server_id: int, cluster: Optional[str] = None
+    ) -> GeneralDict:
+        return await self.on_server(
+            server_id, lambda api: api.suspend_server(server_id), cluster
+        )
+
+    async def resume_server(
+        self, server_id: int, cluster: Optional[str] = None
+    ) -> GeneralDict:
+        return await self.on_server(
+            server_id, lambda api: api.resume_server(server_id), cluster
+        )
+
+    async def delete_server(
+        self, server_id: int, cluster: Optional[str] = None
+    ) -> GeneralDict:
+        result = await self.on_server(
+            server_id, lambda api: api.delete_server(server_id), cluster
+        )
+        if cluster is None:
+            self._routes.pop(server_id, None)
+        return result
+
+    async def wait_until_ready(
+        self,
+        server_id: int,
+        timeout: Optional[float] = None,
+        cluster: Optional[str] = None,
+    ) -> Server:
+        return await self.on_server(
+            server_id,
+            lambda api: api.wait_until_ready(server_id, timeout),
+            cluster,
+            reroute=True,
+        )
@@ -0,0 +1,78 @@
+import json
+from typing import Any, Callable, Optional, Protocol
+
+__all__ = ["JSONCodec", "StdlibCodec", "OrjsonCodec", "MsgspecCodec", "get_codec"]
+
+
+class JSONCodec(Protocol):
+    """Encodes request bodies and decodes response bodies"""
+
+    name: str
+
+    def dumps(self, obj: Any) -> bytes: ...
+
+    def loads(self, data: bytes | str) -> Any: ...
+
+
+class StdlibCodec:
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec:
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._decoder.decode(data)
+
+
+_CODECS: dict[str, Callable[[], JSONCodec]] = {
+    "msgspec": MsgspecCodec,
+    "orjson": OrjsonCodec,
+    "json": StdlibCodec,
+}
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """Return the codec called `name`, or the fastest one installed.
+
+    Without a name, msgspec is preferred over orjson, with the stdlib `json`
+    module as the fallback that is always available.
+    """
+    if name is not None:
+        return _CODECS[name]()
+    for factory in _CODECS.values():
+        try:
+            return factory()
+        except ImportError:
+            continue
+    return StdlibCodec()
@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import aiohttp
+
+__all__ = ["PoolConfig"]
+
+
+@dataclass
+class PoolConfig:
+    """Connection pool and timeout settings for the client's HTTP transport.
+
+    `limit` caps open sockets overall and `limit_per_host` toward the panel
+    (0 means no cap). Timeouts are in seconds; `None` disables one.
+    """
+
+    limit: int = 100
+    limit_per_host: int = 0
+    keepalive_timeout: float = 15.0
+    force_close: bool = False
+    use_dns_cache: bool = True
+    ttl_dns_cache: Optional[int] = 10
+    enable_cleanup_closed: bool = False
+    total_timeout: Optional[float] = 300.0
+    connect_timeout: Optional[float] = None
+    sock_connect_timeout: Optional[float] = None
+    sock_read_timeout: Optional[float] = None
+
+    def connector(self, ssl: Any = None) -> aiohttp.TCPConnector:
+        kwargs: dict[str, Any] = {}
+        # aiohttp refuses a keep-alive timeout together with force_close.
+        if not self.force_close:
+            kwargs["keepalive_timeout"] = self.keepalive_timeout
+        return aiohttp.TCPConnector(
+            ssl=ssl,
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            force_close=self.force_close,
+            use_dns_cache=self.use_dns_cache,
+            ttl_dns_cache=self.ttl_dns_cache,
+            enable_cleanup_closed=self.enable_cleanup_closed,
+            **kwargs,
+        )
+
+    def timeout(self) -> aiohttp.ClientTimeout:
+        return aiohttp.ClientTimeout(
+            total=self.total_timeout,
+            connect=self.connect_timeout,
+            sock_connect=self.sock_connect_timeout,
+            sock_read=self.sock_read_timeout,
+        )
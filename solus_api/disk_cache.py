@@ -0,0 +1,160 @@
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import TYPE_CHECKING, Callable, Optional, TypeVar
+
+from .models.plan import SolusPlan
+from .models.resouce import ComputeResource
+from .types import GeneralDict
+
+if TYPE_CHECKING:
+    from .client import SolusVMAPI
+
+__all__ = ["DiskCatalogCache"]
+
+T = TypeVar("T")
+
+# Bump when the stored layout changes; rows written by other versions are ignored.
+SCHEMA_VERSION = 1
+
+# Catalog name -> (API path, endpoint name)
+CATALOGS: dict[str, tuple[str, str]] = {
+    "plans": ("/plans", "list_plans"),
+    "compute_resources": ("/compute_resources", "list_compute_resources"),
+    "projects": ("/projects", "list_projects"),
+}
+
+
+class DiskCatalogCache:
+    """Persistent sqlite cache of near-static catalogs for fast cold starts.
+
+    A fresh process answers `get_plans()` & co. straight from the file. When
+    the stored copy is older than `ttl` seconds it is still served, and a
+    refresh runs in the background; only a missing catalog waits on the API.
+    Each catalog row carries a `version` that grows with every refresh. Rows
+    are keyed by panel URL, so several clients can share one file.
+    """
+
+    def __init__(
+        self,
+        client: "SolusVMAPI",
+        path: str | os.PathLike[str],
+        ttl: float = 3600.0,
+        per_page: int = 100,
+    ) -> None:
+        self._client = client
+        self.path = os.fspath(path)
+        self.ttl = ttl
+        self.per_page = per_page
+        self._host = client._base_url
+        self._memory: dict[str, tuple[int, float, list[GeneralDict]]] = {}
+        self._refreshing: dict[str, asyncio.Task[list[GeneralDict]]] = {}
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=10)
+
+    def _init_db(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as db, db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS catalogs ("
+                " host TEXT NOT NULL, name TEXT NOT NULL, schema INTEGER NOT NULL,"
+                " version INTEGER NOT NULL, fetched_at REAL NOT NULL,"
+                " payload TEXT NOT NULL, PRIMARY KEY (host, name))"
+            )
+
+    def _load(self, name: str) -> Optional[tuple[int, float, list[GeneralDict]]]:
+        with closing(self._connect()) as db, db:
+            row = db.execute(
+                "SELECT version, fetched_at, payload FROM catalogs"
+                " WHERE host = ? AND name = ? AND schema = ?",
+                (self._host, name, SCHEMA_VERSION),
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], row[1], json.loads(row[2])
+
+    def _store(self, name: str, fetched_at: float, items: list[GeneralDict]) -> int:
+        payload = json.dumps(items, separators=(",", ":"))
+        with closing(self._connect()) as db, db:
+            row = db.execute(
+                "SELECT version FROM catalogs WHERE host = ? AND name = ?",
+                (self._host, name),
+            ).fetchone()
+            version = (row[0] if row else 0) + 1
+            db.execute(
+                "INSERT OR REPLACE INTO catalogs VALUES (?, ?, ?, ?, ?, ?)",
+                (self._host, name, SCHEMA_VERSION, version, fetched_at, payload),
+            )
+        return version
+
+    def version(self, name: str) -> Optional[int]:
+        """Version of the catalog currently served, if one is loaded"""
+        cached = self._memory.get(name)
+        return cached[0] if cached else None
+
+    async def refresh(self, name: str) -> list[GeneralDict]:
+        """Fetch one catalog from the API now and persist it"""
+        path, endpoint = CATALOGS[name]
+        items: list[GeneralDict] = []
+        async for page in self._client.iter_pages(path, endpoint, self.per_page, 2):
+            items.extend(page)
+        fetched_at = time.time()
+        version = await asyncio.to_thread(self._store, name, fetched_at, items)
+        self._memory[name] = (version, fetched_at, items)
+        return items
+
+    def _refresh_in_background(self, name: str) -> "asyncio.Task[list[GeneralDict]]":
+        task = self._refreshing.get(name)
+        if task is None or task.done():
+            task = self._refreshing[name] = asyncio.ensure_future(self.refresh(name))
+            # A failed background refresh keeps serving the old copy.
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return task
+
+    async def _get(self, name: str) -> list[GeneralDict]:
+        cached = self._memory.get(name)
+        if cached is None:
+            cached = await asyncio.to_thread(self._load, name)
+            if cached is not None:
+                self._memory[name] = cached
+        if cached is None:
+            return await asyncio.shield(self._refresh_in_background(name))
+        if time.time() - cached[1] > self.ttl:
+            self._refresh_in_background(name)
+        return cached[2]
+
+    async def _get_models(
+        self, name: str, build: Callable[[GeneralDict], T]
+    ) -> list[T]:
+        return [build(item) for item in await self._get(name)]
+
+    async def get_plans(self) -> list[SolusPlan]:
+        return await self._get_models("plans", SolusPlan)
+
+    async def get_compute_resources(self) -> list[ComputeResource]:
+        return await self._get_models("compute_resources", ComputeResource)
+
+    async def get_projects(self) -> list[GeneralDict]:
+        return await self._get("projects")
+
+    async def warm(self) -> None:
+        """Load every catalog, from disk where possible"""
+        await asyncio.gather(*(self._get(name) for name in CATALOGS))
+
+    async def close(self) -> None:
+        """Wait for background refreshes to finish"""
+        tasks = [t for t in self._refreshing.values() if not t.done()]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def clear(self) -> None:
+        self._memory.clear()
+        with closing(self._connect()) as db, db:
+            db.execute("DELETE FROM catalogs WHERE host = ?", (self._host,))
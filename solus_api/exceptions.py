@@ -4,3 +4,11 @@ class SolusAPIError(Exception):
 
 class NotFound(SolusAPIError):
     """When an item is not found. 404"""
+
+
+class RateLimited(SolusAPIError):
+    """When the panel rejects a request for exceeding its rate limit. 429"""
+
+
+class ServerError(SolusAPIError):
+    """When the panel fails to handle a request. 5xx"""
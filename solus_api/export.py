@@ -0,0 +1,236 @@
+import asyncio
+import csv
+import io
+import os
+from operator import attrgetter
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    Callable,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from .codec import JSONCodec, get_codec
+from .models.server import Server
+
+if TYPE_CHECKING:
+    from .client import SolusVMAPI
+
+__all__ = ["DEFAULT_SERVER_FIELDS", "SERVER_FIELDS", "export_items", "export_servers"]
+
+DEFAULT_BUFFER_SIZE = 1 << 16
+FORMATS = ("ndjson", "csv")
+
+Target = Union[str, "os.PathLike[str]", IO[bytes]]
+
+
+def _primary_ip(server: Server) -> Optional[str]:
+    ips = server.ips
+    for ip in ips:
+        if ip.is_primary:
+            return ip.ip
+    return ips[0].ip if ips else None
+
+
+def _created_at_ts(server: Server) -> Optional[int]:
+    try:
+        return server.created_at_ts
+    except ValueError:
+        return None
+
+
+SERVER_FIELDS: dict[str, Callable[[Server], Any]] = {
+    "id": attrgetter("id"),
+    "name": attrgetter("name"),
+    "uuid": attrgetter("uuid"),
+    "status": attrgetter("status"),
+    "real_status": attrgetter("real_status"),
+    "primary_ip": _primary_ip,
+    "plan_id": attrgetter("plan.id"),
+    "plan": attrgetter("plan.name"),
+    "location_id": attrgetter("location.id"),
+    "location": attrgetter("location.name"),
+    "compute_resource_id": attrgetter("compute_resource.id"),
+    "user_id": attrgetter("user.id"),
+    "project_id": attrgetter("project.id"),
+    "is_suspended": attrgetter("is_suspended"),
+    "created_at": attrgetter("created_at"),
+    "created_at_ts": _created_at_ts,
+}
+DEFAULT_SERVER_FIELDS = (
+    "id",
+    "name",
+    "status",
+    "primary_ip",
+    "plan_id",
+    "location",
+    "created_at_ts",
+)
+
+
+def _getters(
+    fields: Sequence[str], named: dict[str, Callable[[Any], Any]]
+) -> list[Callable[[Any], Any]]:
+    """A getter per field: a named column, else a dotted attribute path"""
+    return [named.get(field) or attrgetter(field) for field in fields]
+
+
+class _ChunkWriter:
+    """Buffers encoded rows and hands full chunks to a background writer.
+
+    At most `depth` chunks wait for the disk, so memory is bounded by the
+    buffer size, and file writes run in a thread while the next rows are
+    fetched and encoded.
+    """
+
+    def __init__(self, file: IO[bytes], buffer_size: int, depth: int = 2) -> None:
+        self._file = file
+        self._buffer_size = buffer_size
+        self._parts: list[bytes] = []
+        self._size = 0
+        self._queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue(depth)
+        self._task = asyncio.ensure_future(self._drain())
+
+    async def _drain(self) -> None:
+        while (chunk := await self._queue.get()) is not None:
+            await asyncio.to_thread(self._file.write, chunk)
+
+    async def _put(self, chunk: Optional[bytes]) -> None:
+        # Surface a failed write instead of blocking on a full queue forever.
+        put = asyncio.ensure_future(self._queue.put(chunk))
+        await asyncio.wait({put, self._task}, return_when=asyncio.FIRST_COMPLETED)
+        if self._task.done() and not put.done():
+            put.cancel()
+        if self._task.done() and self._task.exception() is not None:
+            raise self._task.exception()  # type: ignore[misc]
+
+    async def write(self, data: bytes) -> None:
+        self._parts.append(data)
+        self._size += len(data)
+        if self._size >= self._buffer_size:
+            await self._flush()
+
+    async def _flush(self) -> None:
+        if self._parts:
+            chunk = b"".join(self._parts)
+            self._parts.clear()
+            self._size = 0
+            await self._put(chunk)
+
+    async def close(self) -> None:
+        await self._flush()
+        await self._put(None)
+        await self._task
+        await asyncio.to_thread(self._file.flush)
+
+    async def abort(self) -> None:
+        self._task.cancel()
+        try:
+            await self._task
+        except (asyncio.CancelledError, Exception):
+            pass
+
+
+class _CsvEncoder:
+    def __init__(self, codec: JSONCodec) -> None:
+        self._codec = codec
+        self._text = io.StringIO()
+        self._writer = csv.writer(self._text)
+
+    def _cell(self, value: Any) -> Any:
+        if value is None:
+            return ""
+        if isinstance(value, (dict, list)):
+            return self._codec.dumps(value).decode()
+        return value
+
+    def __call__(self, row: Sequence[Any]) -> bytes:
+        self._writer.writerow([self._cell(value) for value in row])
+        line = self._text.getvalue()
+        self._text.seek(0)
+        self._text.truncate()
+        return line.encode()
+
+
+async def export_items(
+    items: AsyncIterable[Any],
+    target: Target,
+    fields: Sequence[str],
+    format: str = "ndjson",
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    codec: Optional[JSONCodec] = None,
+    named_fields: Optional[dict[str, Callable[[Any], Any]]] = None,
+) -> int:
+    """Write `fields` of every item to `target` as NDJSON or CSV.
+
+    `target` is a path or a binary file object. Fields are looked up in
+    `named_fields` first and otherwise read as dotted attribute paths
+    (`"plan.name"`). Rows are encoded as the items arrive and written in
+    chunks of about `buffer_size` bytes, so only a chunk or two is held
+    in memory whatever the number of items. CSV output starts with a header
+    row. Returns the number of rows written.
+    """
+    if format not in FORMATS:
+        raise ValueError(f"unknown export format {format!r}")
+    codec = codec or get_codec()
+    getters = _getters(fields, named_fields or {})
+    names = list(fields)
+
+    if isinstance(target, (str, os.PathLike)):
+        file: IO[bytes] = await asyncio.to_thread(open, target, "wb")
+        owned = True
+    else:
+        file, owned = target, False
+
+    writer = _ChunkWriter(file, buffer_size)
+    count = 0
+    try:
+        if format == "csv":
+            encode = _CsvEncoder(codec)
+            await writer.write(encode(names))
+            async for item in items:
+                await writer.write(encode([get(item) for get in getters]))
+                count += 1
+        else:
+            async for item in items:
+                row = {name: get(item) for name, get in zip(names, getters)}
+                await writer.write(codec.dumps(row) + b"\n")
+                count += 1
+        await writer.close()
+    except BaseException:
+        await writer.abort()
+        raise
+    finally:
+        if owned:
+            await asyncio.to_thread(file.close)
+    return count
+
+
+async def export_servers(
+    client: "SolusVMAPI",
+    target: Target,
+    fields: Sequence[str] = DEFAULT_SERVER_FIELDS,
+    format: str = "ndjson",
+    per_page: int = 100,
+    prefetch: int = 0,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> int:
+    """Export every server of the panel, see `export_items`.
+
+    Servers come from `stream_servers`, which holds a single server in
+    memory at a time. With `prefetch`, `iter_servers` is used instead,
+    fetching that many pages ahead at the cost of holding them.
+    `SERVER_FIELDS` lists the named fields besides attribute paths.
+    """
+    servers = (
+        client.iter_servers(per_page, prefetch)
+        if prefetch
+        else client.stream_servers(per_page)
+    )
+    return await export_items(
+        servers, target, fields, format, buffer_size, named_fields=SERVER_FIELDS
+    )
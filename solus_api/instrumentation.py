@@ -0,0 +1,312 @@
+import bisect
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, Callable, Iterable, Optional, Protocol
+
+import aiohttp
+
+__all__ = [
+    "CallbackSink",
+    "HistogramSink",
+    "Instrumentation",
+    "RequestMetrics",
+    "render_prometheus",
+]
+
+# Phases recorded for every HTTP attempt, in RequestMetrics attribute order.
+NETWORK_PHASES = ("queued", "dns", "connect", "ttfb", "body", "total")
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+@dataclass
+class RequestMetrics:
+    """Timings (seconds) and sizes of one HTTP attempt.
+
+    `queued` is the wait for a free pool connection, `dns` and `connect` are
+    only set when a new connection had to be opened, `ttfb` runs from sending
+    the request to receiving the response headers and `body` is the body read.
+    """
+
+    endpoint: str
+    method: str
+    path: str
+    attempt: int = 1
+    status: Optional[int] = None
+    error: Optional[str] = None
+    request_bytes: int = 0
+    response_bytes: int = 0
+    queued: Optional[float] = None
+    dns: Optional[float] = None
+    connect: Optional[float] = None
+    ttfb: Optional[float] = None
+    body: Optional[float] = None
+    total: Optional[float] = None
+
+
+class Sink(Protocol):
+    def on_request(self, metrics: RequestMetrics) -> None: ...
+
+    def on_timing(self, endpoint: str, phase: str, seconds: float) -> None: ...
+
+
+class CallbackSink:
+    """Forwards every observation to plain callables"""
+
+    def __init__(
+        self,
+        on_request: Optional[Callable[[RequestMetrics], None]] = None,
+        on_timing: Optional[Callable[[str, str, float], None]] = None,
+    ) -> None:
+        self._on_request = on_request
+        self._on_timing = on_timing
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        if self._on_request is not None:
+            self._on_request(metrics)
+
+    def on_timing(self, endpoint: str, phase: str, seconds: float) -> None:
+        if self._on_timing is not None:
+            self._on_timing(endpoint, phase, seconds)
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class HistogramSink:
+    """In-memory latency histograms per endpoint and phase.
+
+    Network phases come from each HTTP attempt; `decode` and `build` from the
+    JSON decode and model construction. Status codes and payload sizes are
+    counted per endpoint.
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._histograms: dict[tuple[str, str], _Histogram] = {}
+        self._statuses: dict[tuple[str, str], int] = {}
+        self._bytes: dict[tuple[str, str], int] = {}
+
+    def _observe(self, endpoint: str, phase: str, seconds: float) -> None:
+        key = (endpoint, phase)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = _Histogram(self.buckets)
+        histogram.observe(seconds)
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        for phase in NETWORK_PHASES:
+            value = getattr(metrics, phase)
+            if value is not None:
+                self._observe(metrics.endpoint, phase, value)
+        status = str(metrics.status) if metrics.status is not None else "error"
+        key = (metrics.endpoint, status)
+        self._statuses[key] = self._statuses.get(key, 0) + 1
+        for direction, size in (
+            ("request", metrics.request_bytes),
+            ("response", metrics.response_bytes),
+        ):
+            key = (metrics.endpoint, direction)
+            self._bytes[key] = self._bytes.get(key, 0) + size
+
+    def on_timing(self, endpoint: str, phase: str, seconds: float) -> None:
+        self._observe(endpoint, phase, seconds)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Copy of everything recorded so far, keyed by endpoint"""
+        result: dict[str, Any] = {}
+        for (endpoint, phase), h in self._histograms.items():
+            entry = result.setdefault(endpoint, {"phases": {}, "statuses": {}})
+            cumulative, running = [], 0
+            for count in h.counts:
+                running += count
+                cumulative.append(running)
+            entry["phases"][phase] = {
+                "count": h.count,
+                "sum": h.sum,
+                "buckets": dict(zip([*h.buckets, float("inf")], cumulative)),
+            }
+        for (endpoint, status), count in self._statuses.items():
+            entry = result.setdefault(endpoint, {"phases": {}, "statuses": {}})
+            entry["statuses"][status] = count
+        for (endpoint, direction), size in self._bytes.items():
+            entry = result.setdefault(endpoint, {"phases": {}, "statuses": {}})
+            entry[f"{direction}_bytes"] = size
+        return result
+
+    def reset(self) -> None:
+        self._histograms.clear()
+        self._statuses.clear()
+        self._bytes.clear()
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _le(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+
+def render_prometheus(sink: HistogramSink, prefix: str = "solus_api") -> str:
+    """Render a `HistogramSink` in the Prometheus text exposition format"""
+    snapshot = sink.snapshot()
+    lines = [
+        f"# HELP {prefix}_phase_seconds Time spent per endpoint and request phase.",
+        f"# TYPE {prefix}_phase_seconds histogram",
+    ]
+    for endpoint, entry in sorted(snapshot.items()):
+        for phase, h in sorted(entry["phases"].items()):
+            labels = f'endpoint="{_label(endpoint)}",phase="{phase}"'
+            for bound, count in h["buckets"].items():
+                lines.append(
+                    f'{prefix}_phase_seconds_bucket{{{labels},le="{_le(bound)}"}} {count}'
+                )
+            lines.append(f"{prefix}_phase_seconds_sum{{{labels}}} {h['sum']!r}")
+            lines.append(f"{prefix}_phase_seconds_count{{{labels}}} {h['count']}")
+
+    lines += [
+        f"# HELP {prefix}_responses_total HTTP responses per endpoint and status.",
+        f"# TYPE {prefix}_responses_total counter",
+    ]
+    for endpoint, entry in sorted(snapshot.items()):
+        for status, count in sorted(entry["statuses"].items()):
+            lines.append(
+                f'{prefix}_responses_total{{endpoint="{_label(endpoint)}",'
+                f'status="{status}"}} {count}'
+            )
+
+    for direction in ("request", "response"):
+        name = f"{prefix}_{direction}_bytes_total"
+        lines += [
+            f"# HELP {name} Payload bytes per endpoint.",
+            f"# TYPE {name} counter",
+        ]
+        for endpoint, entry in sorted(snapshot.items()):
+            if f"{direction}_bytes" in entry:
+                lines.append(
+                    f'{name}{{endpoint="{_label(endpoint)}"}} '
+                    f"{entry[f'{direction}_bytes']}"
+                )
+    return "\n".join(lines) + "\n"
+
+
+class Instrumentation:
+    """Collects per-endpoint timings from `SolusVMAPI` and fans them out to sinks.
+
+    Network phases are captured through an aiohttp `TraceConfig`; the client
+    adds the body read, JSON decode and model construction around it.
+    """
+
+    def __init__(self, *sinks: Sink) -> None:
+        self.sinks: list[Sink] = list(sinks)
+
+    def add_sink(self, sink: Sink) -> None:
+        self.sinks.append(sink)
+
+    def start(
+        self, endpoint: str, method: str, path: str, attempt: int, request_bytes: int
+    ) -> RequestMetrics:
+        return RequestMetrics(
+            endpoint=endpoint,
+            method=method,
+            path=path,
+            attempt=attempt,
+            request_bytes=request_bytes,
+        )
+
+    def finish(self, metrics: RequestMetrics) -> None:
+        for sink in self.sinks:
+            sink.on_request(metrics)
+
+    def timing(self, endpoint: str, phase: str, seconds: float) -> None:
+        for sink in self.sinks:
+            sink.on_timing(endpoint, phase, seconds)
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        config = aiohttp.TraceConfig()
+
+        def metrics_of(ctx: SimpleNamespace) -> Optional[RequestMetrics]:
+            metrics = ctx.trace_request_ctx
+            return metrics if isinstance(metrics, RequestMetrics) else None
+
+        async def on_headers_sent(_: Any, ctx: SimpleNamespace, __: Any) -> None:
+            # Fired once a connection is held and the request is on the wire,
+            # so pool waits, DNS and connects stay out of `ttfb`.
+            ctx.sent_at = time.perf_counter()
+
+        async def on_queued_start(_: Any, ctx: SimpleNamespace, __: Any) -> None:
+            ctx.queued_at = time.perf_counter()
+
+        async def on_queued_end(_: Any, ctx: SimpleNamespace, __: Any) -> None:
+            metrics = metrics_of(ctx)
+            if metrics is not None:
+                metrics.queued = time.perf_counter() - ctx.queued_at
+
+        async def on_dns_start(_: Any, ctx: SimpleNamespace, __: Any) -> None:
+            ctx.dns_at = time.perf_counter()
+
+        async def on_dns_end(_: Any, ctx: SimpleNamespace, __: Any) -> None:
+            metrics = metrics_of(ctx)
+            if metrics is not None:
+                metrics.dns = time.perf_counter() - ctx.dns_at
+
+        async def on_connect_start(_: Any, ctx: SimpleNamespace, __: Any) -> None:
+            ctx.connect_at = time.perf_counter()
+
+        async def on_connect_end(_: Any, ctx: SimpleNamespace, __: Any) -> None:
+            metrics = metrics_of(ctx)
+            if metrics is not None:
+                metrics.connect = time.perf_counter() - ctx.connect_at
+
+        async def on_request_end(_: Any, ctx: SimpleNamespace, __: Any) -> None:
+            metrics = metrics_of(ctx)
+            if metrics is not None:
+                sent_at = getattr(ctx, "sent_at", None)
+                if sent_at is not None:
+                    metrics.ttfb = time.perf_counter() - sent_at
+
+        async def on_request_exception(
+            _: Any, ctx: SimpleNamespace, params: Any
+        ) -> None:
+            metrics = metrics_of(ctx)
+            if metrics is not None:
+                metrics.error = type(params.exception).__name__
+
+        config.on_request_headers_sent.append(on_headers_sent)
+        config.on_connection_queued_start.append(on_queued_start)
+        config.on_connection_queued_end.append(on_queued_end)
+        config.on_dns_resolvehost_start.append(on_dns_start)
+        config.on_dns_resolvehost_end.append(on_dns_end)
+        config.on_connection_create_start.append(on_connect_start)
+        config.on_connection_create_end.append(on_connect_end)
+        config.on_request_end.append(on_request_end)
+        config.on_request_exception.append(on_request_exception)
+        return config
@@ -0,0 +1,260 @@
+import asyncio
+import bisect
+import ipaddress
+from typing import (
+    TYPE_CHECKING,
+    Generic,
+    Hashable,
+    Iterable,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from .models.ip_block import IpBlock
+from .models.resouce import ComputeResource
+from .models.server import Ip, Server
+
+if TYPE_CHECKING:
+    from .client import SolusVMAPI
+    from .mirror import FleetMirror
+
+__all__ = ["IpIndex"]
+
+T = TypeVar("T")
+
+Address = Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
+# (IP version, integer value): orders v4 before v6 and never mixes them.
+Point = tuple[int, int]
+
+
+def _address(value: Union[str, Address]) -> Optional[Address]:
+    if not isinstance(value, str):
+        return value
+    try:
+        return ipaddress.ip_address(value.strip())
+    except ValueError:
+        return None
+
+
+def _point(address: Address) -> Point:
+    return (address.version, int(address))
+
+
+def _domain(value: str) -> str:
+    return value.strip().rstrip(".").lower()
+
+
+def block_range(block: IpBlock) -> Optional[tuple[Point, Point]]:
+    """First and last address of a block, from `from`/`to` or gateway/subnet"""
+    first, last = _address(block.from_ or ""), _address(block.to or "")
+    if first is not None and last is not None and first.version == last.version:
+        return _point(first), _point(last)
+    if block.gateway and block.subnet:
+        try:
+            network = ipaddress.ip_network(
+                f"{block.gateway}/{block.subnet}", strict=False
+            )
+        except ValueError:
+            return None
+        return _point(network[0]), _point(network[-1])
+    return None
+
+
+class _RangeIndex(Generic[T]):
+    """Address ranges sorted by start, for "which range holds this address".
+
+    Alongside the starts it keeps the running maximum of the ends, so a
+    lookup is a bisect followed by a walk back that stops as soon as no
+    earlier range can reach the address. Changes only mark the index dirty;
+    it is re-sorted on the next lookup.
+    """
+
+    __slots__ = ("_ranges", "_starts", "_entries", "_reach", "_dirty")
+
+    def __init__(self) -> None:
+        self._ranges: dict[Hashable, tuple[Point, Point, T]] = {}
+        self._starts: list[Point] = []
+        self._entries: list[tuple[Point, Point, T]] = []
+        self._reach: list[Point] = []
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def add(
+        self, key: Hashable, first: Point, last: Point, value: T, replace: bool = True
+    ) -> None:
+        if not replace and key in self._ranges:
+            return
+        self._ranges[key] = (first, last, value)
+        self._dirty = True
+
+    def discard(self, key: Hashable) -> None:
+        if self._ranges.pop(key, None) is not None:
+            self._dirty = True
+
+    def _rebuild(self) -> None:
+        self._entries = sorted(self._ranges.values(), key=lambda e: e[:2])
+        self._starts = [entry[0] for entry in self._entries]
+        self._reach = []
+        reach: Optional[Point] = None
+        for _, last, _ in self._entries:
+            reach = last if reach is None or last > reach else reach
+            self._reach.append(reach)
+        self._dirty = False
+
+    def find(self, point: Point) -> Optional[T]:
+        """The narrowest-starting range containing `point`"""
+        if self._dirty:
+            self._rebuild()
+        i = bisect.bisect_right(self._starts, point) - 1
+        while i >= 0 and self._reach[i] >= point:
+            first, last, value = self._entries[i]
+            if last >= point:
+                return value
+            i -= 1
+        return None
+
+
+class IpIndex:
+    """Fleet-wide lookups by IP address and reverse-DNS domain.
+
+    - `server_for(ip)`: exact address -> server from a dict, falling back to
+      ranges assigned to a server (e.g. an IPv6 /64 in `ip_addresses`);
+    - `block_for(ip)`: the `IpBlock` whose `from`/`to` range holds an address,
+      from the blocks of compute resources and server IPs;
+    - `ips_for_domain(domain)`: addresses whose reverse DNS is `domain`.
+
+    Servers are added, replaced and removed one at a time, so the index can
+    follow a `FleetMirror` instead of being rebuilt.
+    """
+
+    def __init__(self) -> None:
+        self._servers: dict[int, Server] = {}
+        self._by_ip: dict[Address, int] = {}
+        self._server_ranges: _RangeIndex[int] = _RangeIndex()
+        self._blocks: _RangeIndex[IpBlock] = _RangeIndex()
+        self._by_domain: dict[str, dict[Address, int]] = {}
+        # What each server contributed, so it can be taken out again.
+        self._owned: dict[int, tuple[list[Address], list[str], list[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._servers)
+
+    def __contains__(self, ip: object) -> bool:
+        return isinstance(ip, str) and self.server_for(ip) is not None
+
+    @classmethod
+    async def build(cls, client: "SolusVMAPI", per_page: int = 100) -> "IpIndex":
+        """Index every server and compute resource of a panel"""
+        index = cls()
+        servers, resources = await asyncio.gather(
+            client.list_servers(per_page), client.list_compute_resources(per_page)
+        )
+        index.add_compute_resources(resources)
+        for server in servers:
+            index.add_server(server)
+        return index
+
+    # Updates
+    def add_blocks(self, blocks: Iterable[IpBlock], replace: bool = True) -> None:
+        """Index blocks by their range; `replace=False` keeps blocks already known"""
+        for block in blocks:
+            bounds = block_range(block)
+            if bounds is not None:
+                self._blocks.add(
+                    block.id or bounds, bounds[0], bounds[1], block, replace
+                )
+
+    def add_compute_resources(self, resources: Iterable[ComputeResource]) -> None:
+        for resource in resources:
+            self.add_blocks(resource.ip_blocks)
+
+    def _server_ips(self, server: Server) -> Iterable[Ip]:
+        yield from server.ips
+        for ips in server.ip_addresses.values():
+            yield from ips
+
+    def add_server(self, server: Server) -> None:
+        """Index `server`, replacing what was indexed for its id before"""
+        self.remove_server(server.id)
+        self._servers[server.id] = server
+        addresses: list[Address] = []
+        ranges: list[str] = []
+        domains: list[str] = []
+        for ip in self._server_ips(server):
+            address = _address(ip.ip)
+            if address is None:
+                try:
+                    network = ipaddress.ip_network(ip.ip.strip(), strict=False)
+                except ValueError:
+                    continue
+                key = (server.id, str(network))
+                self._server_ranges.add(
+                    key, _point(network[0]), _point(network[-1]), server.id
+                )
+                ranges.append(str(network))
+                continue
+            if address in self._by_ip and self._by_ip[address] == server.id:
+                continue
+            self._by_ip[address] = server.id
+            addresses.append(address)
+            # Blocks embedded in server IPs only fill gaps, so that server
+            # updates do not force the block ranges to be re-sorted.
+            self.add_blocks([ip.ip_block], replace=False)
+            for rdns in ip.reverse_dns:
+                if rdns.domain:
+                    domain = _domain(rdns.domain)
+                    self._by_domain.setdefault(domain, {})[address] = server.id
+                    domains.append(domain)
+        self._owned[server.id] = (addresses, ranges, domains)
+
+    def remove_server(self, server_id: int) -> None:
+        self._servers.pop(server_id, None)
+        owned = self._owned.pop(server_id, None)
+        if owned is None:
+            return
+        addresses, ranges, domains = owned
+        for address in addresses:
+            if self._by_ip.get(address) == server_id:
+                del self._by_ip[address]
+        for network in ranges:
+            self._server_ranges.discard((server_id, network))
+        for domain in domains:
+            entries = self._by_domain.get(domain, {})
+            for address in [a for a, sid in entries.items() if sid == server_id]:
+                del entries[address]
+            if not entries:
+                self._by_domain.pop(domain, None)
+
+    async def follow(self, mirror: "FleetMirror") -> None:
+        """Apply every event of `mirror` as it comes; run it as a task"""
+        for server in mirror:
+            self.add_server(server)
+        async for event in mirror.watch():
+            if event.kind == "removed":
+                self.remove_server(event.server_id)
+            elif event.server is not None:
+                self.add_server(event.server)
+
+    # Lookups
+    def server_for(self, ip: Union[str, Address]) -> Optional[Server]:
+        address = _address(ip)
+        if address is None:
+            return None
+        server_id = self._by_ip.get(address)
+        if server_id is None:
+            server_id = self._server_ranges.find(_point(address))
+        return self._servers.get(server_id) if server_id is not None else None
+
+    def block_for(self, ip: Union[str, Address]) -> Optional[IpBlock]:
+        address = _address(ip)
+        return self._blocks.find(_point(address)) if address is not None else None
+
+    def ips_for_domain(self, domain: str) -> list[str]:
+        return [str(address) for address in self._by_domain.get(_domain(domain), {})]
+
+    def servers_for_domain(self, domain: str) -> list[Server]:
+        ids = dict.fromkeys(self._by_domain.get(_domain(domain), {}).values())
+        return [self._servers[sid] for sid in ids if sid in self._servers]
@@ -0,0 +1,173 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterable, Iterator, Optional
+
+from .codec import get_codec
+from .models._lazy import shared_sections
+from .models.server import Server
+from .types import GeneralDict
+
+if TYPE_CHECKING:
+    from .client import SolusVMAPI
+
+__all__ = ["FleetEvent", "FleetMirror"]
+
+WATCHED_FIELDS = ("status", "real_status", "is_suspended", "is_processing", "progress")
+
+
+@dataclass
+class FleetEvent:
+    """A difference between two refreshes of a `FleetMirror`.
+
+    `kind` is `"added"`, `"changed"` or `"removed"`. For changes, `changes`
+    maps each watched field that moved to its `(old, new)` values; it is empty
+    when only unwatched parts of the payload differ.
+    """
+
+    kind: str
+    server_id: int
+    server: Optional[Server] = None
+    previous: Optional[Server] = None
+    changes: dict[str, tuple[Any, Any]] = field(default_factory=dict)
+
+
+class _Entry:
+    __slots__ = ("digest", "server")
+
+    def __init__(self, digest: int, server: Server) -> None:
+        self.digest = digest
+        self.server = server
+
+
+class FleetMirror:
+    """Local id-keyed copy of every server, refreshed incrementally.
+
+    Each refresh walks the `/servers` listing and compares a hash of every
+    raw payload with the one stored for its server; only servers whose
+    payload changed are rebuilt, and payloads are not kept. Keys in
+    `ignore_keys` (by default the constantly moving `usage`) are left out of
+    the hash, so they alone never count as a change. The store is swapped and
+    events are published only once the whole listing has been read, so a
+    failed refresh changes nothing.
+    """
+
+    def __init__(
+        self,
+        client: "SolusVMAPI",
+        fields: Iterable[str] = WATCHED_FIELDS,
+        ignore_keys: Iterable[str] = ("usage",),
+        per_page: int = 100,
+        prefetch: int = 2,
+    ) -> None:
+        self._client = client
+        self.fields = tuple(fields)
+        self.ignore_keys = frozenset(ignore_keys)
+        self.per_page = per_page
+        self.prefetch = prefetch
+        self.last_error: Optional[BaseException] = None
+        self._codec = get_codec()
+        self._store: dict[int, _Entry] = {}
+        self._subscribers: set[asyncio.Queue[FleetEvent]] = set()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __contains__(self, server_id: object) -> bool:
+        return server_id in self._store
+
+    def __iter__(self) -> Iterator[Server]:
+        return (entry.server for entry in self._store.values())
+
+    def get(self, server_id: int) -> Optional[Server]:
+        entry = self._store.get(server_id)
+        return entry.server if entry is not None else None
+
+    def _digest(self, data: GeneralDict) -> int:
+        """Hash of the part of a payload that counts for change detection"""
+        if self.ignore_keys:
+            data = {k: v for k, v in data.items() if k not in self.ignore_keys}
+        return hash(self._codec.dumps(data))
+
+    def _diff(self, old: Server, new: Server) -> dict[str, tuple[Any, Any]]:
+        changes = {}
+        for name in self.fields:
+            before, after = getattr(old, name), getattr(new, name)
+            if before != after:
+                changes[name] = (before, after)
+        return changes
+
+    async def refresh(self) -> list[FleetEvent]:
+        """Re-list the fleet, update the store and publish what changed"""
+        events: list[FleetEvent] = []
+        store: dict[int, _Entry] = {}
+        async for page in self._client.iter_pages(
+            "/servers", "list_servers", self.per_page, self.prefetch
+        ):
+            with shared_sections():
+                for data in page:
+                    server_id = data.get("id", 0)
+                    digest = self._digest(data)
+                    entry = self._store.get(server_id)
+                    if entry is None:
+                        server = Server(data)
+                        events.append(FleetEvent("added", server_id, server))
+                    elif entry.digest != digest:
+                        server = Server(data)
+                        events.append(
+                            FleetEvent(
+                                "changed",
+                                server_id,
+                                server,
+                                entry.server,
+                                self._diff(entry.server, server),
+                            )
+                        )
+                    else:
+                        store[server_id] = entry
+                        continue
+                    store[server_id] = _Entry(digest, server)
+
+        for server_id in self._store.keys() - store.keys():
+            entry = self._store[server_id]
+            events.append(FleetEvent("removed", server_id, previous=entry.server))
+
+        self._store = store
+        for queue in self._subscribers:
+            for event in events:
+                queue.put_nowait(event)
+        return events
+
+    async def watch(self) -> AsyncIterator[FleetEvent]:
+        """Yield every event published by later refreshes"""
+        queue: asyncio.Queue[FleetEvent] = asyncio.Queue()
+        self._subscribers.add(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._subscribers.discard(queue)
+
+    def start(self, interval: float = 30.0) -> None:
+        """Refresh in the background every `interval` seconds"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run(interval))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self, interval: float) -> None:
+        while True:
+            try:
+                await self.refresh()
+                self.last_error = None
+            except Exception as e:
+                # Keep the last good picture; the next cycle tries again.
+                self.last_error = e
+            await asyncio.sleep(interval)
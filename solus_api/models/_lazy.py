@@ -0,0 +1,91 @@
+from contextvars import ContextVar
+from typing import Any, Callable, Generic, Iterable, Optional, TypeVar, overload
+
+from ..types import GeneralDict
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class lazy(Generic[T]):
+    """Like `functools.cached_property`, but does not need an instance `__dict__`.
+
+    The built value is stored on the instance under `_<name>`, so classes using
+    `__slots__` only have to reserve that slot.
+    """
+
+    def __init__(self, func: Callable[[Any], T]) -> None:
+        self.func = func
+        self.attr = "_" + func.__name__
+        self.__doc__ = func.__doc__
+
+    @overload
+    def __get__(self, obj: None, owner: Any = None) -> "lazy[T]": ...
+
+    @overload
+    def __get__(self, obj: object, owner: Any = None) -> T: ...
+
+    def __get__(self, obj: Any, owner: Any = None) -> Any:
+        if obj is None:
+            return self
+        value = getattr(obj, self.attr, _MISSING)
+        if value is _MISSING:
+            value = self.func(obj)
+            setattr(obj, self.attr, value)
+        return value
+
+    def __set__(self, obj: Any, value: T) -> None:
+        setattr(obj, self.attr, value)
+
+
+# Sections kept by models built from the current API response, by (key, id).
+SectionPool = dict[tuple[str, Any], GeneralDict]
+
+_POOL: ContextVar[Optional[SectionPool]] = ContextVar(
+    "solus_api_sections", default=None
+)
+
+
+class shared_sections:
+    """Lets the models built inside the block share equal raw sections.
+
+    Use one pool per API response: within a response the same plan, user or
+    project id stands for the same data, so sections are matched on
+    `(key, id)` without comparing them, and a listing holds one plan dict per
+    plan rather than per server. Nothing is shared between responses.
+    """
+
+    __slots__ = ("pool", "_token")
+
+    def __init__(self, pool: Optional[SectionPool] = None) -> None:
+        self.pool: SectionPool = {} if pool is None else pool
+
+    def __enter__(self) -> SectionPool:
+        self._token = _POOL.set(self.pool)
+        return self.pool
+
+    def __exit__(self, *exc_info: Any) -> None:
+        _POOL.reset(self._token)
+
+
+def raw_sections(
+    data: GeneralDict, keys: Iterable[str], shared: Iterable[str] = ()
+) -> GeneralDict:
+    """The parts of `data` that `lazy` properties build from, in a dict of their own.
+
+    Models keep only these instead of the whole payload, and builders `pop`
+    their section so it is released once the sub-model exists. Inside
+    `shared_sections`, sections named in `shared` are replaced by the first
+    one with the same id. The caller's dict, which may be shared through a
+    cache, is left untouched; sections themselves must be treated as
+    read-only.
+    """
+    sections = {key: data[key] for key in keys if key in data}
+    pool = _POOL.get()
+    if pool is not None:
+        for key in shared:
+            section = sections.get(key)
+            if isinstance(section, dict) and section.get("id") is not None:
+                sections[key] = pool.setdefault((key, section["id"]), section)
+    return sections
@@ -3,6 +3,24 @@ from typing import Dict, Union
 
 
 class IpBlock:
+    __slots__ = (
+        "id",
+        "name",
+        "gateway",
+        "netmask",
+        "ns_1",
+        "ns_2",
+        "from_",
+        "to",
+        "type",
+        "list_type",
+        "range",
+        "subnet",
+        "reserved_ips_count",
+        "total_ips_count",
+        "reverse_dns",
+    )
+
     def __init__(self, data: GeneralDict):
         self.id: int = data.get("id", 0)
         self.name: str = data.get("name", "")
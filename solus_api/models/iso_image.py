@@ -3,6 +3,18 @@ from ..types import GeneralDict
 
 
 class IsoImage:
+    __slots__ = (
+        "name",
+        "icon",
+        "os_type",
+        "iso_url",
+        "use_tls",
+        "checksum_method",
+        "checksum",
+        "show_url_and_checksum",
+        "show_tls",
+    )
+
     def __init__(self, data: GeneralDict):
         self.name: str = data.get("name", "")
         self.icon: str = data.get("icon", "")
@@ -3,6 +3,8 @@ from typing import Dict
 
 
 class OsImage:
+    __slots__ = ("cloud_init_version", "icon", "name", "type", "url")
+
     def __init__(self, data: Dict[str, str]):
         self.cloud_init_version: str = data.get("cloud_init_version", "")
         self.icon: str = data.get("icon", "")
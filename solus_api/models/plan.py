@@ -1,9 +1,12 @@
 from typing import List, Dict, Union
 from ..types import GeneralDict
+from ._lazy import lazy
 import math
 
 
 class BackupSettings:
+    __slots__ = ("is_incremental_backup_enabled", "incremental_backups_limit")
+
     def __init__(self, data: GeneralDict):
         self.is_incremental_backup_enabled: bool = data.get(
             "is_incremental_backup_enabled", False
@@ -12,6 +15,8 @@ class BackupSettings:
 
 
 class Limit:
+    __slots__ = ("unit", "limit", "is_enabled")
+
     def __init__(self, data: GeneralDict):
         self.unit: str = data.get("unit", "")
         self.limit: Union[str, int] = data.get("limit", 0)
@@ -19,6 +24,8 @@ class Limit:
 
 
 class Params:
+    __slots__ = ("data", "vcpu", "ram", "disk")
+
     def __init__(self, data: GeneralDict):
         self.data = data
         self.vcpu: int = data.get("vcpu", "")
@@ -36,6 +43,39 @@ class Params:
 
 
 class SolusPlan:
+    __slots__ = (
+        "id",
+        "name",
+        "params",
+        "virtualization_type",
+        "storage_type",
+        "image_format",
+        "is_default",
+        "is_snapshot_available",
+        "is_snapshots_enabled",
+        "is_backup_available",
+        "backup_settings",
+        "is_additional_ips_available",
+        "is_visible",
+        "is_thin_provisioned",
+        "is_custom",
+        "position",
+        "reset_limit_policy",
+        "network_traffic_limit_type",
+        "limits",
+        "available_os_image_versions",
+        "available_locations",
+        "available_applications",
+        "tokens_per_hour",
+        "tokens_per_month",
+        "ip_tokens_per_month",
+        "ip_tokens_per_hour",
+        "iso_image_tokens_per_hour",
+        "iso_image_tokens_per_month",
+        "backup_price",
+        "_os_image_version_names",
+    )
+
     def __init__(self, data: GeneralDict):
         self.id: int = data.get("id", 0)
         self.name: str = data.get("name", "")
@@ -97,11 +137,19 @@ Availabls OSs: {", ".join([n["name".__str__()] for n in self.available_os_image_
 
         return msg
 
-    def selected_details_message(self, os_id: int) -> str:
-        os_name = ""
+    @lazy
+    def os_image_version_names(self) -> Dict[int, str]:
+        """Names of the available OS image versions by id"""
+        names: Dict[int, str] = {}
         for os in self.available_os_image_versions:
-            if int(os.get("id", "")) == os_id:
-                os_name = os.get("name")
+            try:
+                names[int(os.get("id", ""))] = os.get("name") or ""
+            except (TypeError, ValueError):
+                continue
+        return names
+
+    def selected_details_message(self, os_id: int) -> str:
+        os_name = self.os_image_version_names.get(os_id, "")
         return f"""
 {self.basic_details()}
 Selected OS: {os_name}
@@ -4,6 +4,16 @@ from .ip_block import IpBlock
 
 
 class Location:
+    __slots__ = (
+        "id",
+        "name",
+        "description",
+        "icon",
+        "is_default",
+        "is_visible",
+        "position",
+    )
+
     def __init__(self, data: GeneralDict):
         self.id: int = data.get("id", 0)
         self.name: str = data.get("name", "")
@@ -15,6 +25,18 @@ class Location:
 
 
 class Storage:
+    __slots__ = (
+        "id",
+        "name",
+        "type",
+        "mount",
+        "path",
+        "thin_pool",
+        "is_available_for_balancing",
+        "credentials",
+        "free_space",
+    )
+
     def __init__(self, data: GeneralDict):
         self.id: int = data.get("id", 0)
         self.name: Optional[str] = data.get("name", None)
@@ -30,6 +52,14 @@ class Storage:
 
 
 class Capabilities:
+    __slots__ = (
+        "kvm",
+        "vz",
+        "is_management_node",
+        "is_mem_balloon_free_page_reporting_supported",
+        "is_virtio_discard_supported",
+    )
+
     def __init__(self, data: GeneralDict):
         self.kvm: bool = data.get("kvm", False)
         self.vz: bool = data.get("vz", False)
@@ -43,6 +73,8 @@ class Capabilities:
 
 
 class Limits:
+    __slots__ = ("vm", "hdd", "ram", "vcpu")
+
     def __init__(self, data: GeneralDict):
         self.vm: Dict[str, bool] = data.get("vm", {})
         self.hdd: Dict[str, bool] = data.get("hdd", {})
@@ -51,6 +83,8 @@ class Limits:
 
 
 class Network:
+    __slots__ = ("bridges", "type", "ip_for_vpc_network")
+
     def __init__(self, data: GeneralDict):
         self.bridges: List[Dict[str, str]] = data.get("bridges", [])
         self.type: str = data.get("type", "")
@@ -58,6 +92,20 @@ class Network:
 
 
 class Settings:
+    __slots__ = (
+        "cache_path",
+        "iso_path",
+        "backup_tmp_path",
+        "vnc_proxy_port",
+        "limits",
+        "balance_strategy",
+        "network",
+        "arch",
+        "virtualization_types",
+        "vs_disk_cache_mode",
+        "concurrent_backups",
+    )
+
     def __init__(self, data: GeneralDict):
         self.cache_path: str = data.get("cache_path", "")
         self.iso_path: str = data.get("iso_path", "")
@@ -73,11 +121,30 @@ class Settings:
 
 
 class Metrics:
+    __slots__ = ("network",)
+
     def __init__(self, data: GeneralDict):
         self.network: Dict[str, bool] = data.get("network", {})
 
 
 class ComputeResource:
+    __slots__ = (
+        "id",
+        "name",
+        "host",
+        "agent_port",
+        "version",
+        "status",
+        "locations",
+        "ip_blocks",
+        "storages",
+        "capabilities",
+        "is_locked",
+        "vms_count",
+        "settings",
+        "metrics",
+    )
+
     def __init__(self, data: GeneralDict):
         self.id: int = data.get("id", 0)
         self.name: str = data.get("name", "")
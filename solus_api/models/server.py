@@ -6,9 +6,12 @@ import datetime as dt
 from .os_image import OsImage
 from .iso_image import IsoImage
 from .ip_block import IpBlock
+from ._lazy import lazy, raw_sections
 
 
 class ApplicationLoginLink:
+    __slots__ = ("type", "content")
+
     def __init__(self, data: Dict[str, str]):
         # print(data)
         self.type: str = data.get("type", "")
@@ -16,6 +19,8 @@ class ApplicationLoginLink:
 
 
 class ReverseDns:
+    __slots__ = ("id", "ip_id", "ip", "domain", "is_primary")
+
     def __init__(self, data: GeneralDict):
         self.id: int = data.get("id", 0)
         self.ip_id: int = data.get("ip_id", 0)
@@ -25,26 +30,57 @@ class ReverseDns:
 
 
 class Ip:
+    __slots__ = (
+        "_data",
+        "id",
+        "ip",
+        "is_primary",
+        "is_reverse_dns_enabled",
+        "user",
+        "server",
+        "comment",
+        "issued_for",
+        "_reverse_dns",
+        "_ip_block",
+    )
+
     def __init__(self, data: GeneralDict):
+        self._data = raw_sections(data, ("reverse_dns", "ip_block"))
         self.id: int = data.get("id", 0)
         self.ip: str = data.get("ip", "")
         self.is_primary: bool = data.get("is_primary", False)
         self.is_reverse_dns_enabled: bool = data.get("is_reverse_dns_enabled", False)
-        reverse_dns_data: GeneralDict | list[GeneralDict] = data.get("reverse_dns", {})
-        if isinstance(reverse_dns_data, dict):
-            self.reverse_dns = [ReverseDns(reverse_dns_data)]
-        else:
-            self.reverse_dns: List[ReverseDns] = [
-                ReverseDns(entry) for entry in data.get("reverse_dns", [])
-            ]
         self.user: Dict[str, str] = data.get("user", {})
         self.server: Dict[str, Union[int, str]] = data.get("server", {})
-        self.ip_block: IpBlock = IpBlock(data.get("ip_block", {}))
         self.comment: str = data.get("comment", "")
         self.issued_for: str = data.get("issued_for", "")
 
+    @lazy
+    def reverse_dns(self) -> List[ReverseDns]:
+        reverse_dns_data: GeneralDict | list[GeneralDict] = self._data.pop(
+            "reverse_dns", {}
+        )
+        if isinstance(reverse_dns_data, dict):
+            return [ReverseDns(reverse_dns_data)]
+        return [ReverseDns(entry) for entry in reverse_dns_data]
+
+    @lazy
+    def ip_block(self) -> IpBlock:
+        return IpBlock(self._data.pop("ip_block", {}))
+
 
 class Location:
+    __slots__ = (
+        "id",
+        "name",
+        "icon",
+        "description",
+        "is_default",
+        "is_visible",
+        "position",
+        "available_plans",
+    )
+
     def __init__(self, data: GeneralDict):
         self.id: int = data.get("id", 0)
         self.name: str = data.get("name", "")
@@ -59,6 +95,18 @@ class Location:
 
 
 class LimitGroup:
+    __slots__ = (
+        "id",
+        "name",
+        "vms",
+        "running_vms",
+        "additional_ips",
+        "additional_ipv6",
+        "iso_images",
+        "iso_images_size",
+        "users_count",
+    )
+
     def __init__(self, data: GeneralDict):
         self.id: int = data.get("id", 0)
         self.name: str = data.get("name", "")
@@ -72,6 +120,14 @@ class LimitGroup:
 
 
 class LimitUsage:
+    __slots__ = (
+        "servers",
+        "running_servers",
+        "additional_ips",
+        "iso_images",
+        "iso_images_size",
+    )
+
     def __init__(self, data: GeneralDict):
         self.servers: int = data.get("servers", 0)
         self.running_servers: int = data.get("running_servers", 0)
@@ -81,6 +137,20 @@ class LimitUsage:
 
 
 class Language:
+    __slots__ = (
+        "id",
+        "name",
+        "locale",
+        "country",
+        "icon",
+        "is_default",
+        "is_visible",
+        "users_count",
+        "allowed_ips",
+        "is_two_factor_auth_enabled",
+        "two_factor_auth_recovery_code_count",
+    )
+
     def __init__(self, data: GeneralDict):
         self.id: int = data.get("id", 0)
         self.name: str = data.get("name", "")
@@ -100,6 +170,8 @@ class Language:
 
 
 class Role:
+    __slots__ = ("id", "name", "is_default", "permissions")
+
     def __init__(self, data: GeneralDict):
         self.id: str = data.get("id", "")
         self.name: str = data.get("name", "")
@@ -108,22 +180,37 @@ class Role:
 
 
 class User:
+    __slots__ = (
+        "_data",
+        "id",
+        "email",
+        "billing_user_id",
+        "billing_token",
+        "email_verified_at",
+        "created_at",
+        "status",
+        "has_verified_email",
+        "allowed_ips",
+        "is_two_factor_auth_enabled",
+        "two_factor_auth_recovery_code_count",
+        "_roles",
+        "_limit_group",
+        "_limit_usage",
+        "_language",
+    )
+
     def __init__(self, data: GeneralDict):
+        self._data = raw_sections(
+            data, ("roles[]", "limit_group", "limit_usage", "language")
+        )
         self.id: str = data.get("id", "")
         self.email: str = data.get("email", "")
         self.billing_user_id: str = data.get("billing_user_id", "")
         self.billing_token: str = data.get("billing_token", "")
         self.email_verified_at: str = data.get("email_verified_at", "")
         self.created_at: Dict[str, Union[str, int]] = data.get("created_at", {})
-        self.roles: List[Role] = [Role(role) for role in data.get("roles[]", [])]
-        limit_group_data: GeneralDict = data.get("limit_group", {})
-        self.limit_group: Optional[LimitGroup] = None
-        if limit_group_data:
-            self.limit_group = LimitGroup(limit_group_data)
-        self.limit_usage: LimitUsage = LimitUsage(data.get("limit_usage", {}))
         self.status: str = data.get("status", "")
         self.has_verified_email: bool = data.get("has_verified_email", False)
-        self.language: Language = Language(data.get("language", {}))
         self.allowed_ips: List[str] = data.get("allowed_ips", [])
         self.is_two_factor_auth_enabled: bool = data.get(
             "is_two_factor_auth_enabled", False
@@ -132,8 +219,39 @@ class User:
             "two_factor_auth_recovery_code_count", 0
         )
 
+    @lazy
+    def roles(self) -> List[Role]:
+        return [Role(role) for role in self._data.pop("roles[]", [])]
+
+    @lazy
+    def limit_group(self) -> Optional[LimitGroup]:
+        limit_group_data: GeneralDict = self._data.pop("limit_group", {})
+        if limit_group_data:
+            return LimitGroup(limit_group_data)
+        return None
+
+    @lazy
+    def limit_usage(self) -> LimitUsage:
+        return LimitUsage(self._data.pop("limit_usage", {}))
+
+    @lazy
+    def language(self) -> Language:
+        return Language(self._data.pop("language", {}))
+
 
 class TokenPricing:
+    __slots__ = (
+        "unit_cost",
+        "currency_code",
+        "currency_decimals",
+        "currency_decimals_separator",
+        "currency_prefix",
+        "currency_suffix",
+        "currency_thousands_separator",
+        "taxes_inclusive",
+        "taxes",
+    )
+
     def __init__(self, data: GeneralDict):
         self.unit_cost: int = data.get("unit_cost", 0)
         self.currency_code: str = data.get("currency_code", "")
@@ -151,19 +269,41 @@ class TokenPricing:
 
 
 class Project:
+    __slots__ = (
+        "_data",
+        "id",
+        "name",
+        "description",
+        "is_default",
+        "is_owner",
+        "members",
+        "servers",
+        "_owner",
+        "_token_pricing",
+    )
+
     def __init__(self, data: GeneralDict):
+        self._data = raw_sections(data, ("owner", "token_pricing"))
         self.id: int = data.get("id", 0)
         self.name: str = data.get("name", "")
         self.description: str = data.get("description", "")
         self.is_default: bool = data.get("is_default", False)
         self.is_owner: bool = data.get("is_owner", False)
-        self.owner: User = User(data.get("owner", {}))
         self.members: int = data.get("members", 0)
         self.servers: int = data.get("servers", 0)
-        self.token_pricing: TokenPricing = TokenPricing(data.get("token_pricing", {}))
+
+    @lazy
+    def owner(self) -> User:
+        return User(self._data.pop("owner", {}))
+
+    @lazy
+    def token_pricing(self) -> TokenPricing:
+        return TokenPricing(self._data.pop("token_pricing", {}))
 
 
 class BackupSchedule:
+    __slots__ = ("type", "time", "days")
+
     def __init__(self, data: GeneralDict):
         self.type: str = data.get("type", "")
         self.time: Dict[str, int] = data.get("time", {})
@@ -171,6 +311,8 @@ class BackupSchedule:
 
 
 class BackupLimit:
+    __slots__ = ("limit", "is_enabled", "unit")
+
     def __init__(self, data: GeneralDict):
         self.limit: int = data.get("limit", 0)
         self.is_enabled: bool = data.get("is_enabled", False)
@@ -178,6 +320,8 @@ class BackupLimit:
 
 
 class BackupSettings:
+    __slots__ = ("enabled", "schedule", "limit")
+
     def __init__(self, data: GeneralDict):
         self.enabled: bool = data.get("enabled", False)
         self.schedule: BackupSchedule = BackupSchedule(data.get("schedule", {}))
@@ -185,6 +329,8 @@ class BackupSettings:
 
 
 class Usage:
+    __slots__ = ("cpu", "network", "disk")
+
     def __init__(self, data: GeneralDict):
         self.cpu: int = data.get("cpu", 0)
         self.network: Dict[str, int] = data.get("network", {})
@@ -192,6 +338,14 @@ class Usage:
 
 
 class ComputeCapability:
+    __slots__ = (
+        "kvm",
+        "vz",
+        "is_management_node",
+        "is_mem_balloon_free_page_reporting_supported",
+        "is_virtio_discard_supported",
+    )
+
     def __init__(self, data: Dict[str, bool]):
         self.kvm: bool = data.get("kvm", False)
         self.vz: bool = data.get("vz", False)
@@ -205,6 +359,8 @@ class ComputeCapability:
 
 
 class ComputeResource:
+    __slots__ = ("id", "name", "host", "capabilities")
+
     def __init__(self, data: GeneralDict):
         self.id: int = data.get("id", 0)
         self.name: str = data.get("name", "")
@@ -215,6 +371,19 @@ class ComputeResource:
 
 
 class Settings:
+    __slots__ = (
+        "disk_cache_mode",
+        "disk_driver",
+        "guest_agent_available",
+        "guest_tools_installed",
+        "mac_address",
+        "user",
+        "vnc_enabled",
+        "vnc_password",
+        "os_image",
+        "application_login_link",
+    )
+
     def __init__(self, data: GeneralDict):
         self.disk_cache_mode: str = data.get("disk_cache_mode", "")
         self.disk_driver: str = data.get("disk_driver", "")
@@ -230,59 +399,152 @@ class Settings:
         ]
 
 
+# Values of `Server.status`; the panel reports "processing" while an operation
+# runs and "failed" when it did not complete.
+ServerStatus = Literal["stopped", "started", "processing", "failed"]
+
+# Nested sections of a server payload, built into sub-models on first access.
+SERVER_SECTIONS = (
+    "plan",
+    "settings",
+    "ips",
+    "user",
+    "backup_settings",
+    "compute_resource",
+    "os_image",
+    "application_login_link",
+    "iso_image",
+    "ip_addresses",
+    "location",
+    "project",
+    "usage",
+)
+# The largest sections that many servers in one listing have in common; see
+# `shared_sections`.
+SHARED_SECTIONS = ("plan", "user", "project")
+
+
 class Server:
+    """A virtual server.
+
+    Scalar fields are read eagerly; nested sections (`plan`, `ips`, `user`,
+    `project`, ...) are built on first access from their raw sections, which
+    are the only part of the payload kept and are dropped once built.
+    """
+
+    __slots__ = (
+        "_data",
+        "id",
+        "name",
+        "description",
+        "uuid",
+        "os_type",
+        "specifications",
+        "status",
+        "real_status",
+        "virtualization_type",
+        "fqdns",
+        "boot_mode",
+        "is_suspended",
+        "is_processing",
+        "progress",
+        "next_scheduled_backup_at",
+        "ssh_keys",
+        "created_at",
+        "has_incremental_backups",
+        "vnc_url",
+        "_plan",
+        "_settings",
+        "_ips",
+        "_user",
+        "_backup_settings",
+        "_compute_resource",
+        "_os_image",
+        "_application_login_link",
+        "_iso_image",
+        "_ip_addresses",
+        "_location",
+        "_project",
+        "_usage",
+    )
+
     def __init__(self, data: GeneralDict):
+        self._data = raw_sections(data, SERVER_SECTIONS, SHARED_SECTIONS)
         self.id: int = data.get("id", 0)
         self.name: str = data.get("name", "")
         self.description: str = data.get("description", "")
         self.uuid: str = data.get("uuid", "")
         self.os_type: str = data.get("os_type", "")
         self.specifications: Dict[str, int] = data.get("specifications", {})
-        self.plan = SolusPlan(data.get("plan", {}))
-        self.settings: Settings = Settings(data.get("settings", {}))
-        self.status: Literal["stopped", "started"] = data.get("status", "")
+        self.status: ServerStatus = data.get("status", "")
         self.real_status: str = data.get("real_status", "")
         self.virtualization_type: str = data.get("virtualization_type", "")
-        self.ips: List[Ip] = [Ip(ip_data) for ip_data in data.get("ips", [])]
         self.fqdns: List[str] = data.get("fqdns", [])
         self.boot_mode: str = data.get("boot_mode", "")
         self.is_suspended: bool = data.get("is_suspended", False)
         self.is_processing: bool = data.get("is_processing", False)
         self.progress: int = data.get("progress", 0)
-        self.user: User = User(data.get("user", {}))
-        self.backup_settings: BackupSettings = BackupSettings(
-            data.get("backup_settings", {})
-        )
         self.next_scheduled_backup_at: str = data.get("next_scheduled_backup_at", "")
         self.ssh_keys: List[Dict[str, str]] = data.get("ssh_keys", [])
         self.created_at: str = data.get("created_at", "")
         self.has_incremental_backups: bool = data.get("has_incremental_backups", False)
         self.vnc_url: str = data.get("vnc_url", "")
-        self.compute_resource: ComputeResource = ComputeResource(
-            data.get("compute_resource", {})
-        )
-        self.os_image: OsImage = OsImage(data.get("os_image", {}))
-        self.application_login_link: ApplicationLoginLink = ApplicationLoginLink(
-            data.get("application_login_link", {})
-        )
-        self.iso_image: IsoImage = IsoImage(data.get("iso_image", {}))
-        self.ip_addresses: Dict[str, List[Ip]] = {
-            "ipv4": [
-                Ip(ip_data) for ip_data in data.get("ip_addresses", {}).get("ipv4", [])
-            ],
-            "ipv6": [
-                Ip(ip_data) for ip_data in data.get("ip_addresses", {}).get("ipv6", [])
-            ],
+
+    @lazy
+    def plan(self) -> SolusPlan:
+        return SolusPlan(self._data.pop("plan", {}))
+
+    @lazy
+    def settings(self) -> Settings:
+        return Settings(self._data.pop("settings", {}))
+
+    @lazy
+    def ips(self) -> List[Ip]:
+        return [Ip(ip_data) for ip_data in self._data.pop("ips", [])]
+
+    @lazy
+    def user(self) -> User:
+        return User(self._data.pop("user", {}))
+
+    @lazy
+    def backup_settings(self) -> BackupSettings:
+        return BackupSettings(self._data.pop("backup_settings", {}))
+
+    @lazy
+    def compute_resource(self) -> ComputeResource:
+        return ComputeResource(self._data.pop("compute_resource", {}))
+
+    @lazy
+    def os_image(self) -> OsImage:
+        return OsImage(self._data.pop("os_image", {}))
+
+    @lazy
+    def application_login_link(self) -> ApplicationLoginLink:
+        return ApplicationLoginLink(self._data.pop("application_login_link", {}))
+
+    @lazy
+    def iso_image(self) -> IsoImage:
+        return IsoImage(self._data.pop("iso_image", {}))
+
+    @lazy
+    def ip_addresses(self) -> Dict[str, List[Ip]]:
+        ip_addresses: GeneralDict = self._data.pop("ip_addresses", {})
+        return {
+            "ipv4": [Ip(ip_data) for ip_data in ip_addresses.get("ipv4", [])],
+            "ipv6": [Ip(ip_data) for ip_data in ip_addresses.get("ipv6", [])],
         }
-        self.location: Location = Location(data.get("location", {}))
-        self.project: Project = Project(data.get("project", {}))
-        self.backup_settings: BackupSettings = BackupSettings(
-            data.get("backup_settings", {})
-        )
-        self.usage: Usage = Usage(data.get("usage", {}))
-        self.compute_resource: ComputeResource = ComputeResource(
-            data.get("compute_resource", {})
-        )
+
+    @lazy
+    def location(self) -> Location:
+        return Location(self._data.pop("location", {}))
+
+    @lazy
+    def project(self) -> Project:
+        return Project(self._data.pop("project", {}))
+
+    @lazy
+    def usage(self) -> Usage:
+        return Usage(self._data.pop("usage", {}))
 
     def get_ip(self) -> str:
         return self.ips[0].ip
@@ -0,0 +1,356 @@
+import asyncio
+import bisect
+import math
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterable, Optional
+
+from .exceptions import SolusAPIError
+from .models.plan import Params, SolusPlan
+from .models.resouce import ComputeResource
+from .models.server import Server
+from .types import GeneralDict
+
+if TYPE_CHECKING:
+    from .client import SolusVMAPI
+
+__all__ = ["Capacity", "NoCapacity", "PlacementEngine", "Reservation"]
+
+INF = math.inf
+
+# Keys tried, in order, for each dimension of a `/usage` payload.
+USAGE_KEYS = {
+    "vcpu": ("vcpu", "cpu"),
+    "ram": ("ram", "memory"),
+    "disk": ("disk", "hdd"),
+    "vms": ("vms", "vm", "servers"),
+}
+LIMIT_KEYS = {"vcpu": "vcpu", "ram": "ram", "disk": "hdd", "vms": "vm"}
+
+
+class NoCapacity(SolusAPIError):
+    """When no compute resource can fit the requested plan"""
+
+
+@dataclass(frozen=True)
+class Capacity:
+    """vCPUs, RAM (bytes), disk (GiB) and VM slots; `inf` when unlimited"""
+
+    vcpu: float = 0
+    ram: float = 0
+    disk: float = 0
+    vms: float = 0
+
+    @classmethod
+    def of(cls, params: Params) -> "Capacity":
+        """What a server with the plan `params` takes up"""
+        return cls(params.vcpu or 0, params.ram or 0, params.disk or 0, 1)
+
+    def fits(self, need: "Capacity") -> bool:
+        return (
+            need.vcpu <= self.vcpu
+            and need.ram <= self.ram
+            and need.disk <= self.disk
+            and need.vms <= self.vms
+        )
+
+    def __add__(self, other: "Capacity") -> "Capacity":
+        return Capacity(
+            self.vcpu + other.vcpu,
+            self.ram + other.ram,
+            self.disk + other.disk,
+            self.vms + other.vms,
+        )
+
+    def __sub__(self, other: "Capacity") -> "Capacity":
+        return Capacity(
+            self.vcpu - other.vcpu,
+            self.ram - other.ram,
+            self.disk - other.disk,
+            self.vms - other.vms,
+        )
+
+
+def _used(usage: GeneralDict, dimension: str) -> Optional[float]:
+    for key in USAGE_KEYS[dimension]:
+        value = usage.get(key)
+        if isinstance(value, dict):
+            value = value.get("used")
+        if isinstance(value, (int, float)):
+            return value
+    return None
+
+
+def free_capacity(
+    resource: ComputeResource, usage: Optional[GeneralDict] = None
+) -> Capacity:
+    """Headroom of a compute resource.
+
+    Caps come from `settings.limits` (`unlimited` means no cap). What is in
+    use comes from the `/usage` payload when given, else from the limit's
+    `total`, and `vms_count` for VM slots. Disk is further bounded by the
+    largest storage available for balancing.
+    """
+    usage = (usage or {}).get("data", usage or {})
+    limits = resource.settings.limits
+    free = {}
+    for dimension, limit_key in LIMIT_KEYS.items():
+        limit: dict[str, Any] = getattr(limits, limit_key) or {}
+        if not limit or limit.get("unlimited"):
+            free[dimension] = INF
+            continue
+        used = _used(usage, dimension)
+        if used is None:
+            used = resource.vms_count if dimension == "vms" else limit.get("total", 0)
+        free[dimension] = max(0, (limit.get("limit") or 0) - (used or 0))
+
+    storages = [s for s in resource.storages if s.is_available_for_balancing]
+    if storages:
+        free["disk"] = min(free["disk"], max(s.free_space for s in storages))
+    return Capacity(**free)
+
+
+def _is_active(resource: ComputeResource) -> bool:
+    status: Any = resource.status
+    if isinstance(status, dict):
+        status = status.get("status", "")
+    return not resource.is_locked and status in ("", "active")
+
+
+class _Node:
+    __slots__ = ("resource", "free", "reserved", "locations", "key")
+
+    def __init__(self, resource: ComputeResource, free: Capacity) -> None:
+        self.resource = resource
+        self.free = free
+        self.reserved = Capacity()
+        self.locations = [location.id for location in resource.locations]
+        self.key = self._key()
+
+    @property
+    def available(self) -> Capacity:
+        return self.free - self.reserved
+
+    def _key(self) -> tuple[float, int]:
+        return (self.available.ram, self.resource.id)
+
+
+class Reservation:
+    """Capacity held on one compute resource for an in-flight create"""
+
+    __slots__ = ("resource", "need", "expires_at", "_engine")
+
+    def __init__(
+        self, engine: "PlacementEngine", resource: ComputeResource, need: Capacity
+    ) -> None:
+        self._engine = engine
+        self.resource = resource
+        self.need = need
+        self.expires_at: Optional[float] = None
+
+    def release(self) -> None:
+        """Give the capacity back, e.g. because the create failed"""
+        self._engine._release(self)
+
+    def commit(self) -> None:
+        """Keep holding the capacity until the index has caught up with the create"""
+        self.expires_at = time.monotonic() + self._engine.hold
+
+
+class PlacementEngine:
+    """Picks the compute resource for new servers from a cached capacity index.
+
+    The index is built from `list_compute_resources` plus each resource's
+    `/usage`, and rebuilt once older than `ttl` seconds. Locked and inactive
+    resources are left out. Nodes are kept sorted by available RAM per
+    location, so a placement is a bisect plus a short walk to the first node
+    whose vCPU, disk and VM slots also fit:
+
+    - `"spread"` (default) picks the node with the most RAM left, spreading a
+      batch of creates across the fleet;
+    - `"pack"` picks the node with the least RAM that still fits.
+
+    Reservations subtract a plan from its node as soon as it is picked, so
+    concurrent creates see each other. A committed reservation is held for
+    `hold` seconds, until refreshed usage includes the new server.
+    """
+
+    def __init__(
+        self,
+        client: "SolusVMAPI",
+        ttl: float = 60.0,
+        strategy: str = "spread",
+        hold: float = 120.0,
+        use_usage: bool = True,
+        per_page: int = 100,
+    ) -> None:
+        if strategy not in ("spread", "pack"):
+            raise ValueError(f"unknown placement strategy {strategy!r}")
+        self._client = client
+        self.ttl = ttl
+        self.strategy = strategy
+        self.hold = hold
+        self.use_usage = use_usage
+        self.per_page = per_page
+        self._nodes: dict[int, _Node] = {}
+        # Sorted `_Node.key`s per location id; `None` holds every node.
+        self._index: dict[Optional[int], list[tuple[float, int]]] = {}
+        self._reservations: list[Reservation] = []
+        self._built_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    @property
+    def stale(self) -> bool:
+        return self._built_at is None or time.monotonic() - self._built_at > self.ttl
+
+    async def refresh(self) -> None:
+        """Rebuild the index from the panel"""
+        resources = [
+            r
+            for r in await self._client.list_compute_resources(self.per_page)
+            if _is_active(r)
+        ]
+        usages: list[Optional[GeneralDict]] = [None] * len(resources)
+        if self.use_usage:
+            results = await asyncio.gather(
+                *(
+                    self._client.retrieve_compute_resouces_usage(r.id)
+                    for r in resources
+                ),
+                return_exceptions=True,
+            )
+            usages = [r if isinstance(r, dict) else None for r in results]
+        self.load(zip(resources, usages))
+
+    def load(
+        self, resources: Iterable[tuple[ComputeResource, Optional[GeneralDict]]]
+    ) -> None:
+        """Rebuild the index from `(resource, usage)` pairs already fetched"""
+        now = time.monotonic()
+        self._reservations = [
+            r for r in self._reservations if r.expires_at is None or r.expires_at > now
+        ]
+        self._nodes = {
+            resource.id: _Node(resource, free_capacity(resource, usage))
+            for resource, usage in resources
+        }
+        for reservation in self._reservations:
+            node = self._nodes.get(reservation.resource.id)
+            if node is not None:
+                node.reserved += reservation.need
+        self._index = {}
+        for node in self._nodes.values():
+            node.key = node._key()
+            for location in (None, *node.locations):
+                self._index.setdefault(location, []).append(node.key)
+        for keys in self._index.values():
+            keys.sort()
+        self._built_at = now
+
+    async def _ensure_index(self) -> None:
+        if not self.stale:
+            return
+        async with self._lock:
+            if self.stale:
+                await self.refresh()
+
+    def _reindex(self, node: _Node) -> None:
+        for location in (None, *node.locations):
+            keys = self._index[location]
+            del keys[bisect.bisect_left(keys, node.key)]
+        node.key = node._key()
+        for location in (None, *node.locations):
+            bisect.insort(self._index[location], node.key)
+
+    def _pick(self, need: Capacity, location_id: Optional[int]) -> Optional[_Node]:
+        keys = self._index.get(location_id, [])
+        start = bisect.bisect_left(keys, (need.ram, -INF))
+        candidates = (
+            range(len(keys) - 1, start - 1, -1)
+            if self.strategy == "spread"
+            else range(start, len(keys))
+        )
+        for i in candidates:
+            node = self._nodes[keys[i][1]]
+            if node.available.fits(need):
+                return node
+        return None
+
+    def candidate(
+        self, params: Params, location_id: Optional[int] = None
+    ) -> Optional[ComputeResource]:
+        """The node a plan would go to right now, without reserving it"""
+        node = self._pick(Capacity.of(params), location_id)
+        return node.resource if node is not None else None
+
+    async def place(
+        self, params: Params, location_id: Optional[int] = None
+    ) -> Reservation:
+        """Pick a node for `params` and reserve the capacity on it.
+
+        Call `commit()` once the server is created or `release()` if that
+        failed. Raises `NoCapacity` when nothing fits.
+        """
+        await self._ensure_index()
+        need = Capacity.of(params)
+        node = self._pick(need, location_id)
+        if node is None:
+            where = f" in location {location_id}" if location_id is not None else ""
+            raise NoCapacity(
+                f"no compute resource{where} fits vcpu={need.vcpu} "
+                f"ram={need.ram} disk={need.disk}"
+            )
+        reservation = Reservation(self, node.resource, need)
+        self._reservations.append(reservation)
+        node.reserved += need
+        self._reindex(node)
+        return reservation
+
+    def _release(self, reservation: Reservation) -> None:
+        try:
+            self._reservations.remove(reservation)
+        except ValueError:
+            return
+        node = self._nodes.get(reservation.resource.id)
+        if node is not None:
+            node.reserved -= reservation.need
+            self._reindex(node)
+
+    @asynccontextmanager
+    async def reserve(
+        self, params: Params, location_id: Optional[int] = None
+    ) -> AsyncIterator[ComputeResource]:
+        """`place` as a context: committed on success, released on error"""
+        reservation = await self.place(params, location_id)
+        try:
+            yield reservation.resource
+        except BaseException:
+            reservation.release()
+            raise
+        reservation.commit()
+
+    async def create_server(
+        self,
+        plan: SolusPlan,
+        name: str,
+        password: str,
+        os_image_version_id: int,
+        location_id: Optional[int] = None,
+        user_id: int = 1,
+        project_id: int = 1,
+    ) -> Server:
+        """`create_server_under_compute_resource` on the node picked for `plan`"""
+        async with self.reserve(plan.params, location_id) as resource:
+            return await self._client.create_server_under_compute_resource(
+                resource.id,
+                name,
+                password,
+                plan.id,
+                os_image_version_id,
+                user_id=user_id,
+                project_id=project_id,
+            )
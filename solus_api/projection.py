@@ -0,0 +1,297 @@
+import copy
+from collections import namedtuple
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Literal,
+    Optional,
+    Protocol,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
+
+from .types import GeneralDict
+
+__all__ = ["Shaped", "projector"]
+
+T = TypeVar("T")
+M = TypeVar("M", covariant=True)
+C = TypeVar("C", covariant=True)
+
+# What a listing or retrieve call returns: the model, or with `raw=True` the
+# payload dict, or with `fields=[...]` a namedtuple of the requested fields.
+Shaped = Union[T, GeneralDict, tuple[Any, ...]]
+
+
+def _getter(path: str) -> Callable[[GeneralDict], Any]:
+    keys = path.split(".")
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda data: data.get(key)
+
+    def get(data: Any) -> Any:
+        for key in keys:
+            if not isinstance(data, dict):
+                return None
+            data = data.get(key)
+        return data
+
+    return get
+
+
+@lru_cache(maxsize=128)
+def _projector(fields: tuple[str, ...]) -> Callable[[GeneralDict], tuple[Any, ...]]:
+    row = namedtuple("Row", [f.replace(".", "_") for f in fields], rename=True)  # type: ignore[misc]
+    getters = [_getter(field) for field in fields]
+
+    def project(data: GeneralDict) -> tuple[Any, ...]:
+        return row._make([get(data) for get in getters])
+
+    return project
+
+
+def projector(fields: Sequence[str]) -> Callable[[GeneralDict], tuple[Any, ...]]:
+    """Build a function picking `fields` out of a raw API payload.
+
+    Fields are payload keys, with dots for nested ones (`"plan.id"`), and
+    come back as a namedtuple whose attributes replace the dots with
+    underscores (`row.plan_id`). Missing keys are `None`.
+    """
+    return _projector(tuple(fields))
+
+
+def _raw(data: GeneralDict) -> GeneralDict:
+    return data
+
+
+def shape(
+    build: Callable[[GeneralDict], T],
+    raw: bool = False,
+    fields: Optional[Sequence[str]] = None,
+    shared: bool = False,
+) -> Callable[[GeneralDict], Shaped[T]]:
+    """The builder for a call's `raw`/`fields` options; `build` when neither is set.
+
+    With `shared`, payloads may also be held by a cache or handed to other
+    callers, so raw dicts and projected values are returned as copies.
+    """
+    if fields is not None:
+        project = projector(fields)
+        if shared:
+            return lambda data: copy.deepcopy(project(data))
+        return project
+    if raw:
+        return copy.deepcopy if shared else _raw
+    return build
+
+
+# Call signatures of the methods taking `raw`/`fields`, so that each overload
+# set is written once: the model by default, the payload dict with
+# `raw=True`, a namedtuple with `fields=[...]`.
+
+
+class ShapedGet(Protocol[M]):
+    @overload
+    def __call__(
+        self, id: int, /, *, raw: Literal[False] = False, fields: None = None
+    ) -> Awaitable[M]: ...
+
+    @overload
+    def __call__(
+        self, id: int, /, *, raw: Literal[True], fields: None = None
+    ) -> Awaitable[GeneralDict]: ...
+
+    @overload
+    def __call__(
+        self, id: int, /, *, raw: bool = False, fields: Sequence[str]
+    ) -> Awaitable[tuple[Any, ...]]: ...
+
+    @overload
+    def __call__(
+        self,
+        id: int,
+        /,
+        *,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Awaitable[Shaped[M]]: ...
+
+
+class ShapedAll(Protocol[T]):
+    @overload
+    def __call__(
+        self, *, raw: Literal[False] = False, fields: None = None
+    ) -> Awaitable[list[T]]: ...
+
+    @overload
+    def __call__(
+        self, *, raw: Literal[True], fields: None = None
+    ) -> Awaitable[list[GeneralDict]]: ...
+
+    @overload
+    def __call__(
+        self, *, raw: bool = False, fields: Sequence[str]
+    ) -> Awaitable[list[tuple[Any, ...]]]: ...
+
+    @overload
+    def __call__(
+        self, *, raw: bool = False, fields: Optional[Sequence[str]] = None
+    ) -> Awaitable[list[Shaped[T]]]: ...
+
+
+class ShapedList(Protocol[T]):
+    @overload
+    def __call__(
+        self,
+        per_page: int = ...,
+        prefetch: int = ...,
+        *,
+        raw: Literal[False] = False,
+        fields: None = None,
+    ) -> Awaitable[list[T]]: ...
+
+    @overload
+    def __call__(
+        self,
+        per_page: int = ...,
+        prefetch: int = ...,
+        *,
+        raw: Literal[True],
+        fields: None = None,
+    ) -> Awaitable[list[GeneralDict]]: ...
+
+    @overload
+    def __call__(
+        self,
+        per_page: int = ...,
+        prefetch: int = ...,
+        *,
+        raw: bool = False,
+        fields: Sequence[str],
+    ) -> Awaitable[list[tuple[Any, ...]]]: ...
+
+    @overload
+    def __call__(
+        self,
+        per_page: int = ...,
+        prefetch: int = ...,
+        *,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Awaitable[list[Shaped[T]]]: ...
+
+
+class ShapedIter(Protocol[M]):
+    @overload
+    def __call__(
+        self,
+        per_page: int = ...,
+        prefetch: int = ...,
+        *,
+        raw: Literal[False] = False,
+        fields: None = None,
+    ) -> AsyncIterator[M]: ...
+
+    @overload
+    def __call__(
+        self,
+        per_page: int = ...,
+        prefetch: int = ...,
+        *,
+        raw: Literal[True],
+        fields: None = None,
+    ) -> AsyncIterator[GeneralDict]: ...
+
+    @overload
+    def __call__(
+        self,
+        per_page: int = ...,
+        prefetch: int = ...,
+        *,
+        raw: bool = False,
+        fields: Sequence[str],
+    ) -> AsyncIterator[tuple[Any, ...]]: ...
+
+    @overload
+    def __call__(
+        self,
+        per_page: int = ...,
+        prefetch: int = ...,
+        *,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Shaped[M]]: ...
+
+
+class ShapedStream(Protocol[M]):
+    @overload
+    def __call__(
+        self, per_page: int = ..., *, raw: Literal[False] = False, fields: None = None
+    ) -> AsyncIterator[M]: ...
+
+    @overload
+    def __call__(
+        self, per_page: int = ..., *, raw: Literal[True], fields: None = None
+    ) -> AsyncIterator[GeneralDict]: ...
+
+    @overload
+    def __call__(
+        self, per_page: int = ..., *, raw: bool = False, fields: Sequence[str]
+    ) -> AsyncIterator[tuple[Any, ...]]: ...
+
+    @overload
+    def __call__(
+        self,
+        per_page: int = ...,
+        *,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Shaped[M]]: ...
+
+
+class Method(Protocol[C]):
+    """A method whose bound form has the call signature `C`"""
+
+    @overload
+    def __get__(self, obj: None, owner: Any = None) -> "Method[C]": ...
+
+    @overload
+    def __get__(self, obj: object, owner: Any = None) -> C: ...
+
+
+Typed = Callable[[Callable[..., Any]], Method[C]]
+
+
+def _typed(method: Callable[..., Any]) -> Any:
+    return method
+
+
+# Decorators giving a method one of the signatures above for `model`; they
+# return the method unchanged.
+
+
+def shaped_get(model: Type[T]) -> Typed[ShapedGet[T]]:
+    return cast(Typed[ShapedGet[T]], _typed)
+
+
+def shaped_all(model: Type[T]) -> Typed[ShapedAll[T]]:
+    return cast(Typed[ShapedAll[T]], _typed)
+
+
+def shaped_list(model: Type[T]) -> Typed[ShapedList[T]]:
+    return cast(Typed[ShapedList[T]], _typed)
+
+
+def shaped_iter(model: Type[T]) -> Typed[ShapedIter[T]]:
+    return cast(Typed[ShapedIter[T]], _typed)
+
+
+def shaped_stream(model: Type[T]) -> Typed[ShapedStream[T]]:
+    return cast(Typed[ShapedStream[T]], _typed)
@@ -0,0 +1,107 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+
+__all__ = ["Budget", "RateLimiter", "TokenBucket"]
+
+
+class TokenBucket:
+    """Allows `rate` acquisitions per second on average and up to `burst` at once"""
+
+    def __init__(self, rate: float, burst: Optional[int] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = float(burst if burst is not None else max(1, int(rate)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        # Waiters queue on the lock, so tokens are handed out in arrival order.
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+@dataclass
+class Budget:
+    """Throughput limits for one group of endpoints. `None` means unlimited."""
+
+    rate: Optional[float] = None
+    burst: Optional[int] = None
+    max_concurrency: Optional[int] = None
+
+
+class _Group:
+    def __init__(self, budget: Budget) -> None:
+        self.bucket = (
+            TokenBucket(budget.rate, budget.burst) if budget.rate is not None else None
+        )
+        self.semaphore = (
+            asyncio.Semaphore(budget.max_concurrency)
+            if budget.max_concurrency is not None
+            else None
+        )
+
+
+class RateLimiter:
+    """Client-side request budgets for `SolusVMAPI`.
+
+    Each request belongs to a group: the one named for its endpoint in
+    `endpoint_groups`, otherwise `"read"` for GETs and `"write"` for
+    everything else. Groups without a budget are unlimited. `max_in_flight`
+    caps concurrent requests across all groups.
+    """
+
+    def __init__(
+        self,
+        groups: Optional[dict[str, Budget]] = None,
+        endpoint_groups: Optional[dict[str, str]] = None,
+        max_in_flight: Optional[int] = None,
+    ) -> None:
+        self._groups = {name: _Group(b) for name, b in (groups or {}).items()}
+        self.endpoint_groups = dict(endpoint_groups or {})
+        self._in_flight = (
+            asyncio.Semaphore(max_in_flight) if max_in_flight is not None else None
+        )
+
+    def group_for(self, method: str, endpoint: str) -> str:
+        group = self.endpoint_groups.get(endpoint)
+        if group is not None:
+            return group
+        return "read" if method.upper() == "GET" else "write"
+
+    @asynccontextmanager
+    async def slot(self, method: str, endpoint: str) -> AsyncIterator[None]:
+        """Wait until the request may be sent and hold its concurrency slots"""
+        group = self._groups.get(self.group_for(method, endpoint))
+        held: list[asyncio.Semaphore] = []
+        try:
+            # Tokens first and the shared cap last, so a throttled group never
+            # holds a slot other groups could be sending with.
+            if group is not None:
+                if group.bucket is not None:
+                    await group.bucket.acquire()
+                if group.semaphore is not None:
+                    await group.semaphore.acquire()
+                    held.append(group.semaphore)
+            if self._in_flight is not None:
+                await self._in_flight.acquire()
+                held.append(self._in_flight)
+            yield
+        finally:
+            for semaphore in reversed(held):
+                semaphore.release()
@@ -0,0 +1,84 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Callable, Mapping, Optional
+
+import aiohttp
+
+from .transport import ConnectError
+
+__all__ = ["RetryPolicy", "RetryEvent"]
+
+
+@dataclass
+class RetryEvent:
+    """Passed to `RetryPolicy.on_retry` before each retry sleep"""
+
+    endpoint: str
+    method: str
+    path: str
+    attempt: int
+    delay: float
+    status: Optional[int] = None
+    error: Optional[BaseException] = None
+
+
+@dataclass
+class RetryPolicy:
+    """When and how long `SolusVMAPI` waits before resending a request.
+
+    Idempotent methods are retried on `retry_statuses`, timeouts and dropped
+    connections. Other methods (`POST` such as `create_server`) are only
+    retried when the connection could not be established, since the panel
+    cannot have seen the request then. Delays grow exponentially from
+    `base_delay` with full jitter, and a `Retry-After` header takes precedence
+    when present. `max_attempts` counts the first try; 1 disables retries.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    multiplier: float = 2.0
+    jitter: bool = True
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    idempotent_methods: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+    respect_retry_after: bool = True
+    max_retry_after: float = 120.0
+    on_retry: Optional[Callable[[RetryEvent], None]] = field(default=None, repr=False)
+
+    def is_idempotent(self, method: str) -> bool:
+        return method.upper() in self.idempotent_methods
+
+    def should_retry_status(self, method: str, status: int) -> bool:
+        return self.is_idempotent(method) and status in self.retry_statuses
+
+    def should_retry_error(self, method: str, error: BaseException) -> bool:
+        if isinstance(error, (aiohttp.ClientConnectorError, ConnectError)):
+            return True
+        return self.is_idempotent(method) and isinstance(
+            error, (aiohttp.ClientError, asyncio.TimeoutError)
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number `attempt` (1 for the first retry)"""
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def retry_after(self, headers: Mapping[str, str]) -> Optional[float]:
+        if not self.respect_retry_after:
+            return None
+        value = headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return min(max(seconds, 0.0), self.max_retry_after)
@@ -0,0 +1,148 @@
+import codecs
+import json
+import re
+from typing import Any, Iterator
+
+from .types import GeneralDict
+
+__all__ = ["DataArrayParser"]
+
+_WS = re.compile(r"[ \t\n\r]*")
+
+# Parser states
+_OBJECT_START = 0
+_FIRST_KEY = 1
+_KEY = 2
+_COLON = 3
+_VALUE = 4
+_FIRST_ITEM = 5
+_ITEM = 6
+_ITEM_SEP = 7
+_AFTER_VALUE = 8
+_DONE = 9
+
+
+class DataArrayParser:
+    """Incrementally decode a `{"data": [...], ...}` response body.
+
+    Bytes are pushed in with `feed()` as they arrive and every complete
+    element of the `data` array is returned as soon as its closing bracket
+    has been seen. Only the element currently being received is buffered.
+    Every other top-level member (`links`, `meta`, ...) is decoded into
+    `extras`, which is complete once `close()` has returned.
+    """
+
+    def __init__(self, key: str = "data") -> None:
+        self.key = key
+        self.extras: GeneralDict = {}
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._state = _OBJECT_START
+        self._member = ""
+
+    @property
+    def done(self) -> bool:
+        return self._state == _DONE
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        self._buf = self._buf[self._pos :] + self._utf8.decode(chunk)
+        self._pos = 0
+        return list(self._drain(final=False))
+
+    def close(self) -> list[Any]:
+        self._buf = self._buf[self._pos :] + self._utf8.decode(b"", final=True)
+        self._pos = 0
+        items = list(self._drain(final=True))
+        if self._state != _DONE:
+            raise json.JSONDecodeError("Truncated response body", self._buf, self._pos)
+        return items
+
+    def _decode(self, final: bool) -> tuple[bool, Any]:
+        """Decode one value at the cursor. Returns (False, None) when more input is needed."""
+        try:
+            value, end = self._decoder.raw_decode(self._buf, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return False, None
+        # A number cut by a chunk boundary decodes as its prefix ("4." -> 4), so
+        # only trust it once a delimiter has arrived after it.
+        if not final and not isinstance(value, (dict, list, str)):
+            after = _WS.match(self._buf, end).end()  # type: ignore[union-attr]
+            if after == len(self._buf) or self._buf[after] in ".eE":
+                return False, None
+        self._pos = end
+        return True, value
+
+    def _expect(self, char: str) -> None:
+        if self._buf[self._pos] != char:
+            raise json.JSONDecodeError(f"Expecting {char!r}", self._buf, self._pos)
+        self._pos += 1
+
+    def _drain(self, final: bool) -> Iterator[Any]:
+        buf = self._buf
+        while True:
+            self._pos = _WS.match(buf, self._pos).end()  # type: ignore[union-attr]
+            if self._pos >= len(buf):
+                return
+            char = buf[self._pos]
+            state = self._state
+
+            if state == _OBJECT_START:
+                self._expect("{")
+                self._state = _FIRST_KEY
+            elif state in (_FIRST_KEY, _KEY):
+                if state == _FIRST_KEY and char == "}":
+                    self._pos += 1
+                    self._state = _DONE
+                    continue
+                if char != '"':
+                    raise json.JSONDecodeError("Expecting key", buf, self._pos)
+                ok, key = self._decode(final)
+                if not ok:
+                    return
+                self._member = key
+                self._state = _COLON
+            elif state == _COLON:
+                self._expect(":")
+                self._state = _VALUE
+            elif state == _VALUE:
+                if self._member == self.key and char == "[":
+                    self._pos += 1
+                    self._state = _FIRST_ITEM
+                    continue
+                ok, value = self._decode(final)
+                if not ok:
+                    return
+                self.extras[self._member] = value
+                self._state = _AFTER_VALUE
+            elif state in (_FIRST_ITEM, _ITEM):
+                if state == _FIRST_ITEM and char == "]":
+                    self._pos += 1
+                    self._state = _AFTER_VALUE
+                    continue
+                ok, item = self._decode(final)
+                if not ok:
+                    return
+                self._state = _ITEM_SEP
+                yield item
+            elif state == _ITEM_SEP:
+                if char == "]":
+                    self._state = _AFTER_VALUE
+                else:
+                    self._expect(",")
+                    self._state = _ITEM
+                    continue
+                self._pos += 1
+            elif state == _AFTER_VALUE:
+                if char == "}":
+                    self._state = _DONE
+                else:
+                    self._expect(",")
+                    self._state = _KEY
+                    continue
+                self._pos += 1
+            else:
+                raise json.JSONDecodeError("Extra data", buf, self._pos)
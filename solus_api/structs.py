@@ -0,0 +1,177 @@
+"""Typed msgspec structs for the hot API payloads.
+
+Decoding straight into these skips both the intermediate dicts and the
+attribute-by-attribute copy done by `solus_api.models`. Field names match the
+model attributes. Importing this module requires `msgspec`.
+"""
+
+from typing import Any, Generic, Optional, TypeVar, Union
+
+import msgspec
+
+__all__ = [
+    "ComputeResourceStruct",
+    "IpStruct",
+    "PlanStruct",
+    "ServerStruct",
+]
+
+T = TypeVar("T")
+
+
+class Struct(msgspec.Struct, omit_defaults=True):
+    pass
+
+
+class ParamsStruct(Struct):
+    vcpu: Optional[int] = None
+    ram: Optional[int] = None
+    disk: Optional[int] = None
+
+
+class LimitStruct(Struct):
+    unit: Optional[str] = None
+    limit: Union[int, str, None] = None
+    is_enabled: bool = False
+
+
+class LocationStruct(Struct):
+    id: int = 0
+    name: str = ""
+    description: Optional[str] = None
+    is_default: bool = False
+    is_visible: bool = False
+
+
+class PlanStruct(Struct):
+    id: int = 0
+    name: str = ""
+    params: ParamsStruct = msgspec.field(default_factory=ParamsStruct)
+    virtualization_type: Optional[str] = None
+    storage_type: Optional[str] = None
+    image_format: Optional[str] = None
+    is_default: bool = False
+    is_visible: bool = False
+    is_custom: bool = False
+    position: Union[int, float, None] = None
+    limits: dict[str, LimitStruct] = {}
+    available_os_image_versions: list[dict[str, Any]] = []
+    available_locations: list[dict[str, Any]] = []
+    available_applications: list[dict[str, Any]] = []
+    tokens_per_hour: Union[int, float, None] = None
+    tokens_per_month: Union[int, float, None] = None
+
+
+class IpBlockStruct(Struct):
+    id: int = 0
+    name: str = ""
+    gateway: Optional[str] = None
+    netmask: Optional[str] = None
+    ns_1: Optional[str] = None
+    ns_2: Optional[str] = None
+    from_: Optional[str] = msgspec.field(default=None, name="from")
+    to: Optional[str] = None
+    type: Optional[str] = None
+    subnet: Optional[int] = None
+
+
+class ReverseDnsStruct(Struct):
+    id: int = 0
+    ip_id: int = 0
+    ip: str = ""
+    domain: str = ""
+    is_primary: bool = False
+
+
+class IpStruct(Struct):
+    id: int = 0
+    ip: str = ""
+    is_primary: bool = False
+    is_reverse_dns_enabled: bool = False
+    reverse_dns: Union[ReverseDnsStruct, list[ReverseDnsStruct], None] = None
+    ip_block: Optional[IpBlockStruct] = None
+
+
+class ComputeResourceRefStruct(Struct):
+    id: int = 0
+    name: str = ""
+    host: str = ""
+
+
+class ServerStruct(Struct):
+    id: int = 0
+    name: str = ""
+    description: Optional[str] = None
+    uuid: str = ""
+    os_type: Optional[str] = None
+    specifications: dict[str, Any] = {}
+    plan: Optional[PlanStruct] = None
+    status: str = ""
+    real_status: Optional[str] = None
+    virtualization_type: Optional[str] = None
+    ips: list[IpStruct] = []
+    fqdns: list[str] = []
+    boot_mode: Optional[str] = None
+    is_suspended: bool = False
+    is_processing: bool = False
+    progress: int = 0
+    next_scheduled_backup_at: Optional[str] = None
+    created_at: str = ""
+    vnc_url: Optional[str] = None
+    compute_resource: Optional[ComputeResourceRefStruct] = None
+    location: Optional[LocationStruct] = None
+    usage: Optional[dict[str, Any]] = None
+
+    def get_ip(self) -> str:
+        return self.ips[0].ip
+
+
+class StorageStruct(Struct):
+    id: int = 0
+    name: Optional[str] = None
+    mount: Optional[str] = None
+    path: Optional[str] = None
+    is_available_for_balancing: bool = False
+    free_space: Union[int, float] = 0
+
+
+class ComputeResourceStruct(Struct):
+    id: int = 0
+    name: str = ""
+    host: str = ""
+    agent_port: Optional[int] = None
+    version: Optional[str] = None
+    status: Union[str, dict[str, Any], None] = None
+    locations: list[LocationStruct] = []
+    ip_blocks: list[IpBlockStruct] = []
+    storages: list[StorageStruct] = []
+    is_locked: bool = False
+    vms_count: int = 0
+    settings: dict[str, Any] = {}
+
+
+class Meta(Struct):
+    last_page: Optional[int] = None
+    total: Optional[int] = None
+
+
+class Links(Struct):
+    next: Optional[str] = None
+
+
+class Page(Struct, Generic[T]):
+    data: list[T]
+    meta: Optional[Meta] = None
+    links: Optional[Links] = None
+
+
+class Item(Struct, Generic[T]):
+    data: T
+
+
+def page_decoder(struct: type[T]) -> "msgspec.json.Decoder[Page[T]]":
+    return msgspec.json.Decoder(Page[struct])  # type: ignore[valid-type]
+
+
+def item_decoder(struct: type[T]) -> "msgspec.json.Decoder[Item[T]]":
+    return msgspec.json.Decoder(Item[struct])  # type: ignore[valid-type]
@@ -0,0 +1,156 @@
+import asyncio
+import functools
+import inspect
+import threading
+from types import TracebackType
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Iterator,
+    Optional,
+    Type,
+    TypeVar,
+)
+
+from .client import SolusVMAPI
+
+__all__ = ["SolusVMClient"]
+
+T = TypeVar("T")
+
+
+async def _await(awaitable: Awaitable[T]) -> T:
+    return await awaitable
+
+
+async def _invoke(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    # Called on the loop thread, so plain methods never race with requests
+    # touching the same client state (caches, counters, ...).
+    result = fn(*args, **kwargs)
+    if inspect.isawaitable(result):
+        return await result
+    return result
+
+
+class SolusVMClient:
+    """Blocking facade over `SolusVMAPI` for synchronous code.
+
+    The async client lives on an event loop running in a background thread
+    that the facade owns, so every call goes through the same transport and
+    connection pool instead of a fresh loop and session per `asyncio.run`.
+    Any thread may call it concurrently.
+
+    Methods mirror `SolusVMAPI` and all of them run on the loop thread:
+    coroutine methods block until their result is ready (or `timeout`
+    seconds pass), async iterators such as `iter_servers` become plain
+    iterators, fetching as they are consumed, and plain methods such as
+    `invalidate_cache` are serialized with the requests in flight.
+    Call `close()` or use it as a context manager when done.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        host_url: str,
+        *,
+        timeout: Optional[float] = None,
+        **options: Any,
+    ) -> None:
+        self._setup(SolusVMAPI(api_key, host_url, **options), timeout)
+
+    @classmethod
+    def wrap(
+        cls, client: SolusVMAPI, timeout: Optional[float] = None
+    ) -> "SolusVMClient":
+        """Drive an existing async client, which must not be used elsewhere"""
+        self = cls.__new__(cls)
+        self._setup(client, timeout)
+        return self
+
+    def _setup(self, client: SolusVMAPI, timeout: Optional[float]) -> None:
+        self.client = client
+        self.timeout = timeout
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="solus-api-loop", daemon=True
+        )
+        self._thread.start()
+        self._closed = False
+
+    def __enter__(self) -> "SolusVMClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def run(self, awaitable: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """Run `awaitable` on the background loop and wait for its result"""
+        return self._submit(_await(awaitable), timeout)
+
+    def _submit(self, coro: Coroutine[Any, Any, T], timeout: Optional[float]) -> T:
+        if self._closed:
+            coro.close()
+            raise RuntimeError("SolusVMClient is closed")
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("SolusVMClient cannot be called from its own loop")
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(self.timeout if timeout is None else timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def _iterate(self, iterator: AsyncIterator[T]) -> Iterator[T]:
+        try:
+            while True:
+                try:
+                    yield self._submit(_invoke(iterator.__anext__), None)
+                except StopAsyncIteration:
+                    return
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None and not self._closed:
+                self._submit(_invoke(aclose), None)
+
+    def _blocking(self, method: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(method)
+        def call(*args: Any, **kwargs: Any) -> Any:
+            result = self._submit(_invoke(method, *args, **kwargs), None)
+            if hasattr(result, "__anext__"):
+                return self._iterate(result)
+            return result
+
+        return call
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names not set on the facade itself.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        attr = getattr(self.client, name)
+        if not callable(attr):
+            return attr
+        method = self._blocking(attr)
+        setattr(self, name, method)
+        return method
+
+    def close(self) -> None:
+        """Close the async client and stop the background loop"""
+        if self._closed:
+            return
+        try:
+            self.run(self.client.close())
+            self.run(self._loop.shutdown_asyncgens())
+        finally:
+            self._closed = True
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
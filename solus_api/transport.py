@@ -0,0 +1,455 @@
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Mapping,
+    Optional,
+    Protocol,
+)
+from urllib.parse import urlsplit
+
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from .config import PoolConfig
+
+__all__ = [
+    "AiohttpTransport",
+    "ConnectError",
+    "HttpxTransport",
+    "MemoryTransport",
+    "Request",
+    "Response",
+    "Transport",
+]
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class ConnectError(aiohttp.ClientConnectionError):
+    """No connection to the panel could be opened, so nothing was sent"""
+
+
+class Response:
+    """Status, headers and body of one HTTP response, whatever the transport.
+
+    Responses from `Transport.request` hold the whole body; those handed out
+    by `Transport.stream` read it lazily through `iter_chunks`.
+    """
+
+    __slots__ = ("status", "reason", "headers", "url", "body_time", "_body", "_chunks")
+
+    def __init__(
+        self,
+        status: int,
+        reason: str = "",
+        headers: Optional[Mapping[str, str]] = None,
+        body: Optional[bytes] = None,
+        url: str = "",
+        chunks: Optional[AsyncIterator[bytes]] = None,
+        body_time: Optional[float] = None,
+    ) -> None:
+        self.status = status
+        if not reason and status in HTTPStatus._value2member_map_:
+            reason = HTTPStatus(status).phrase
+        self.reason = reason
+        if not isinstance(headers, (CIMultiDict, CIMultiDictProxy)):
+            headers = CIMultiDict(headers or {})
+        self.headers = headers
+        self.url = url
+        # Seconds spent reading the body, when the transport can tell.
+        self.body_time = body_time
+        self._body = body if body is not None or chunks is not None else b""
+        self._chunks = chunks
+
+    @classmethod
+    def json(
+        cls,
+        data: Any,
+        status: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> "Response":
+        """A JSON response, for `MemoryTransport` handlers"""
+        return cls(
+            status,
+            headers={"Content-Type": "application/json", **(headers or {})},
+            body=json.dumps(data).encode(),
+        )
+
+    @property
+    def path(self) -> str:
+        return urlsplit(self.url).path
+
+    async def read(self) -> bytes:
+        if self._body is None:
+            self._body = b"".join([chunk async for chunk in self.iter_chunks()])
+        return self._body
+
+    async def text(self, encoding: str = "utf-8") -> str:
+        return (await self.read()).decode(encoding, errors="replace")
+
+    async def iter_chunks(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        if self._body is not None:
+            for start in range(0, len(self._body), chunk_size):
+                yield self._body[start : start + chunk_size]
+            return
+        chunks, self._chunks = self._chunks, None
+        if chunks is not None:
+            async for chunk in chunks:
+                yield chunk
+
+
+class Transport(Protocol):
+    """What `SolusVMAPI` needs from an HTTP backend.
+
+    `trace_ctx` is the client's per-attempt `RequestMetrics` (or `None`);
+    backends that can observe connection phases fill it in.
+    Failures to connect are raised as `ConnectError`, other network failures
+    as `aiohttp.ClientError` and timeouts as `asyncio.TimeoutError`, which is
+    what the retry policy understands.
+    """
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        body: Optional[bytes] = None,
+        params: Optional[Mapping[str, Any]] = None,
+        trace_ctx: Any = None,
+    ) -> Response: ...
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        params: Optional[Mapping[str, Any]] = None,
+        trace_ctx: Any = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncContextManager[Response]: ...
+
+    async def close(self) -> None: ...
+
+
+class AiohttpTransport:
+    """The default backend: an aiohttp session created on first use.
+
+    `trace_configs` are handed to the session; `Instrumentation.trace_config()`
+    is what gives the network phases of `RequestMetrics`.
+    """
+
+    def __init__(
+        self,
+        pool: Optional[PoolConfig] = None,
+        ssl: Any = None,
+        trace_configs: Iterable[aiohttp.TraceConfig] = (),
+    ) -> None:
+        self._pool = pool or PoolConfig()
+        self._ssl = ssl
+        self._trace_configs = list(trace_configs)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=self._pool.connector(ssl=self._ssl),
+                timeout=self._pool.timeout(),
+                trace_configs=self._trace_configs,
+            )
+        return self._session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        body: Optional[bytes] = None,
+        params: Optional[Mapping[str, Any]] = None,
+        trace_ctx: Any = None,
+    ) -> Response:
+        async with self._get_session().request(
+            method=method,
+            url=url,
+            headers=headers,
+            data=body,
+            params=params,
+            trace_request_ctx=trace_ctx,
+        ) as resp:
+            read_at = time.perf_counter()
+            payload = await resp.read()
+            return Response(
+                resp.status,
+                resp.reason or "",
+                resp.headers,
+                payload,
+                str(resp.url),
+                body_time=time.perf_counter() - read_at,
+            )
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        params: Optional[Mapping[str, Any]] = None,
+        trace_ctx: Any = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[Response]:
+        async with self._get_session().request(
+            method=method,
+            url=url,
+            headers=headers,
+            params=params,
+            trace_request_ctx=trace_ctx,
+        ) as resp:
+            yield Response(
+                resp.status,
+                resp.reason or "",
+                resp.headers,
+                url=str(resp.url),
+                chunks=resp.content.iter_chunked(chunk_size),
+            )
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+
+class HttpxTransport:
+    """httpx backend, speaking HTTP/2 when the panel offers it (requires httpx[http2]).
+
+    Over HTTP/2 concurrent calls are multiplexed on a single connection, so
+    bursts of small requests are not bound by the connection count or queued
+    behind one another. `pool` maps onto httpx limits and timeouts. httpx has
+    no per-host cap, but a client only talks to its panel, so the lower of
+    `limit` and `limit_per_host` caps its connections, all of which may stay
+    idle in the pool. httpx has no overall timeout either, so `total_timeout`
+    is a deadline for each request and each stream, body included.
+    """
+
+    def __init__(
+        self, pool: Optional[PoolConfig] = None, ssl: Any = True, http2: bool = True
+    ) -> None:
+        import httpx
+
+        self._httpx = httpx
+        self._pool = pool or PoolConfig()
+        self._ssl = ssl
+        self._http2 = http2
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> Any:
+        if self._client is None or self._client.is_closed:
+            pool = self._pool
+            limits = [n for n in (pool.limit, pool.limit_per_host) if n]
+            max_connections = min(limits) if limits else None
+            self._client = self._httpx.AsyncClient(
+                http2=self._http2,
+                verify=self._ssl if self._ssl is not None else True,
+                limits=self._httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                    keepalive_expiry=0 if pool.force_close else pool.keepalive_timeout,
+                ),
+                timeout=self._httpx.Timeout(
+                    None,
+                    connect=pool.sock_connect_timeout or pool.connect_timeout,
+                    read=pool.sock_read_timeout,
+                    pool=pool.connect_timeout,
+                ),
+            )
+        return self._client
+
+    @asynccontextmanager
+    async def _errors(self) -> AsyncIterator[None]:
+        httpx = self._httpx
+        try:
+            yield
+        except httpx.TimeoutException as e:
+            raise asyncio.TimeoutError(str(e)) from e
+        except httpx.ConnectError as e:
+            raise ConnectError(str(e)) from e
+        except httpx.TransportError as e:
+            raise aiohttp.ClientConnectionError(str(e)) from e
+
+    def _build(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        body: Optional[bytes],
+        params: Optional[Mapping[str, Any]],
+    ) -> Any:
+        return self._get_client().build_request(
+            method, url, headers=dict(headers), content=body, params=params
+        )
+
+    async def _send(self, request: Any) -> Response:
+        resp = await self._get_client().send(request, stream=True)
+        try:
+            read_at = time.perf_counter()
+            payload = await resp.aread()
+        finally:
+            await resp.aclose()
+        return Response(
+            resp.status_code,
+            resp.reason_phrase,
+            CIMultiDict(resp.headers.multi_items()),
+            payload,
+            str(resp.url),
+            body_time=time.perf_counter() - read_at,
+        )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        body: Optional[bytes] = None,
+        params: Optional[Mapping[str, Any]] = None,
+        trace_ctx: Any = None,
+    ) -> Response:
+        request = self._build(method, url, headers, body, params)
+        async with self._errors():
+            return await asyncio.wait_for(self._send(request), self._pool.total_timeout)
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        params: Optional[Mapping[str, Any]] = None,
+        trace_ctx: Any = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[Response]:
+        request = self._build(method, url, headers, None, params)
+        total = self._pool.total_timeout
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + total if total is not None else None
+        async with self._errors():
+            resp = await asyncio.wait_for(
+                self._get_client().send(request, stream=True), total
+            )
+            try:
+                yield Response(
+                    resp.status_code,
+                    resp.reason_phrase,
+                    CIMultiDict(resp.headers.multi_items()),
+                    url=str(resp.url),
+                    chunks=self._chunks(resp.aiter_bytes(chunk_size), deadline),
+                )
+            finally:
+                await resp.aclose()
+
+    async def _chunks(
+        self, chunks: AsyncIterator[bytes], deadline: Optional[float]
+    ) -> AsyncIterator[bytes]:
+        """`chunks`, failing with `asyncio.TimeoutError` once `deadline` passes"""
+        loop = asyncio.get_running_loop()
+        while True:
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError("stream exceeded total_timeout")
+            try:
+                async with self._errors():
+                    chunk = await asyncio.wait_for(chunks.__anext__(), remaining)
+            except StopAsyncIteration:
+                return
+            yield chunk
+
+    async def close(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+
+
+@dataclass
+class Request:
+    """A request as seen by a `MemoryTransport` handler"""
+
+    method: str
+    url: str
+    headers: Mapping[str, str]
+    body: Optional[bytes] = None
+    params: Optional[Mapping[str, Any]] = None
+
+    @property
+    def path(self) -> str:
+        return urlsplit(self.url).path
+
+    def json(self) -> Any:
+        return json.loads(self.body) if self.body else None
+
+
+Handler = Callable[[Request], Awaitable[Response]]
+
+
+class MemoryTransport:
+    """Hands every request to an async `handler` in-process, without sockets.
+
+    Streamed bodies are cut into `chunk_size` pieces so the incremental
+    decoding path is exercised the same way as over the network.
+    """
+
+    def __init__(self, handler: Handler) -> None:
+        self.handler = handler
+        self.requests = 0
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        body: Optional[bytes] = None,
+        params: Optional[Mapping[str, Any]] = None,
+        trace_ctx: Any = None,
+    ) -> Response:
+        self.requests += 1
+        resp = await self.handler(Request(method, url, headers, body, params))
+        await resp.read()
+        if not resp.url:
+            resp.url = url
+        return resp
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        params: Optional[Mapping[str, Any]] = None,
+        trace_ctx: Any = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[Response]:
+        resp = await self.request(method, url, headers, None, params, trace_ctx)
+        body = await resp.read()
+        yield Response(
+            resp.status,
+            resp.reason,
+            resp.headers,
+            url=resp.url,
+            chunks=_chunked(body, chunk_size),
+        )
+
+    async def close(self) -> None:
+        pass
+
+
+async def _chunked(body: bytes, chunk_size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(body), chunk_size):
+        yield body[start : start + chunk_size]
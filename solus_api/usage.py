@@ -0,0 +1,288 @@
+import asyncio
+import bisect
+import math
+import time
+from array import array
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Iterator, Mapping, Optional, Sequence
+
+from .bulk import run_bulk
+from .types import GeneralDict
+
+if TYPE_CHECKING:
+    from .client import SolusVMAPI
+
+__all__ = ["Rollup", "UsageCollector", "UsageSeries"]
+
+SERVER_METRICS = ("cpu", "net_in", "net_out", "disk_read", "disk_write")
+
+
+def server_metrics(usage: Optional[Mapping[str, Any]]) -> dict[str, float]:
+    """Flatten the `usage` section of a server payload into `SERVER_METRICS`"""
+    usage = usage or {}
+    cpu = usage.get("cpu", 0)
+
+    def value(section: Any, key: str) -> float:
+        entry = section.get(key) if isinstance(section, dict) else None
+        if isinstance(entry, dict):
+            entry = entry.get("value")
+        return entry if isinstance(entry, (int, float)) else math.nan
+
+    return {
+        "cpu": cpu if isinstance(cpu, (int, float)) else math.nan,
+        "net_in": value(usage.get("network"), "incoming"),
+        "net_out": value(usage.get("network"), "outgoing"),
+        "disk_read": value(usage.get("disk"), "read"),
+        "disk_write": value(usage.get("disk"), "write"),
+    }
+
+
+def flatten_numbers(data: Mapping[str, Any], prefix: str = "") -> dict[str, float]:
+    """Numeric leaves of a nested dict, keyed by dotted path"""
+    flat: dict[str, float] = {}
+    for key, value in data.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten_numbers(value, name + "."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+@dataclass
+class Rollup:
+    """Aggregate of the samples of one metric falling in `[start, start + width)`"""
+
+    start: float
+    count: int
+    min: float
+    max: float
+    avg: float
+
+
+class _Times:
+    """Timestamps of a series in logical (oldest first) order, for bisect"""
+
+    __slots__ = ("_series",)
+
+    def __init__(self, series: "UsageSeries") -> None:
+        self._series = series
+
+    def __len__(self) -> int:
+        return self._series._count
+
+    def __getitem__(self, i: int) -> float:
+        return self._series._times[self._series._slot(i)]
+
+
+class UsageSeries:
+    """Fixed-size ring buffer of samples for one server or compute resource.
+
+    Timestamps and each metric are kept in an `array('d')`, exact for byte
+    counters up to 2**53, so a series takes `capacity * 8 * (1 + len(metrics))`
+    bytes no matter how long it runs; the oldest samples are overwritten.
+    Missing values are NaN and left out of rollups. Samples must be appended
+    in time order.
+    """
+
+    __slots__ = ("capacity", "metrics", "_times", "_columns", "_head", "_count")
+
+    def __init__(self, metrics: Sequence[str], capacity: int = 1440) -> None:
+        self.capacity = capacity
+        self.metrics = tuple(metrics)
+        self._times = array("d", bytes(8 * capacity))
+        self._columns = {
+            metric: array("d", bytes(8 * capacity)) for metric in self.metrics
+        }
+        # Next slot to write; the oldest sample once the buffer is full.
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        return self._times.itemsize * self.capacity + sum(
+            column.itemsize * self.capacity for column in self._columns.values()
+        )
+
+    def _slot(self, i: int) -> int:
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        return (self._head - self._count + i) % self.capacity
+
+    def append(self, timestamp: float, values: Mapping[str, float]) -> None:
+        head = self._head
+        self._times[head] = timestamp
+        for metric, column in self._columns.items():
+            column[head] = values.get(metric, math.nan)
+        self._head = (head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def _span(self, start: Optional[float], end: Optional[float]) -> range:
+        times = _Times(self)
+        lo = 0 if start is None else bisect.bisect_left(times, start)
+        hi = self._count if end is None else bisect.bisect_left(times, end)
+        return range(lo, hi)
+
+    def window(
+        self, metric: str, start: Optional[float] = None, end: Optional[float] = None
+    ) -> list[tuple[float, float]]:
+        """`(timestamp, value)` pairs with `start <= timestamp < end`, oldest first"""
+        column = self._columns[metric]
+        result = []
+        for i in self._span(start, end):
+            slot = self._slot(i)
+            result.append((self._times[slot], column[slot]))
+        return result
+
+    def latest(self) -> Optional[tuple[float, dict[str, float]]]:
+        if not self._count:
+            return None
+        slot = self._slot(self._count - 1)
+        return self._times[slot], {
+            metric: column[slot] for metric, column in self._columns.items()
+        }
+
+    def rollup(
+        self,
+        metric: str,
+        width: float,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> list[Rollup]:
+        """Downsample one metric into `width`-second buckets aligned to the epoch"""
+        column = self._columns[metric]
+        rollups: list[Rollup] = []
+        current: Optional[Rollup] = None
+        total = 0.0
+        for i in self._span(start, end):
+            slot = self._slot(i)
+            value = column[slot]
+            if math.isnan(value):
+                continue
+            bucket = self._times[slot] // width * width
+            if current is None or current.start != bucket:
+                if current is not None:
+                    current.avg = total / current.count
+                current = Rollup(bucket, 0, math.inf, -math.inf, 0.0)
+                rollups.append(current)
+                total = 0.0
+            current.count += 1
+            current.min = min(current.min, value)
+            current.max = max(current.max, value)
+            total += value
+        if current is not None:
+            current.avg = total / current.count
+        return rollups
+
+
+class UsageCollector:
+    """Samples server and compute-resource usage into `UsageSeries`.
+
+    One round lists the servers (their `usage` comes with the listing) and
+    fetches `/usage` of every compute resource, at most `concurrency` at a
+    time. Each entity gets a ring buffer of `capacity` samples, so memory is
+    bounded by the fleet size rather than by how long the collector runs.
+    Series of servers that are gone from the listing are dropped.
+    """
+
+    def __init__(
+        self,
+        client: "SolusVMAPI",
+        capacity: int = 1440,
+        concurrency: int = 10,
+        servers: bool = True,
+        compute_resources: bool = True,
+        per_page: int = 100,
+    ) -> None:
+        self._client = client
+        self.capacity = capacity
+        self.concurrency = concurrency
+        self.collect_servers = servers
+        self.collect_compute_resources = compute_resources
+        self.per_page = per_page
+        self.servers: dict[int, UsageSeries] = {}
+        self.compute_resources: dict[int, UsageSeries] = {}
+        self.last_error: Optional[BaseException] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by all ring buffers"""
+        return sum(s.nbytes for s in self._all_series())
+
+    def _all_series(self) -> Iterator[UsageSeries]:
+        yield from self.servers.values()
+        yield from self.compute_resources.values()
+
+    async def sample(self) -> None:
+        """Take one sample of everything that is collected"""
+        timestamp = time.time()
+        if self.collect_servers:
+            await self._sample_servers(timestamp)
+        if self.collect_compute_resources:
+            await self._sample_compute_resources(timestamp)
+
+    async def _sample_servers(self, timestamp: float) -> None:
+        seen = set()
+        # Only the id and usage of each server, without building models.
+        async for server_id, usage in self._client.iter_servers(
+            self.per_page, fields=["id", "usage"]
+        ):
+            seen.add(server_id)
+            series = self.servers.get(server_id)
+            if series is None:
+                series = self.servers[server_id] = UsageSeries(
+                    SERVER_METRICS, self.capacity
+                )
+            series.append(timestamp, server_metrics(usage))
+        for server_id in self.servers.keys() - seen:
+            del self.servers[server_id]
+
+    async def _sample_compute_resources(self, timestamp: float) -> None:
+        resource_ids = [
+            r.id async for r in self._client.iter_compute_resources(self.per_page)
+        ]
+        async for result in run_bulk(
+            self._client.retrieve_compute_resouces_usage,
+            resource_ids,
+            self.concurrency,
+        ):
+            if not result.ok:
+                continue
+            rjs: GeneralDict = result.result
+            values = flatten_numbers(rjs.get("data", rjs))
+            series = self.compute_resources.get(result.server_id)
+            if series is None:
+                # The metric set is fixed by the first sample of a node.
+                series = self.compute_resources[result.server_id] = UsageSeries(
+                    sorted(values), self.capacity
+                )
+            series.append(timestamp, values)
+        for resource_id in self.compute_resources.keys() - set(resource_ids):
+            del self.compute_resources[resource_id]
+
+    def start(self, interval: float = 60.0) -> None:
+        """Sample in the background every `interval` seconds"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run(interval))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self, interval: float) -> None:
+        while True:
+            try:
+                await self.sample()
+                self.last_error = None
+            except Exception as e:
+                self.last_error = e
+            await asyncio.sleep(interval)
@@ -0,0 +1,219 @@
+import asyncio
+import time
+from typing import TYPE_CHECKING, Callable, Optional
+
+from .exceptions import NotFound, SolusAPIError
+from .models._lazy import shared_sections
+from .models.server import Server
+
+if TYPE_CHECKING:
+    from .client import SolusVMAPI
+
+__all__ = ["ServerPoller"]
+
+ServerPredicate = Callable[[Server], bool]
+
+
+class _Watch:
+    __slots__ = ("predicate", "future")
+
+    def __init__(self, predicate: ServerPredicate, future: "asyncio.Future[Server]"):
+        self.predicate = predicate
+        self.future = future
+
+
+class _Target:
+    """Polling state for one server id, shared by all of its watches"""
+
+    __slots__ = ("watches", "next_poll", "interval", "progress", "polled_at")
+
+    def __init__(self, interval: float) -> None:
+        self.watches: list[_Watch] = []
+        self.next_poll = time.monotonic()
+        self.interval = interval
+        self.progress: Optional[int] = None
+        self.polled_at = 0.0
+
+
+class ServerPoller:
+    """One background task that polls every server somebody is waiting on.
+
+    Each server gets its own polling interval: while `progress` moves, the
+    next poll is scheduled around half of the estimated time left; while it
+    stalls the interval backs off towards `max_interval`. Servers due at the
+    same time are fetched together: individually with `retrieve_server` when
+    there are few of them, or by one sweep over the `/servers` listing when
+    that takes fewer requests.
+    """
+
+    def __init__(
+        self,
+        client: "SolusVMAPI",
+        min_interval: float = 1.0,
+        max_interval: float = 15.0,
+        per_page: int = 100,
+        sweep_threshold: int = 20,
+    ) -> None:
+        self._client = client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.per_page = per_page
+        self.sweep_threshold = sweep_threshold
+        self._targets: dict[int, _Target] = {}
+        self._task: Optional[asyncio.Task[None]] = None
+        self._wakeup = asyncio.Event()
+        # Pages a full sweep took last time, the break-even against per-id polls.
+        self._sweep_pages: Optional[int] = None
+
+    async def wait(
+        self,
+        server_id: int,
+        predicate: ServerPredicate,
+        timeout: Optional[float] = None,
+    ) -> Server:
+        future: asyncio.Future[Server] = asyncio.get_running_loop().create_future()
+        watch = _Watch(predicate, future)
+        target = self._targets.get(server_id)
+        if target is None:
+            target = self._targets[server_id] = _Target(self.min_interval)
+        target.next_poll = min(target.next_poll, time.monotonic())
+        target.watches.append(watch)
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        self._wakeup.set()
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        finally:
+            self._unwatch(server_id, watch)
+
+    def _unwatch(self, server_id: int, watch: _Watch) -> None:
+        target = self._targets.get(server_id)
+        if target is None:
+            return
+        if watch in target.watches:
+            target.watches.remove(watch)
+        if not target.watches:
+            del self._targets[server_id]
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for target in self._targets.values():
+            for watch in target.watches:
+                if not watch.future.done():
+                    watch.future.cancel()
+        self._targets.clear()
+
+    async def _run(self) -> None:
+        while self._targets:
+            now = time.monotonic()
+            due = [sid for sid, t in self._targets.items() if t.next_poll <= now]
+            if not due:
+                delay = min(t.next_poll for t in self._targets.values()) - now
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            if len(due) > (self._sweep_pages or self.sweep_threshold):
+                results = await self._sweep(set(due))
+            else:
+                results = await self._retrieve(due)
+            for server_id in due:
+                self._dispatch(server_id, results.get(server_id))
+
+    async def _retrieve(self, server_ids: list[int]) -> dict[int, object]:
+        found = await asyncio.gather(
+            *(self._client.retrieve_server(sid) for sid in server_ids),
+            return_exceptions=True,
+        )
+        return dict(zip(server_ids, found))
+
+    async def _sweep(self, server_ids: set[int]) -> dict[int, object]:
+        results: dict[int, object] = {}
+        pages = 0
+        completed = True
+        try:
+            async for page in self._client.iter_pages(
+                "/servers", "list_servers", self.per_page, prefetch=2
+            ):
+                pages += 1
+                with shared_sections():
+                    for data in page:
+                        server_id = data.get("id")
+                        if server_id in server_ids:
+                            results[server_id] = Server(data)
+        except Exception as e:
+            completed = False
+            for server_id in server_ids - results.keys():
+                results[server_id] = e
+        if completed:
+            self._sweep_pages = pages
+            for server_id in server_ids - results.keys():
+                results[server_id] = NotFound(f"Server {server_id} is not listed")
+        return results
+
+    def _dispatch(self, server_id: int, result: object) -> None:
+        target = self._targets.get(server_id)
+        if target is None:
+            return
+        now = time.monotonic()
+
+        if isinstance(result, NotFound):
+            for watch in target.watches:
+                if not watch.future.done():
+                    watch.future.set_exception(result)
+            target.next_poll = now + target.interval
+            return
+        if not isinstance(result, Server):
+            # Transient failure; the client already retried, so just back off.
+            target.interval = min(target.interval * 2, self.max_interval)
+            target.next_poll = now + target.interval
+            return
+
+        for watch in target.watches:
+            if watch.future.done():
+                continue
+            if result.status == "failed":
+                watch.future.set_exception(
+                    SolusAPIError(f"Server {server_id} operation failed")
+                )
+            else:
+                try:
+                    if watch.predicate(result):
+                        watch.future.set_result(result)
+                except Exception as e:
+                    watch.future.set_exception(e)
+
+        self._schedule(target, result, now)
+
+    def _schedule(self, target: _Target, server: Server, now: float) -> None:
+        progress = server.progress or 0
+        if target.progress is not None and progress > target.progress:
+            rate = (progress - target.progress) / max(now - target.polled_at, 1e-3)
+            interval = (100 - progress) / rate / 2
+        else:
+            interval = target.interval * 1.5
+        target.interval = min(max(interval, self.min_interval), self.max_interval)
+        target.progress = progress
+        target.polled_at = now
+        target.next_poll = now + target.interval
+
+
+def is_ready(server: Server) -> bool:
+    return not server.is_processing and server.status != "processing"
+
+
+def status_in(statuses: set[str]) -> ServerPredicate:
+    def predicate(server: Server) -> bool:
+        return not server.is_processing and server.status in statuses
+
+    return predicate